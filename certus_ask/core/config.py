@@ -76,7 +76,93 @@ class Settings(BaseSettings):
 
     anonymizer_enabled: bool = Field(default=True, env="ANONYMIZER_ENABLED")
 
+    # Preprocessing pipeline pool (shared, pre-warmed pipelines per workspace index)
+    pipeline_pool_size: int = Field(default=2, env="PIPELINE_POOL_SIZE")
+    pipeline_pool_warm_on_startup: bool = Field(default=True, env="PIPELINE_POOL_WARM_ON_STARTUP")
+    pipeline_pool_max_indexes: int = Field(default=32, env="PIPELINE_POOL_MAX_INDEXES")
+
+    # Parallel folder/repository ingestion (0 workers = one per CPU core)
+    ingestion_workers: int = Field(default=0, env="INGESTION_WORKERS")
+    ingestion_batch_size: int = Field(default=256, env="INGESTION_BATCH_SIZE")
+
+    # PDF/DOCX/PPTX conversion in isolated worker processes (0 workers = convert in-process).
+    # Per file: wall-clock wait and CPU-time budget; per worker: address-space limit (0 = unlimited).
+    # The wall-clock limit also applies to each file in parallel folder/repository ingestion.
+    converter_workers: int = Field(default=2, env="CONVERTER_WORKERS")
+    converter_timeout_seconds: float = Field(default=300.0, env="CONVERTER_TIMEOUT_SECONDS")
+    converter_cpu_seconds: int = Field(default=120, env="CONVERTER_CPU_SECONDS")
+    converter_memory_mb: int = Field(default=2048, env="CONVERTER_MEMORY_MB")
+
+    # CSV/text files at least this large are read and indexed part by part (0 = never stream)
+    streaming_ingest_min_bytes: int = Field(default=32 * 1024 * 1024, env="STREAMING_INGEST_MIN_BYTES")
+    streaming_csv_rows_per_document: int = Field(default=1000, env="STREAMING_CSV_ROWS_PER_DOCUMENT")
+    streaming_text_chunk_kb: int = Field(default=1024, env="STREAMING_TEXT_CHUNK_KB")
+
+    # Web page ingestion: concurrent fetches overall and per host, per-request timeout,
+    # and pages converted/embedded/written per batch
+    web_fetch_concurrency: int = Field(default=16, env="WEB_FETCH_CONCURRENCY")
+    web_fetch_per_host: int = Field(default=4, env="WEB_FETCH_PER_HOST")
+    web_fetch_timeout_seconds: float = Field(default=30.0, env="WEB_FETCH_TIMEOUT_SECONDS")
+    web_ingest_batch_pages: int = Field(default=32, env="WEB_INGEST_BATCH_PAGES")
+
+    # S3 prefix ingestion: objects downloaded ahead of the pipeline and concurrent downloads
+    s3_prefetch_objects: int = Field(default=8, env="S3_PREFETCH_OBJECTS")
+    s3_download_workers: int = Field(default=4, env="S3_DOWNLOAD_WORKERS")
+
+    # Content-hash ledger used to skip unchanged files on re-ingestion
+    ingestion_ledger_path: str = Field(default="./data/ingestion_ledger.db", env="INGESTION_LEDGER_PATH")
+
+    # Ingestion job workers (concurrent jobs, jobs waiting before 503, finished jobs kept for polling)
+    ingestion_job_workers: int = Field(default=2, env="INGESTION_JOB_WORKERS")
+    ingestion_job_max_queued: int = Field(default=100, env="INGESTION_JOB_MAX_QUEUED")
+    ingestion_job_retention: int = Field(default=1000, env="INGESTION_JOB_RETENTION")
+
+    # Admission control for ingestion requests: concurrent requests, requests waiting for a slot,
+    # longest wait before 429, and the Retry-After sent with it (0 concurrent = no admission control)
+    ingestion_admission_max_concurrent: int = Field(default=4, env="INGESTION_ADMISSION_MAX_CONCURRENT")
+    ingestion_admission_max_queued: int = Field(default=16, env="INGESTION_ADMISSION_MAX_QUEUED")
+    ingestion_admission_max_wait_seconds: float = Field(default=30.0, env="INGESTION_ADMISSION_MAX_WAIT_SECONDS")
+    ingestion_admission_retry_after_seconds: int = Field(default=10, env="INGESTION_ADMISSION_RETRY_AFTER_SECONDS")
+
+    # Persistent chunk-embedding cache keyed by (model, chunk text hash)
+    embedding_cache_enabled: bool = Field(default=True, env="EMBEDDING_CACHE_ENABLED")
+    embedding_cache_path: str = Field(default="./data/embedding_cache.db", env="EMBEDDING_CACHE_PATH")
+    embedding_cache_max_entries: int = Field(default=1_000_000, env="EMBEDDING_CACHE_MAX_ENTRIES")
+
+    # Embedding inference backend: torch (fp32), torch-int8, onnx, onnx-int8. Non-fp32 backends are checked
+    # against the fp32 model on load and fall back to it when cosine similarity drops below the minimum.
+    embedding_backend: str = Field(default="torch", env="EMBEDDING_BACKEND")
+    embedding_onnx_int8_file: str = Field(default="onnx/model_quint8_avx2.onnx", env="EMBEDDING_ONNX_INT8_FILE")
+    embedding_backend_drift_check: bool = Field(default=True, env="EMBEDDING_BACKEND_DRIFT_CHECK")
+    embedding_backend_min_cosine: float = Field(default=0.98, env="EMBEDDING_BACKEND_MIN_COSINE")
+
+    # Length-bucketed embedding batches: padded tokens per batch and a cap on texts per batch
+    embedding_token_budget: int = Field(default=8192, env="EMBEDDING_TOKEN_BUDGET")
+    embedding_max_batch_size: int = Field(default=256, env="EMBEDDING_MAX_BATCH_SIZE")
+
+    # Batched PII analysis (spaCy nlp.pipe batch size; worker processes, 0 = analyze in-process)
+    pii_batch_size: int = Field(default=32, env="PII_BATCH_SIZE")
+    pii_workers: int = Field(default=0, env="PII_WORKERS")
+    pii_parallel_min_documents: int = Field(default=64, env="PII_PARALLEL_MIN_DOCUMENTS")
+    # Texts longer than this are analyzed as overlapping windows (characters)
+    pii_window_chars: int = Field(default=50_000, env="PII_WINDOW_CHARS")
+    pii_window_overlap: int = Field(default=500, env="PII_WINDOW_OVERLAP")
+    # Regex/checksum prefilter: skip NLP analysis of texts without PII candidates or a cued name like "by Jane Doe"
+    # (trades recall of uncued names and other NER-only entities)
+    pii_prefilter_enabled: bool = Field(default=False, env="PII_PREFILTER_ENABLED")
+
+    # Bulk-ingest mode for folder/S3 jobs: parallel_bulk writes, refresh disabled and replicas dropped meanwhile
+    opensearch_bulk_ingest: bool = Field(default=True, env="OPENSEARCH_BULK_INGEST")
+    opensearch_bulk_chunk_size: int = Field(default=500, env="OPENSEARCH_BULK_CHUNK_SIZE")
+    opensearch_bulk_threads: int = Field(default=4, env="OPENSEARCH_BULK_THREADS")
+    opensearch_bulk_drop_replicas: bool = Field(default=True, env="OPENSEARCH_BULK_DROP_REPLICAS")
+    # A tuned index is restored at startup only once every owning process's heartbeat is older than this
+    opensearch_bulk_lease_seconds: int = Field(default=300, env="OPENSEARCH_BULK_LEASE_SECONDS")
+    # Cached per-index document counts in ingestion responses, re-read from _count after this age (0 = always)
+    document_count_max_age_seconds: float = Field(default=60.0, env="DOCUMENT_COUNT_MAX_AGE_SECONDS")
+
     github_token: str | None = Field(None, env="GITHUB_TOKEN")
+    github_cache_dir: str = Field(default="./data/git-cache", env="GITHUB_CACHE_DIR")
 
     datalake_raw_bucket: str = Field(default="raw", env="DATALAKE_RAW_BUCKET")
     datalake_golden_bucket: str = Field(default="golden", env="DATALAKE_GOLDEN_BUCKET")
@@ -84,6 +170,11 @@ class Settings(BaseSettings):
         default="broker,support,marketing,video,other",
         env="DATALAKE_DEFAULT_FOLDERS",
     )
+    # Datalake transfers: objects copied in parallel; per-object multipart threshold, part size and threads
+    datalake_transfer_workers: int = Field(default=8, env="DATALAKE_TRANSFER_WORKERS")
+    datalake_multipart_threshold_mb: int = Field(default=64, env="DATALAKE_MULTIPART_THRESHOLD_MB")
+    datalake_multipart_chunk_mb: int = Field(default=16, env="DATALAKE_MULTIPART_CHUNK_MB")
+    datalake_multipart_concurrency: int = Field(default=4, env="DATALAKE_MULTIPART_CONCURRENCY")
 
     evaluation_bucket: str = Field(default="evaluation-results", env="EVALUATION_BUCKET")
 
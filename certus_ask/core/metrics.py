@@ -1,14 +1,51 @@
 """Service metrics tracking for certus_ask.
 
-Provides in-memory counters for monitoring ingestion and query activity.
+Provides in-memory counters for monitoring ingestion and query activity, and
+per-stage preprocessing pipeline timings that are also exported as
+OpenTelemetry histograms and counters.
 """
 
 from __future__ import annotations
 
+import contextvars
 import threading
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 
+from opentelemetry import metrics
+
+meter = metrics.get_meter("certus.ask.pipeline")
+
+stage_duration = meter.create_histogram(
+    "pipeline_stage_duration_seconds",
+    description="Duration of preprocessing pipeline stages",
+    unit="s",
+)
+
+stage_documents = meter.create_counter(
+    "pipeline_stage_documents_total",
+    description="Documents (or files) processed by preprocessing pipeline stages",
+    unit="1",
+)
+
+stage_bytes = meter.create_counter(
+    "pipeline_stage_bytes_total",
+    description="Bytes of content processed by preprocessing pipeline stages",
+    unit="By",
+)
+
+stage_failures = meter.create_counter(
+    "pipeline_stage_failures_total",
+    description="Failed preprocessing pipeline stage runs",
+    unit="1",
+)
+
+_stage_attributes: contextvars.ContextVar[dict[str, str] | None] = contextvars.ContextVar(
+    "stage_attributes", default=None
+)
+
 
 @dataclass
 class IngestionMetrics:
@@ -111,9 +148,98 @@ class QueryMetrics:
             }
 
 
+@contextmanager
+def stage_attributes(workspace_id: str | None = None, source: str | None = None) -> Iterator[None]:
+    """Attribute pipeline stage metrics recorded in this context to a workspace and source."""
+    token = _stage_attributes.set({"workspace_id": workspace_id or "unknown", "source": source or "unknown"})
+    try:
+        yield
+    finally:
+        _stage_attributes.reset(token)
+
+
+@dataclass
+class StageStats:
+    """Aggregated timings for a single pipeline stage."""
+
+    runs: int = 0
+    failures: int = 0
+    documents: int = 0
+    bytes: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    by_source: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "documents": self.documents,
+            "bytes": self.bytes,
+            "total_seconds": round(self.total_seconds, 3),
+            "avg_ms": round(self.total_seconds * 1000 / self.runs, 1) if self.runs else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 1),
+            "seconds_by_source": {source: round(seconds, 3) for source, seconds in self.by_source.items()},
+        }
+
+
+@dataclass
+class PipelineStageMetrics:
+    """Per-stage preprocessing timings (routing, conversion, cleaning, pii, splitting, embedding, writing)."""
+
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_stage(
+        self,
+        stage: str,
+        duration_seconds: float,
+        document_count: int = 0,
+        size_bytes: int = 0,
+        success: bool = True,
+    ) -> None:
+        """Record one run of a pipeline stage.
+
+        Args:
+            stage: Stage name (e.g., "conversion", "embedding")
+            duration_seconds: Time spent in the stage
+            document_count: Documents (or files, for routing) the stage processed
+            size_bytes: Content size the stage processed
+            success: Whether the stage run succeeded
+        """
+        attributes = {"stage": stage, **(_stage_attributes.get() or {})}
+        stage_duration.record(duration_seconds, attributes)
+        if document_count:
+            stage_documents.add(document_count, attributes)
+        if size_bytes:
+            stage_bytes.add(size_bytes, attributes)
+        if not success:
+            stage_failures.add(1, attributes)
+
+        source = attributes.get("source", "unknown")
+        with self._lock:
+            stats = self.stages.get(stage)
+            if stats is None:
+                stats = self.stages[stage] = StageStats()
+            stats.runs += 1
+            stats.failures += 0 if success else 1
+            stats.documents += document_count
+            stats.bytes += size_bytes
+            stats.total_seconds += duration_seconds
+            stats.max_seconds = max(stats.max_seconds, duration_seconds)
+            stats.by_source[source] = stats.by_source.get(source, 0.0) + duration_seconds
+
+    def to_dict(self) -> dict:
+        """Export stage summaries, slowest total first."""
+        with self._lock:
+            ordered = sorted(self.stages.items(), key=lambda item: item[1].total_seconds, reverse=True)
+            return {stage: stats.to_dict() for stage, stats in ordered}
+
+
 # Global metrics instances
 _ingestion_metrics = IngestionMetrics()
 _query_metrics = QueryMetrics()
+_pipeline_stage_metrics = PipelineStageMetrics()
 _service_start_time = time.time()
 
 
@@ -127,6 +253,11 @@ def get_query_metrics() -> QueryMetrics:
     return _query_metrics
 
 
+def get_pipeline_stage_metrics() -> PipelineStageMetrics:
+    """Get global pipeline stage metrics instance."""
+    return _pipeline_stage_metrics
+
+
 def get_service_uptime() -> float:
     """Get service uptime in seconds."""
     return time.time() - _service_start_time
@@ -10,6 +10,43 @@ from certus_ask.core.config_validation import ConfigurationValidator
 from certus_ask.core.logging import configure_logging
 
 
+async def _warm_pipeline_pool() -> None:
+    """Pre-build and warm the default preprocessing pipelines before serving traffic."""
+    import asyncio
+
+    from certus_ask.pipelines.pipeline_pool import get_pipeline_pool
+    from certus_ask.services.opensearch import get_document_store
+
+    logger = structlog.get_logger(__name__)
+    try:
+        await asyncio.to_thread(get_pipeline_pool().warm_up, get_document_store())
+    except Exception as exc:
+        # Requests still build pipelines lazily, so a failed warm-up must not block startup.
+        logger.warning("pipeline_pool.startup_warm_up_failed", error=str(exc))
+
+
+async def _restore_interrupted_bulk_mode() -> None:
+    """Restore index settings left tuned by bulk-ingest jobs that never finished."""
+    import asyncio
+
+    from certus_ask.services.opensearch import get_document_store
+    from certus_ask.services.storage.bulk_indexing import restore_interrupted_bulk_mode
+
+    logger = structlog.get_logger(__name__)
+    try:
+        await asyncio.to_thread(restore_interrupted_bulk_mode, get_document_store())
+    except Exception as exc:
+        # OpenSearch may not be up yet; the saved settings stay in the index mapping for the next start.
+        logger.warning("opensearch.bulk_mode_recovery_failed", error=str(exc))
+
+
+def _stop_ingestion_jobs() -> None:
+    """Stop accepting ingestion jobs and cancel queued ones on shutdown."""
+    from certus_ask.services.ingestion.jobs import get_ingestion_job_manager
+
+    get_ingestion_job_manager().shutdown(wait=False)
+
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -169,6 +206,11 @@ def create_app() -> FastAPI:
             install_command=Features.install_command("documents"),
         )
 
+    if settings.pipeline_pool_warm_on_startup:
+        app.add_event_handler("startup", _warm_pipeline_pool)
+    app.add_event_handler("startup", _restore_interrupted_bulk_mode)
+    app.add_event_handler("shutdown", _stop_ingestion_jobs)
+
     if Features.EVALUATION():
         from certus_ask.routers import evaluation
 
@@ -9,6 +9,7 @@ from haystack.components.writers import DocumentWriter
 from haystack.document_stores.types import DuplicatePolicy
 
 from certus_ask.pipelines.metadata import enrich_documents_with_metadata
+from certus_ask.services.document_counts import get_document_counts
 
 logger = structlog.get_logger(__name__)
 
@@ -60,6 +61,7 @@ class LoggingDocumentWriter:
             raise
 
         written_count = result.get("documents_written", 0)
+        get_document_counts().add(self.document_store, written_count)
         duration_ms = int((time.time() - start_time) * 1000)
         workspace_id = self.metadata_context.get("workspace_id", "default")
         index_name = f"ask_certus_{workspace_id}"
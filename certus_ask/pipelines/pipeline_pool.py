@@ -0,0 +1,252 @@
+"""Shared pool of pre-built preprocessing pipelines.
+
+Building a preprocessing pipeline instantiates every converter, the Presidio
+anonymizer and a sentence-transformers embedder. Doing that per request makes
+single-file uploads pay for a full rebuild plus a model reload, so pipelines
+are pooled per document store index and reused across requests. Stores
+without an index name are never pooled, and the least recently used indexes
+are evicted once ``settings.pipeline_pool_max_indexes`` is exceeded.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+import structlog
+
+from certus_ask.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+def _default_factory(document_store: Any) -> Any:
+    # Resolved at call time so the factory can be patched on the preprocessing module.
+    from certus_ask.pipelines import preprocessing
+
+    return preprocessing.create_preprocessing_pipeline(document_store)
+
+
+def pool_key(document_store: Any) -> str | None:
+    """Return the pool key for a document store, or None when it cannot be pooled.
+
+    Workspace stores are created per request, so pipelines are keyed by the
+    index name rather than by store identity. Stores without an index name are
+    not pooled: keying them by ``id()`` would grow the pool per request and
+    could hand a reused id a pipeline bound to a dead store.
+    """
+    index = getattr(document_store, "_index", None)
+    if isinstance(index, str) and index:
+        return index
+    return None
+
+
+@dataclass
+class _PoolEntry:
+    """Idle pipelines and counters for a single pool key."""
+
+    idle: list[Any] = field(default_factory=list)
+    in_use: int = 0
+    built: int = 0
+    hits: int = 0
+    misses: int = 0
+    warmed: bool = False
+    last_build_ms: int = 0
+    last_error: str | None = None
+
+
+class PreprocessingPipelinePool:
+    """Thread-safe pool of preprocessing pipelines keyed by document store index.
+
+    Pipelines are checked out with :meth:`acquire` and returned when the
+    context exits. When no idle pipeline is available a new one is built, so
+    callers never block; at most ``size`` idle pipelines are retained per key
+    and at most ``max_indexes`` keys are kept, evicting the least recently
+    used keys that have no pipelines checked out.
+    """
+
+    def __init__(
+        self,
+        size: int | None = None,
+        factory: Callable[[Any], Any] | None = None,
+        max_indexes: int | None = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            size: Maximum idle pipelines kept per key (default: settings.pipeline_pool_size)
+            factory: Callable building a pipeline for a document store
+            max_indexes: Maximum pooled index names (default: settings.pipeline_pool_max_indexes)
+        """
+        self.size = max(1, size if size is not None else settings.pipeline_pool_size)
+        self.max_indexes = max(1, max_indexes if max_indexes is not None else settings.pipeline_pool_max_indexes)
+        self._factory = factory or _default_factory
+        self._entries: OrderedDict[str, _PoolEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _entry(self, key: str) -> _PoolEntry:
+        """Return the entry for ``key`` (creating it), marking it most recently used. Caller holds the lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _PoolEntry()
+            self._evict(keep=key)
+        else:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used keys with nothing checked out until within ``max_indexes``."""
+        excess = len(self._entries) - self.max_indexes
+        for key in list(self._entries):
+            if excess <= 0:
+                break
+            if key != keep and self._entries[key].in_use == 0:
+                del self._entries[key]
+                excess -= 1
+                logger.info(event="pipeline_pool.evicted", pool_key=key)
+
+    def _build(self, key: str | None, document_store: Any) -> Any:
+        start_time = time.time()
+        try:
+            pipeline = self._factory(document_store)
+        except Exception as exc:
+            if key is not None:
+                with self._lock:
+                    self._entry(key).last_error = str(exc)
+            logger.error(
+                event="pipeline_pool.build_failed",
+                pool_key=key,
+                error=str(exc),
+                exc_info=True,
+            )
+            raise
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        if key is not None:
+            with self._lock:
+                entry = self._entry(key)
+                entry.built += 1
+                entry.last_build_ms = duration_ms
+                entry.last_error = None
+
+        logger.info(
+            event="pipeline_pool.pipeline_built",
+            pool_key=key,
+            duration_ms=duration_ms,
+        )
+        return pipeline
+
+    @contextmanager
+    def acquire(self, document_store: Any) -> Iterator[Any]:
+        """Check out a pipeline for the given document store.
+
+        Args:
+            document_store: Document store the pipeline writes to
+
+        Yields:
+            A preprocessing pipeline that is returned to the pool afterwards
+            (or discarded when the store has no index name)
+        """
+        key = pool_key(document_store)
+        if key is None:
+            yield self._build(None, document_store)
+            return
+
+        with self._lock:
+            entry = self._entry(key)
+            pipeline = entry.idle.pop() if entry.idle else None
+            if pipeline is not None:
+                entry.hits += 1
+            else:
+                entry.misses += 1
+            entry.in_use += 1
+
+        try:
+            if pipeline is None:
+                pipeline = self._build(key, document_store)
+            yield pipeline
+        finally:
+            with self._lock:
+                entry = self._entry(key)
+                entry.in_use -= 1
+                if pipeline is not None and len(entry.idle) < self.size:
+                    entry.idle.append(pipeline)
+
+    def warm_up(self, document_store: Any) -> int:
+        """Pre-build and warm pipelines for a document store.
+
+        Fills the pool for the store's key up to ``size`` pipelines and loads
+        component resources (embedding models) so the first request is fast.
+
+        Args:
+            document_store: Document store to warm pipelines for
+
+        Returns:
+            Number of pipelines built during warm-up
+        """
+        key = pool_key(document_store)
+        if key is None:
+            logger.info(event="pipeline_pool.warm_up_skipped", reason="store_has_no_index")
+            return 0
+
+        with self._lock:
+            missing = self.size - len(self._entry(key).idle)
+
+        logger.info(event="pipeline_pool.warm_up_start", pool_key=key, pipelines=max(missing, 0))
+
+        built: list[Any] = []
+        for _ in range(max(missing, 0)):
+            pipeline = self._build(key, document_store)
+            warm_up = getattr(pipeline, "warm_up", None)
+            if callable(warm_up):
+                warm_up()
+            built.append(pipeline)
+
+        with self._lock:
+            entry = self._entry(key)
+            entry.idle.extend(built[: self.size - len(entry.idle)])
+            entry.warmed = True
+
+        logger.info(event="pipeline_pool.warm_up_complete", pool_key=key, pipelines=len(built))
+        return len(built)
+
+    def health(self) -> dict[str, Any]:
+        """Return a snapshot of pool state for health reporting."""
+        with self._lock:
+            return {
+                "size": self.size,
+                "max_indexes": self.max_indexes,
+                "pools": {
+                    key: {
+                        "idle": len(entry.idle),
+                        "in_use": entry.in_use,
+                        "built": entry.built,
+                        "hits": entry.hits,
+                        "misses": entry.misses,
+                        "warmed": entry.warmed,
+                        "last_build_ms": entry.last_build_ms,
+                        "last_error": entry.last_error,
+                    }
+                    for key, entry in self._entries.items()
+                },
+            }
+
+    def clear(self) -> None:
+        """Drop all idle pipelines and counters."""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def get_pipeline_pool() -> PreprocessingPipelinePool:
+    """Get the process-wide preprocessing pipeline pool."""
+    return PreprocessingPipelinePool()
+
+
+__all__ = ["PreprocessingPipelinePool", "get_pipeline_pool", "pool_key"]
@@ -1,4 +1,7 @@
+import contextlib
+import sqlite3
 import time
+from pathlib import Path
 from typing import Any
 
 import structlog
@@ -12,12 +15,13 @@ from haystack.components.converters import (
     PyPDFToDocument,
     TextFileToDocument,
 )
-from haystack.components.embedders import SentenceTransformersDocumentEmbedder as HaystackDocumentEmbedder
+from haystack.components.converters.utils import normalize_metadata
 from haystack.components.joiners import DocumentJoiner
 from haystack.components.preprocessors import DocumentCleaner as HaystackDocumentCleaner
 from haystack.components.preprocessors import DocumentSplitter as HaystackDocumentSplitter
 from haystack.components.routers import FileTypeRouter
 from haystack.components.writers import DocumentWriter
+from haystack.dataclasses import ByteStream
 from haystack.document_stores.types import DuplicatePolicy
 
 try:
@@ -26,13 +30,42 @@ except ModuleNotFoundError:  # pragma: no cover - compatibility fallback
     from haystack_integrations.document_stores.opensearch import OpenSearchDocumentStore  # type: ignore[import]
 
 from certus_ask.core.config import settings
+from certus_ask.core.metrics import get_pipeline_stage_metrics
 from certus_ask.pipelines.metadata import enrich_documents_with_metadata
+from certus_ask.services.document_counts import get_document_counts
+from certus_ask.services.embedding_cache import get_embedding_cache, hash_text
+from certus_ask.services.embedding_models import (
+    DEFAULT_EMBEDDING_MODEL,
+    embedding_cache_key,
+    get_embedding_model_registry,
+)
+from certus_ask.services.pii_analysis import analyze_texts
 from certus_ask.services.privacy_logger import PrivacyLogger
+from certus_ask.services.storage.bulk_indexing import bulk_mode_active, bulk_write_documents
 from certus_integrity.services import get_analyzer, get_anonymizer
 
 logger = structlog.get_logger(__name__)
 
 
+def _record_stage(
+    stage: str,
+    start_time: float,
+    documents: list[Document] | None = None,
+    success: bool = True,
+    document_count: int | None = None,
+    size_bytes: int | None = None,
+) -> None:
+    """Record a stage's duration, document count and content size for /v1/stats and OpenTelemetry."""
+    documents = documents or []
+    if document_count is None:
+        document_count = len(documents)
+    if size_bytes is None:
+        size_bytes = sum(len(doc.content or "") for doc in documents)
+    get_pipeline_stage_metrics().record_stage(
+        stage, time.time() - start_time, document_count=document_count, size_bytes=size_bytes, success=success
+    )
+
+
 @component
 class PresidioAnonymizer:
     """
@@ -112,27 +145,37 @@ class PresidioAnonymizer:
             >>> len(result["quarantined"])  # PII doc quarantined
             1
         """
+        start_time = time.time()
         analyzer = get_analyzer()
         anonymizer = get_anonymizer()
 
         anonymized_documents = []
         quarantined_documents = []
 
-        for doc in documents:
-            doc_id = doc.meta.get("id", "unknown")
-            doc_name = doc.meta.get("file_path", doc.meta.get("name", "unknown"))
+        logger.info(
+            event="document.privacy_scan_start",
+            document_count=len(documents),
+            content_length=sum(len(doc.content) for doc in documents),
+        )
 
-            logger.info(
-                event="document.privacy_scan_start",
-                doc_id=doc_id,
-                doc_name=doc_name,
-                content_length=len(doc.content),
+        # Analyze the whole batch at once (spaCy nlp.pipe, optionally across worker processes).
+        try:
+            batch_results = analyze_texts(analyzer, [doc.content for doc in documents])
+        except Exception as exc:
+            logger.error(
+                event="document.privacy_scan_failed",
+                document_count=len(documents),
+                error=str(exc),
+                exc_info=True,
             )
+            _record_stage("pii", start_time, documents, success=False)
+            raise
 
-            try:
-                # Analyze document for PII
-                analysis_results = analyzer.analyze(text=doc.content, entities=[], language="en")
+        for doc, analysis_results in zip(documents, batch_results):
+            doc_id = doc.meta.get("id", "unknown")
+            doc_name = doc.meta.get("file_path", doc.meta.get("name", "unknown"))
 
+            try:
                 if analysis_results:
                     # PII detected - log incident
                     if self.strict_mode:
@@ -194,6 +237,7 @@ class PresidioAnonymizer:
                     error=str(exc),
                     exc_info=True,
                 )
+                _record_stage("pii", start_time, documents, success=False)
                 raise
 
         logger.info(
@@ -203,6 +247,7 @@ class PresidioAnonymizer:
             quarantined_documents=len(quarantined_documents),
         )
 
+        _record_stage("pii", start_time, documents)
         return {"documents": anonymized_documents, "quarantined": quarantined_documents}
 
 
@@ -235,6 +280,7 @@ class LoggingDocumentCleaner:
                 error=str(exc),
                 exc_info=True,
             )
+            _record_stage("cleaning", start_time, documents, success=False)
             raise
         else:
             cleaned_docs = result.get("documents", [])
@@ -250,6 +296,7 @@ class LoggingDocumentCleaner:
                 duration_ms=duration_ms,
                 step="cleaning",
             )
+            _record_stage("cleaning", start_time, document_count=len(documents), size_bytes=raw_size)
 
             return result
 
@@ -291,6 +338,7 @@ class LoggingDocumentSplitter:
                 error=str(exc),
                 exc_info=True,
             )
+            _record_stage("splitting", start_time, documents, success=False)
             raise
         else:
             chunks = result.get("documents", [])
@@ -304,22 +352,73 @@ class LoggingDocumentSplitter:
                 avg_chunk_size=avg_chunk_size,
                 duration_ms=duration_ms,
             )
+            _record_stage("splitting", start_time, document_count=len(chunks), size_bytes=total_size)
 
             return result
 
 
+def _estimate_tokens(text: str, max_tokens: int) -> int:
+    """Cheap token-count estimate (~4 characters per wordpiece plus [CLS]/[SEP]), capped at the model limit."""
+    return min(max_tokens, len(text) // 4 + 2)
+
+
+def _length_bucketed_batches(
+    token_counts: list[int],
+    token_budget: int,
+    min_batch_size: int,
+    max_batch_size: int,
+) -> list[list[int]]:
+    """Group text indices into batches of similar length under a padded-token budget.
+
+    Texts are sorted by length so each batch pads to a similar size; a batch
+    grows until ``len(batch) * longest_in_batch`` would exceed ``token_budget``
+    (but always holds at least ``min_batch_size`` texts and at most ``max_batch_size``).
+
+    Returns:
+        Lists of indices into ``token_counts``
+    """
+    batches: list[list[int]] = []
+    batch: list[int] = []
+    for index in sorted(range(len(token_counts)), key=token_counts.__getitem__):
+        # Sorted ascending, so the newcomer is the longest text in the batch.
+        padded = (len(batch) + 1) * token_counts[index]
+        if batch and (len(batch) >= max_batch_size or (padded > token_budget and len(batch) >= min_batch_size)):
+            batches.append(batch)
+            batch = []
+        batch.append(index)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 @component
 class LoggingDocumentEmbedder:
-    """DocumentEmbedder wrapper that logs embedding events."""
+    """Document embedder backed by the shared model registry, with logging."""
 
-    def __init__(self, model: str):
-        self.embedder = HaystackDocumentEmbedder(model=model)
+    def __init__(
+        self,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        batch_size: int = 32,
+        token_budget: int | None = None,
+        max_batch_size: int | None = None,
+    ):
+        """Initialize the embedder.
+
+        Args:
+            model: sentence-transformers model identifier
+            batch_size: Minimum texts per batch (reached by the longest chunks)
+            token_budget: Padded tokens per batch (default: settings.embedding_token_budget)
+            max_batch_size: Maximum texts per batch (default: settings.embedding_max_batch_size)
+        """
         self.model = model
-        self._is_warm = False
+        self.batch_size = batch_size
+        self.token_budget = token_budget or settings.embedding_token_budget
+        self.max_batch_size = max(batch_size, max_batch_size or settings.embedding_max_batch_size)
+        self._embedding_model = None
 
     def _ensure_model_ready(self) -> None:
-        """Load embedding model once before processing documents."""
-        if self._is_warm:
+        """Fetch the shared embedding model once before processing documents."""
+        if self._embedding_model is not None:
             return
 
         logger.info(
@@ -327,7 +426,7 @@ class LoggingDocumentEmbedder:
             model=self.model,
         )
         try:
-            self.embedder.warm_up()
+            self._embedding_model = get_embedding_model_registry().get(self.model)
         except Exception as exc:  # pragma: no cover - external dependency init
             logger.error(
                 event="document.embedding_model_warm_up_failed",
@@ -337,17 +436,45 @@ class LoggingDocumentEmbedder:
             )
             raise
         else:
-            self._is_warm = True
             logger.info(
                 event="document.embedding_model_ready",
                 model=self.model,
             )
 
-    @component.output_types(documents=list[Document])
-    def run(self, documents: list[Document]) -> dict[str, list[Document]]:
-        """Embed documents with logging."""
+    def warm_up(self) -> None:
+        """Load the embedding model (called by Pipeline.warm_up)."""
         self._ensure_model_ready()
 
+    def _encode_bucketed(self, texts: list[str]) -> list[list[float]]:
+        """Encode texts in length-bucketed, token-budgeted batches and return vectors in input order."""
+        max_tokens = getattr(self._embedding_model, "max_seq_length", None)
+        if not isinstance(max_tokens, int) or max_tokens <= 0:
+            max_tokens = 512
+        token_counts = [_estimate_tokens(text, max_tokens) for text in texts]
+        batches = _length_bucketed_batches(token_counts, self.token_budget, self.batch_size, self.max_batch_size)
+
+        vectors: list[list[float]] = [[] for _ in texts]
+        for batch in batches:
+            embeddings = self._embedding_model.encode(
+                [texts[index] for index in batch],
+                batch_size=len(batch),
+                show_progress_bar=False,
+            )
+            for index, embedding in zip(batch, embeddings):
+                vectors[index] = embedding.tolist()
+
+        logger.debug(
+            event="document.embedding_batches",
+            text_count=len(texts),
+            batch_count=len(batches),
+            padded_tokens=sum(len(batch) * max(token_counts[index] for index in batch) for batch in batches),
+            tokens=sum(token_counts),
+        )
+        return vectors
+
+    @component.output_types(documents=list[Document])
+    def run(self, documents: list[Document]) -> dict[str, list[Document]]:
+        """Embed documents with logging, reusing cached embeddings of identical chunk text."""
         logger.info(
             event="document.embedding_start",
             document_count=len(documents),
@@ -355,9 +482,37 @@ class LoggingDocumentEmbedder:
         )
 
         start_time = time.time()
+        cache = get_embedding_cache()
+        texts = [doc.content or "" for doc in documents]
+        text_hashes = [hash_text(text) for text in texts]
+        vectors: dict[str, list[float]] = {}
+        cache_hits = 0
 
         try:
-            result = self.embedder.run(documents=documents)
+            if cache is not None:
+                if settings.embedding_backend != "torch":
+                    # A drifting backend falls back to fp32 on load, and the loaded backend picks the cache key.
+                    self._ensure_model_ready()
+                cache_key = embedding_cache_key(self.model)
+                try:
+                    vectors = cache.get_many(cache_key, text_hashes)
+                except sqlite3.Error as exc:
+                    # The cache file is shared between workers and may be locked; embed without it.
+                    logger.warning(event="embedding_cache.read_failed", error=str(exc))
+                cache_hits = sum(1 for text_hash in text_hashes if text_hash in vectors)
+
+            # Encode each distinct uncached text once (repeated chunks share a vector).
+            missing = {text_hash: text for text_hash, text in zip(text_hashes, texts) if text_hash not in vectors}
+            if missing:
+                self._ensure_model_ready()
+                embeddings = self._encode_bucketed(list(missing.values()))
+                computed = dict(zip(missing, embeddings))
+                if cache is not None:
+                    try:
+                        cache.put_many(cache_key, computed)
+                    except sqlite3.Error as exc:
+                        logger.warning(event="embedding_cache.write_failed", error=str(exc))
+                vectors.update(computed)
         except Exception as exc:
             logger.error(
                 event="document.embedding_failed",
@@ -365,25 +520,34 @@ class LoggingDocumentEmbedder:
                 error=str(exc),
                 exc_info=True,
             )
+            _record_stage("embedding", start_time, documents, success=False)
             raise
         else:
-            embedded_docs = result.get("documents", [])
+            for doc, text_hash in zip(documents, text_hashes):
+                doc.embedding = vectors[text_hash]
 
             duration_ms = int((time.time() - start_time) * 1000)
 
             logger.info(
                 event="document.embedding_complete",
-                embedding_count=len(embedded_docs),
+                embedding_count=len(documents),
+                encoded_count=len(missing),
+                cache_hits=cache_hits,
                 duration_ms=duration_ms,
                 model=self.model,
             )
+            _record_stage("embedding", start_time, documents)
 
-            return result
+            return {"documents": documents}
 
 
 @component
 class LoggingDocumentWriter:
-    """DocumentWriter wrapper that logs indexing events."""
+    """DocumentWriter wrapper that logs indexing events.
+
+    Inside ``bulk_ingest_mode`` documents are written with parallel bulk
+    requests that do not wait for an index refresh.
+    """
 
     def __init__(self, document_store, policy=DuplicatePolicy.SKIP):
         self.writer = DocumentWriter(document_store, policy=policy)
@@ -411,9 +575,13 @@ class LoggingDocumentWriter:
         )
 
         start_time = time.time()
+        bulk = bulk_mode_active(self.document_store)
 
         try:
-            result = self.writer.run(documents=documents)
+            if bulk:
+                result = {"documents_written": bulk_write_documents(self.document_store, documents, self.policy)}
+            else:
+                result = self.writer.run(documents=documents)
         except Exception as exc:
             logger.error(
                 event="document.indexing_failed",
@@ -421,9 +589,11 @@ class LoggingDocumentWriter:
                 error=str(exc),
                 exc_info=True,
             )
+            _record_stage("writing", start_time, documents, success=False)
             raise
         else:
             written_count = result.get("documents_written", 0)
+            get_document_counts().add(self.document_store, written_count)
 
             duration_ms = int((time.time() - start_time) * 1000)
 
@@ -433,8 +603,10 @@ class LoggingDocumentWriter:
                 event="document.indexed",
                 index=index_name,
                 chunks_indexed=written_count,
+                bulk=bulk,
                 duration_ms=duration_ms,
             )
+            _record_stage("writing", start_time, documents)
 
             return {
                 "documents_written": written_count,
@@ -443,6 +615,117 @@ class LoggingDocumentWriter:
             }
 
 
+@component
+class LoggingFileTypeRouter:
+    """FileTypeRouter wrapper that records routing time."""
+
+    def __init__(self, mime_types: list[str]):
+        self.router = FileTypeRouter(mime_types=mime_types)
+        component.set_output_types(
+            self,
+            unclassified=list[str | Path | ByteStream],
+            failed=list[str | Path | ByteStream],
+            **dict.fromkeys(mime_types, list[str | Path | ByteStream]),
+        )
+
+    def run(
+        self,
+        sources: list[str | Path | ByteStream],
+        meta: dict[str, Any] | list[dict[str, Any]] | None = None,
+    ) -> dict[str, list[Any]]:
+        """Route sources by MIME type."""
+        start_time = time.time()
+        size_bytes = 0
+        for source in sources:
+            if isinstance(source, ByteStream):
+                size_bytes += len(source.data)
+            else:
+                with contextlib.suppress(OSError):
+                    size_bytes += Path(source).stat().st_size
+        result = self.router.run(sources=sources, meta=meta)
+        _record_stage("routing", start_time, document_count=len(sources), size_bytes=size_bytes)
+        return result
+
+
+@component
+class LoggingConverter:
+    """In-process converter wrapper that records conversion time."""
+
+    def __init__(self, converter: Any):
+        self.converter = converter
+
+    @component.output_types(documents=list[Document])
+    def run(
+        self,
+        sources: list[str | Path | ByteStream],
+        meta: dict[str, Any] | list[dict[str, Any]] | None = None,
+    ) -> dict[str, list[Document]]:
+        """Convert sources with the wrapped converter."""
+        start_time = time.time()
+        try:
+            result = self.converter.run(sources=sources, meta=meta)
+        except Exception:
+            _record_stage("conversion", start_time, success=False)
+            raise
+        _record_stage("conversion", start_time, result.get("documents", []))
+        return result
+
+
+@component
+class IsolatedConverter:
+    """Runs a PDF/DOCX/PPTX converter on the isolated converter pool.
+
+    Files that time out, exceed their CPU or memory limits, or crash a worker
+    are returned under ``failed``; if no source converts, the run raises so
+    single-file ingestion reports the file as failed.
+    """
+
+    def __init__(self, converter_name: str, pool: Any = None):
+        """
+        Initialize the converter.
+
+        Args:
+            converter_name: Pipeline converter name, e.g. "pdf_converter"
+            pool: ConverterPool (default: process-wide pool)
+        """
+        self.converter_name = converter_name
+        self._pool = pool
+
+    @component.output_types(documents=list[Document], failed=list[dict[str, str]])
+    def run(
+        self,
+        sources: list[str | Path | ByteStream],
+        meta: dict[str, Any] | list[dict[str, Any]] | None = None,
+    ) -> dict[str, list[Any]]:
+        """Convert sources in worker processes."""
+        from certus_ask.core.exceptions import DocumentParseError
+        from certus_ask.services.ingestion.converter_pool import get_converter_pool
+
+        if not sources:
+            return {"documents": [], "failed": []}
+
+        pool = self._pool or get_converter_pool()
+        start_time = time.time()
+        documents, failed = pool.convert(self.converter_name, sources, normalize_metadata(meta, len(sources)))
+        _record_stage("conversion", start_time, documents, success=not failed)
+        logger.info(
+            event="document.converted",
+            converter=self.converter_name,
+            source_count=len(sources),
+            document_count=len(documents),
+            failed_count=len(failed),
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+
+        if failed and len(failed) == len(sources):
+            raise DocumentParseError(
+                message=f"Failed to convert {len(failed)} file(s): {failed[0]['error']}",
+                error_code="conversion_failed",
+                details={"converter": self.converter_name, "failed": failed},
+            )
+        return {"documents": documents, "failed": failed}
+
+
 def create_preprocessing_pipeline(document_store: OpenSearchDocumentStore) -> Pipeline:
     """Create a complete document preprocessing pipeline for ingestion and indexing.
 
@@ -451,6 +734,7 @@ def create_preprocessing_pipeline(document_store: OpenSearchDocumentStore) -> Pi
 
     1. **File Type Detection** - Routes documents by MIME type
     2. **Format Conversion** - Converts PDF, DOCX, PPTX, CSV, Markdown, TXT to text
+       (PDF, DOCX and PPTX in isolated, resource-limited worker processes)
     3. **Text Cleaning** - Removes artifacts and normalizes whitespace
     4. **Metadata Capture** - Generates an evidence envelope for lineage tracking
     5. **PII Detection** - Finds and anonymizes sensitive information
@@ -528,7 +812,58 @@ def create_preprocessing_pipeline(document_store: OpenSearchDocumentStore) -> Pi
         - PresidioAnonymizer: For detailed PII handling behavior
         - OpenSearchDocumentStore: For persistence layer configuration
     """
-    file_type_router = FileTypeRouter(
+    pipeline = Pipeline()
+    last_stage = _add_conversion_components(pipeline, isolate_converters=settings.converter_workers > 0)
+
+    document_splitter = LoggingDocumentSplitter(split_by="word", split_length=150, split_overlap=50)
+    document_embedder = LoggingDocumentEmbedder(model=DEFAULT_EMBEDDING_MODEL)
+    document_writer = LoggingDocumentWriter(document_store, policy=DuplicatePolicy.SKIP)
+
+    pipeline.add_component(instance=document_splitter, name="document_splitter")
+    pipeline.add_component(instance=document_embedder, name="document_embedder")
+    pipeline.add_component(instance=document_writer, name="document_writer")
+
+    if last_stage == "presidio_anonymizer":
+        pipeline.connect("presidio_anonymizer", "document_splitter")
+    else:
+        pipeline.connect("document_cleaner", "document_splitter.documents")
+    pipeline.connect("document_splitter", "document_embedder")
+    pipeline.connect("document_embedder", "document_writer")
+
+    return pipeline
+
+
+def create_conversion_pipeline() -> Pipeline:
+    """Create the CPU-bound front half of the preprocessing pipeline.
+
+    Runs routing, format conversion, cleaning and (when enabled) PII
+    anonymization, stopping before chunking, embedding and indexing. Used by
+    parallel ingestion, where each worker process converts files independently
+    and the parent batches embedding and writes across files. Converters run
+    in-process, since the caller is already an isolated worker.
+
+    Returns:
+        Pipeline: Executed with ``{"file_type_router": {"sources": [path]}}``.
+            Cleaned documents are in ``result["presidio_anonymizer"]["documents"]``
+            when the anonymizer is enabled, otherwise in
+            ``result["document_cleaner"]["documents"]``.
+    """
+    pipeline = Pipeline()
+    _add_conversion_components(pipeline)
+    return pipeline
+
+
+def _add_conversion_components(pipeline: Pipeline, isolate_converters: bool = False) -> str:
+    """Add router, converters, joiner, cleaner and anonymizer to ``pipeline``.
+
+    Args:
+        pipeline: Pipeline to extend
+        isolate_converters: Run the PDF, DOCX and PPTX converters on the isolated converter pool
+
+    Returns:
+        Name of the last component in the conversion stage.
+    """
+    file_type_router = LoggingFileTypeRouter(
         mime_types=[
             "text/plain",
             "application/pdf",
@@ -540,36 +875,28 @@ def create_preprocessing_pipeline(document_store: OpenSearchDocumentStore) -> Pi
         ]
     )
 
-    document_converters = {
-        "text_file_converter": TextFileToDocument(),
-        "markdown_converter": MarkdownToDocument(),
-        "pdf_converter": PyPDFToDocument(),
-        "docx_converter": DOCXToDocument(),
-        "pptx_converter": PPTXToDocument(),
-        "csv_converter": CSVToDocument(),
-        "html_converter": HTMLToDocument(),
+    document_converters: dict[str, Any] = {
+        "text_file_converter": LoggingConverter(TextFileToDocument()),
+        "markdown_converter": LoggingConverter(MarkdownToDocument()),
+        "pdf_converter": LoggingConverter(PyPDFToDocument()),
+        "docx_converter": LoggingConverter(DOCXToDocument()),
+        "pptx_converter": LoggingConverter(PPTXToDocument()),
+        "csv_converter": LoggingConverter(CSVToDocument()),
+        "html_converter": LoggingConverter(HTMLToDocument()),
     }
+    if isolate_converters:
+        from certus_ask.services.ingestion.converter_pool import ISOLATED_CONVERTERS
 
-    document_joiner = DocumentJoiner()
-    document_cleaner = LoggingDocumentCleaner()
-    document_splitter = LoggingDocumentSplitter(split_by="word", split_length=150, split_overlap=50)
-    document_embedder = LoggingDocumentEmbedder(model="sentence-transformers/all-MiniLM-L6-v2")
-    document_writer = LoggingDocumentWriter(document_store, policy=DuplicatePolicy.SKIP)
-    presidio_anonymizer = PresidioAnonymizer()
+        for converter_name in ISOLATED_CONVERTERS:
+            document_converters[converter_name] = IsolatedConverter(converter_name)
 
-    pipeline = Pipeline()
     pipeline.add_component(instance=file_type_router, name="file_type_router")
 
     for converter_name, converter in document_converters.items():
         pipeline.add_component(instance=converter, name=converter_name)
 
-    pipeline.add_component(instance=document_joiner, name="document_joiner")
-    pipeline.add_component(instance=document_cleaner, name="document_cleaner")
-    if settings.anonymizer_enabled:
-        pipeline.add_component(instance=presidio_anonymizer, name="presidio_anonymizer")
-    pipeline.add_component(instance=document_splitter, name="document_splitter")
-    pipeline.add_component(instance=document_embedder, name="document_embedder")
-    pipeline.add_component(instance=document_writer, name="document_writer")
+    pipeline.add_component(instance=DocumentJoiner(), name="document_joiner")
+    pipeline.add_component(instance=LoggingDocumentCleaner(), name="document_cleaner")
 
     pipeline.connect("file_type_router.text/plain", "text_file_converter.sources")
     pipeline.connect("file_type_router.application/pdf", "pdf_converter.sources")
@@ -589,13 +916,10 @@ def create_preprocessing_pipeline(document_store: OpenSearchDocumentStore) -> Pi
         pipeline.connect(converter_name, "document_joiner")
 
     pipeline.connect("document_joiner", "document_cleaner.documents")
-    if settings.anonymizer_enabled:
-        pipeline.connect("document_cleaner", "presidio_anonymizer.documents")
-        pipeline.connect("presidio_anonymizer", "document_splitter")
-    else:
+    if not settings.anonymizer_enabled:
         logger.info("anonymizer.disabled", reason="ANONYMIZER_ENABLED=false")
-        pipeline.connect("document_cleaner", "document_splitter.documents")
-    pipeline.connect("document_splitter", "document_embedder")
-    pipeline.connect("document_embedder", "document_writer")
+        return "document_cleaner"
 
-    return pipeline
+    pipeline.add_component(instance=PresidioAnonymizer(), name="presidio_anonymizer")
+    pipeline.connect("document_cleaner", "presidio_anonymizer.documents")
+    return "presidio_anonymizer"
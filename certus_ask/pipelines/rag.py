@@ -1,6 +1,8 @@
-from haystack import Pipeline
+import time
+
+import structlog
+from haystack import Pipeline, component
 from haystack.components.builders import PromptBuilder
-from haystack.components.embedders import SentenceTransformersTextEmbedder
 
 try:
     from opensearch_haystack.document_stores import OpenSearchDocumentStore  # type: ignore[import]
@@ -20,6 +22,9 @@ except ModuleNotFoundError:  # pragma: no cover - compatibility fallback
         from haystack_integrations.components.generators.ollama import OllamaGenerator  # type: ignore[import]
 
 from certus_ask.core.config import settings
+from certus_ask.services.embedding_models import DEFAULT_EMBEDDING_MODEL, get_embedding_model_registry
+
+logger = structlog.get_logger(__name__)
 
 RAG_PROMPT_TEMPLATE = """
 You are a defensive security assistant helping engineers interpret scan output.
@@ -38,9 +43,32 @@ Question: {{ query }}
 """
 
 
+@component
+class SharedTextEmbedder:
+    """Query embedder that reuses the process-wide embedding model."""
+
+    def __init__(self, model: str = DEFAULT_EMBEDDING_MODEL):
+        self.model = model
+
+    def warm_up(self) -> None:
+        get_embedding_model_registry().get(self.model)
+
+    @component.output_types(embedding=list[float])
+    def run(self, text: str) -> dict[str, list[float]]:
+        """Embed a query string with the shared model."""
+        start_time = time.time()
+        embedding = get_embedding_model_registry().get(self.model).encode([text], show_progress_bar=False)[0]
+        logger.debug(
+            event="query.embedding_complete",
+            model=self.model,
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+        return {"embedding": embedding.tolist()}
+
+
 def create_rag_pipeline(document_store: OpenSearchDocumentStore) -> Pipeline:
     pipeline = Pipeline()
-    pipeline.add_component("embedder", SentenceTransformersTextEmbedder(model="sentence-transformers/all-MiniLM-L6-v2"))
+    pipeline.add_component("embedder", SharedTextEmbedder(model=DEFAULT_EMBEDDING_MODEL))
     pipeline.add_component("retriever", OpenSearchEmbeddingRetriever(document_store=document_store))
     pipeline.add_component(
         "prompt_builder",
@@ -0,0 +1,210 @@
+"""Streaming ingestion of large CSV and plain-text files.
+
+``CSVToDocument`` and ``TextFileToDocument`` read a whole file into a single
+``Document``, so a multi-GB export is held in memory several times over while
+it is cleaned, split and embedded. Files of those types above
+``settings.streaming_ingest_min_bytes`` are read incrementally instead: each
+part (``settings.streaming_csv_rows_per_document`` rows, with the header
+repeated, or ``settings.streaming_text_chunk_kb`` of text) is run through the
+pipeline's cleaner, anonymizer, splitter, embedder and writer before the next
+part is read, keeping peak memory independent of file size.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import mimetypes
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import structlog
+from haystack import Document, Pipeline
+
+from certus_ask.core.config import settings
+from certus_ask.core.metrics import stage_attributes
+
+logger = structlog.get_logger(__name__)
+
+_STREAMING_MIME_TYPES = ("text/csv", "text/plain")
+# Components fed part by part, in pipeline order; the anonymizer is absent when disabled.
+_DOWNSTREAM_COMPONENTS = ("document_cleaner", "presidio_anonymizer", "document_splitter", "document_embedder")
+_PREVIEW_LIMIT = 3
+
+
+def iter_csv_documents(file_path: Path, rows_per_document: int, max_bytes: int) -> Iterator[Document]:
+    """Yield documents of at most ``rows_per_document`` rows (or ``max_bytes``), each starting with the header."""
+    with file_path.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        part = rows = 0
+        row_start = 1
+
+        def flush() -> Document:
+            meta = {"file_path": file_path.name, "stream_part": part, "row_start": row_start}
+            meta["row_end"] = row_start + rows - 1
+            return Document(content=buffer.getvalue(), meta=meta)
+
+        writer.writerow(header)
+        for row in reader:
+            writer.writerow(row)
+            rows += 1
+            if rows >= rows_per_document or buffer.tell() >= max_bytes:
+                yield flush()
+                part += 1
+                row_start += rows
+                rows = 0
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerow(header)
+        if rows:
+            yield flush()
+
+
+def iter_text_documents(file_path: Path, max_bytes: int) -> Iterator[Document]:
+    """Yield documents of roughly ``max_bytes`` of text, split at line (or word) boundaries."""
+    with file_path.open("r", encoding="utf-8") as handle:
+        part = 0
+        carry = ""
+        while True:
+            block = handle.read(max_bytes)
+            text = carry + block
+            if not block:
+                if text.strip():
+                    yield Document(content=text, meta={"file_path": file_path.name, "stream_part": part})
+                return
+            # Keep the trailing partial line (or word) for the next part so words are not cut in half.
+            cut = text.rfind("\n") + 1 or text.rfind(" ") + 1 or len(text)
+            text, carry = text[:cut], text[cut:]
+            if text.strip():
+                yield Document(content=text, meta={"file_path": file_path.name, "stream_part": part})
+                part += 1
+
+
+def iter_streamed_documents(file_path: Path) -> Iterator[Document] | None:
+    """Return a document iterator if ``file_path`` should be streamed, otherwise None."""
+    mime_type = mimetypes.guess_type(file_path.name)[0]
+    if mime_type not in _STREAMING_MIME_TYPES or settings.streaming_ingest_min_bytes <= 0:
+        return None
+    try:
+        if file_path.stat().st_size < settings.streaming_ingest_min_bytes:
+            return None
+    except OSError:
+        return None
+
+    max_bytes = max(1, settings.streaming_text_chunk_kb) * 1024
+    if mime_type == "text/csv":
+        return iter_csv_documents(file_path, max(1, settings.streaming_csv_rows_per_document), max_bytes)
+    return iter_text_documents(file_path, max_bytes)
+
+
+def run_file_pipeline(
+    pipeline: Pipeline,
+    file_path: Path,
+    metadata_context: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Run a preprocessing pipeline for one file, streaming large CSV and text files.
+
+    Args:
+        pipeline: Pipeline from ``create_preprocessing_pipeline``
+        file_path: File to ingest
+        metadata_context: ``metadata_context`` input for the document writer
+
+    Returns:
+        Pipeline result. For streamed files the ``document_writer`` entry holds
+        ``documents_written``, ``document_ids`` and the first few
+        ``metadata_preview`` envelopes rather than the written documents, and
+        the ``presidio_anonymizer`` entry holds the first few ``quarantined``
+        documents plus a ``quarantined_count``.
+    """
+    if metadata_context is None:
+        return _run_file(pipeline, file_path, metadata_context)
+    # Attribute per-stage metrics to the ingestion's workspace and source.
+    with stage_attributes(metadata_context.get("workspace_id"), metadata_context.get("source")):
+        return _run_file(pipeline, file_path, metadata_context)
+
+
+def _run_file(pipeline: Pipeline, file_path: Path, metadata_context: dict[str, Any] | None) -> dict[str, Any]:
+    documents = iter_streamed_documents(file_path)
+    if documents is None:
+        data: dict[str, Any] = {"file_type_router": {"sources": [file_path]}}
+        if metadata_context is not None:
+            data["document_writer"] = {"metadata_context": metadata_context}
+        return pipeline.run(data)
+    return _run_streaming(pipeline, file_path, documents, metadata_context)
+
+
+def _run_streaming(
+    pipeline: Pipeline,
+    file_path: Path,
+    documents: Iterator[Document],
+    metadata_context: dict[str, Any] | None,
+) -> dict[str, Any]:
+    components = dict(pipeline.walk())
+    stages = [components[name] for name in _DOWNSTREAM_COMPONENTS if name in components]
+    writer = components["document_writer"]
+
+    documents_written = 0
+    document_ids: list[str] = []
+    metadata_preview: list[dict[str, Any]] = []
+    quarantined: list[Document] = []
+    quarantined_total = 0
+    parts = 0
+    start_time = time.time()
+    logger.info("document.streaming_start", file_path=str(file_path))
+
+    for document in documents:
+        batch = [document]
+        for stage in stages:
+            output = stage.run(documents=batch)
+            # Keep a small sample only: each quarantined part is a whole Document.
+            held = output.get("quarantined", [])
+            quarantined_total += len(held)
+            quarantined.extend(held[: _PREVIEW_LIMIT - len(quarantined)])
+            batch = output["documents"]
+        written = writer.run(documents=batch, metadata_context=metadata_context)
+        documents_written += written.get("documents_written", 0)
+        document_ids.extend(doc.id for doc in written.get("documents", []))
+        if len(metadata_preview) < _PREVIEW_LIMIT:
+            metadata_preview.extend(written.get("metadata_preview", [])[: _PREVIEW_LIMIT - len(metadata_preview)])
+        parts += 1
+
+    logger.info(
+        "document.streaming_complete",
+        file_path=str(file_path),
+        parts=parts,
+        documents_written=documents_written,
+        duration_ms=int((time.time() - start_time) * 1000),
+    )
+    result: dict[str, Any] = {
+        "document_writer": {
+            "documents_written": documents_written,
+            "document_ids": document_ids,
+            "metadata_preview": metadata_preview,
+        }
+    }
+    if "presidio_anonymizer" in components:
+        result["presidio_anonymizer"] = {"quarantined": quarantined, "quarantined_count": quarantined_total}
+    return result
+
+
+def quarantined_count(result: dict[str, Any]) -> int:
+    """Number of documents quarantined by a ``run_file_pipeline`` result."""
+    stage = result.get("presidio_anonymizer") or {}
+    return stage.get("quarantined_count", len(stage.get("quarantined", [])))
+
+
+__all__ = [
+    "iter_csv_documents",
+    "iter_streamed_documents",
+    "iter_text_documents",
+    "quarantined_count",
+    "run_file_pipeline",
+]
@@ -15,7 +15,6 @@ from bs4 import BeautifulSoup
 from haystack import Document, Pipeline, component
 from haystack.components.embedders import SentenceTransformersDocumentEmbedder
 from haystack.components.preprocessors import DocumentSplitter
-from haystack.components.writers import DocumentWriter
 from haystack.document_stores.types import DuplicatePolicy
 from readability import Document as ReadabilityDocument
 from trafilatura import extract as trafilatura_extract
@@ -26,7 +25,7 @@ try:
 except ModuleNotFoundError:  # pragma: no cover
     from haystack_integrations.document_stores.opensearch import OpenSearchDocumentStore  # type: ignore[import]
 
-from certus_ask.pipelines.preprocessing import PresidioAnonymizer
+from certus_ask.pipelines.preprocessing import LoggingDocumentWriter, PresidioAnonymizer
 
 logger = logging.getLogger(__name__)
 
@@ -374,7 +373,7 @@ def create_web_pipeline(document_store: OpenSearchDocumentStore) -> Pipeline:
     presidio = PresidioAnonymizer()
     splitter = DocumentSplitter(split_by="word", split_length=150, split_overlap=50)
     embedder = SentenceTransformersDocumentEmbedder(model="sentence-transformers/all-MiniLM-L6-v2")
-    writer = DocumentWriter(document_store, policy=DuplicatePolicy.SKIP)
+    writer = LoggingDocumentWriter(document_store, policy=DuplicatePolicy.SKIP)
 
     pipeline.add_component(instance=scraper, name="scraper")
     pipeline.add_component(instance=presidio, name="presidio_anonymizer")
@@ -10,15 +10,14 @@ from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
 from haystack import Document, Pipeline, component
-from haystack.components.embedders import SentenceTransformersDocumentEmbedder
 from haystack.components.preprocessors import DocumentSplitter
-from haystack.components.writers import DocumentWriter
 from haystack.document_stores.types import DuplicatePolicy
 from readability import Document as ReadabilityDocument
 from trafilatura import extract as trafilatura_extract
 from w3lib.url import canonicalize_url
 
-from certus_ask.pipelines.preprocessing import PresidioAnonymizer
+from certus_ask.pipelines.preprocessing import LoggingDocumentEmbedder, LoggingDocumentWriter, PresidioAnonymizer
+from certus_ask.services.embedding_models import DEFAULT_EMBEDDING_MODEL
 
 try:
     from opensearch_haystack.document_stores import OpenSearchDocumentStore  # type: ignore[import]
@@ -322,8 +321,8 @@ def create_scrapy_crawl_pipeline(document_store: OpenSearchDocumentStore) -> Pip
     crawler = ScrapyCrawlerComponent()
     presidio = PresidioAnonymizer()
     splitter = DocumentSplitter(split_by="word", split_length=150, split_overlap=50)
-    embedder = SentenceTransformersDocumentEmbedder(model="sentence-transformers/all-MiniLM-L6-v2")
-    writer = DocumentWriter(document_store, policy=DuplicatePolicy.SKIP)
+    embedder = LoggingDocumentEmbedder(model=DEFAULT_EMBEDDING_MODEL)
+    writer = LoggingDocumentWriter(document_store, policy=DuplicatePolicy.SKIP)
 
     pipeline.add_component(instance=crawler, name="crawler")
     pipeline.add_component(instance=presidio, name="presidio_anonymizer")
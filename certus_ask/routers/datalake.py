@@ -9,10 +9,13 @@ Provides endpoints for:
 
 import json
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any, Literal
 
 import structlog
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from certus_ask.core.config import settings
@@ -22,7 +25,8 @@ from certus_ask.core.exceptions import (
     StorageError,
     StorageFileNotFoundError,
 )
-from certus_ask.pipelines.preprocessing import create_preprocessing_pipeline
+from certus_ask.pipelines.pipeline_pool import get_pipeline_pool
+from certus_ask.pipelines.streaming import run_file_pipeline
 from certus_ask.schemas.datalake import (
     BatchPreprocessRequest,
     BatchS3IngestRequest,
@@ -34,8 +38,12 @@ from certus_ask.schemas.errors import (
     BadRequestErrorResponse,
     InternalServerErrorResponse,
     NotFoundErrorResponse,
+    TooManyRequestsErrorResponse,
 )
 from certus_ask.services import datalake as datalake_service
+from certus_ask.services.document_counts import get_document_counts
+from certus_ask.services.ingestion.admission import admit_ingestion
+from certus_ask.services.ingestion.s3_prefetch import prefetch_objects
 from certus_ask.services.opensearch import get_document_store
 from certus_ask.services.s3 import get_s3_client
 
@@ -134,19 +142,26 @@ class UploadResponse(DatalakeBaseResponse):
 
     Attributes:
         message: Upload completion message
+        uploaded: Number of files uploaded
+        skipped: Number of files skipped because the stored object already matched
     """
 
-    pass
+    uploaded: int = Field(default=1, description="Files uploaded")
+    skipped: int = Field(default=0, description="Files already present with a matching ETag or size")
 
 
 class ListResponse(BaseModel):
     """Response for list operation.
 
     Attributes:
-        files: List of object keys in bucket
+        files: Object keys on this page
+        prefixes: Common prefixes on this page (when a delimiter is given)
+        next_cursor: Cursor for the next page, None on the last page
     """
 
     files: list[str] = Field(..., description="List of object keys")
+    prefixes: list[str] = Field(default_factory=list, description="Common prefixes when a delimiter is given")
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page; absent on the last page")
 
 
 class PreprocessResponse(DatalakeBaseResponse):
@@ -276,17 +291,31 @@ async def upload(request: UploadRequest) -> UploadResponse:
         )
 
         if source_path.is_dir():
-            datalake_service.upload_directory(
+            result = datalake_service.upload_directory(
                 client,
                 source_path,
                 settings.datalake_raw_bucket,
                 target_folder,
             )
+            if result.failed:
+                raise FileUploadError(
+                    message=f"Failed to upload {len(result.failed)} file(s)",
+                    error_code="upload_failed",
+                    details={
+                        "source_path": str(source_path),
+                        "uploaded": result.uploaded,
+                        "skipped": result.skipped,
+                        "failed": result.failed[:20],
+                    },
+                )
             logger.info(
                 event="datalake.directory_uploaded",
                 source_path=str(source_path),
                 target_folder=target_folder,
+                uploaded=result.uploaded,
+                skipped=result.skipped,
             )
+            return UploadResponse(message="Upload completed.", uploaded=result.uploaded, skipped=result.skipped)
         else:
             upload_path = source_path
             try:
@@ -319,7 +348,7 @@ async def upload(request: UploadRequest) -> UploadResponse:
 
         return UploadResponse(message="Upload completed.")
 
-    except StorageFileNotFoundError:
+    except (StorageFileNotFoundError, FileUploadError):
         raise
     except Exception as exc:
         logger.error(
@@ -336,33 +365,106 @@ async def upload(request: UploadRequest) -> UploadResponse:
         ) from exc
 
 
+LIST_MAX_PAGE_SIZE = 1000
+
+
+def _object_entry(item: dict[str, Any]) -> dict[str, Any]:
+    last_modified = item.get("LastModified")
+    return {
+        "key": item["Key"],
+        "size": item.get("Size"),
+        "last_modified": last_modified.isoformat() if hasattr(last_modified, "isoformat") else last_modified,
+        "etag": item.get("ETag"),
+    }
+
+
+def _stream_listing(
+    client: Any,
+    bucket_name: str,
+    prefix: str,
+    delimiter: str | None,
+    page_size: int,
+    cursor: str | None,
+) -> Iterator[str]:
+    """Yield one NDJSON line per prefix/object, fetching a page at a time."""
+    object_count = 0
+    while True:
+        try:
+            page = datalake_service.list_objects_page(client, bucket_name, prefix, delimiter, page_size, cursor)
+        except Exception as exc:
+            logger.error(
+                event="datalake.list_failed",
+                bucket_name=bucket_name,
+                error=str(exc),
+                exc_info=True,
+            )
+            # The cursor lets clients resume from the failed page.
+            yield json.dumps({"error": "list_failed", "message": str(exc), "cursor": cursor}) + "\n"
+            return
+
+        for common_prefix in page["prefixes"]:
+            yield json.dumps({"prefix": common_prefix}) + "\n"
+        for item in page["objects"]:
+            yield json.dumps(_object_entry(item)) + "\n"
+        object_count += len(page["objects"])
+
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    logger.info(
+        event="datalake.list_complete",
+        bucket_name=bucket_name,
+        object_count=object_count,
+        streamed=True,
+    )
+
+
 @router.get(
     "/list/{bucket_name}",
     response_model=ListResponse,
     responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "One page as JSON, or every object as NDJSON"},
         404: {"model": NotFoundErrorResponse, "description": "Bucket does not exist"},
         500: {"model": InternalServerErrorResponse, "description": "Listing failed"},
     },
 )
-async def list_objects(bucket_name: str) -> ListResponse:
-    """List all objects in a bucket.
+async def list_objects(
+    bucket_name: str,
+    prefix: str = Query("", description="Only list keys starting with this prefix"),
+    delimiter: str | None = Query(None, description="Group keys sharing a prefix up to this delimiter (e.g. '/')"),
+    page_size: int = Query(LIST_MAX_PAGE_SIZE, ge=1, le=LIST_MAX_PAGE_SIZE, description="Keys per page"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    format: Literal["json", "ndjson"] = Query(
+        "json", description="json returns one page; ndjson streams every object from the cursor onward"
+    ),
+) -> Any:
+    """List objects in a bucket, one page at a time.
 
     **Request Example:**
     ```bash
-    curl -X GET "http://localhost:8000/v1/datalake/list/my-bucket"
+    curl -X GET "http://localhost:8000/v1/datalake/list/my-bucket?prefix=documents/&delimiter=/&page_size=2"
     ```
 
     **Success Response (200):**
     ```json
     {
       "files": [
-        "documents/2024/report1.pdf",
-        "documents/2024/report2.pdf",
-        "logs/error_log.txt"
-      ]
+        "documents/report1.pdf",
+        "documents/report2.pdf"
+      ],
+      "prefixes": ["documents/2024/"],
+      "next_cursor": "1ueGcxLPRx1Tr/XYExHnhbYLgveDs2J/wm36Hy4vbOwM="
     }
     ```
 
+    Pass ``next_cursor`` back as ``cursor`` for the next page. With
+    ``format=ndjson`` the whole listing is streamed, one JSON object per line
+    (``{"key", "size", "last_modified", "etag"}`` or ``{"prefix"}``):
+    ```bash
+    curl -N "http://localhost:8000/v1/datalake/list/my-bucket?format=ndjson"
+    ```
+
     **Error Response (404 - Bucket Not Found):**
     ```json
     {
@@ -376,9 +478,14 @@ async def list_objects(bucket_name: str) -> ListResponse:
 
     Args:
         bucket_name: S3 bucket name to list
+        prefix: Key prefix filter
+        delimiter: Delimiter for grouping keys into common prefixes
+        page_size: Keys per page (at most 1000)
+        cursor: Continuation cursor from a previous page
+        format: ``json`` for one page, ``ndjson`` to stream the full listing
 
     Returns:
-        ListResponse with list of all object keys in bucket
+        ListResponse with one page of keys, or an NDJSON stream
 
     Raises:
         HTTPException 404: If bucket doesn't exist
@@ -393,21 +500,31 @@ async def list_objects(bucket_name: str) -> ListResponse:
             details={"bucket_name": bucket_name},
         )
 
-    try:
-        logger.info(
-            event="datalake.list_start",
-            bucket_name=bucket_name,
+    logger.info(
+        event="datalake.list_start",
+        bucket_name=bucket_name,
+        prefix=prefix,
+        cursor=bool(cursor),
+        format=format,
+    )
+
+    if format == "ndjson":
+        return StreamingResponse(
+            _stream_listing(client, bucket_name, prefix, delimiter, page_size, cursor),
+            media_type="application/x-ndjson",
         )
-        response = client.list_objects_v2(Bucket=bucket_name)
-        contents = response.get("Contents", [])
-        files = [item["Key"] for item in contents]
+
+    try:
+        page = datalake_service.list_objects_page(client, bucket_name, prefix, delimiter, page_size, cursor)
+        files = [item["Key"] for item in page["objects"]]
 
         logger.info(
             event="datalake.list_complete",
             bucket_name=bucket_name,
             object_count=len(files),
+            truncated=page["next_cursor"] is not None,
         )
-        return ListResponse(files=files)
+        return ListResponse(files=files, prefixes=page["prefixes"], next_cursor=page["next_cursor"])
     except Exception as exc:
         logger.error(
             event="datalake.list_failed",
@@ -477,24 +594,20 @@ async def promote_object(request: PreprocessRequest) -> PreprocessResponse:
     source_key = request.source_key.strip("/")
     destination_prefix = request.destination_prefix.strip("/ ") if request.destination_prefix else ""
 
-    tmp_path = None
     verified_scans: set[str] = set()
     scan_id = _extract_scan_id(source_key)
     if scan_id:
         _ensure_verified_scan(client, scan_id, verified_scans)
     try:
-        suffix = Path(source_key).suffix or ""
-        original_name = Path(source_key).name
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-            tmp_path = Path(tmp_file.name)
-            client.download_file(settings.datalake_raw_bucket, source_key, str(tmp_path))
-
-        destination_key = f"{destination_prefix}/{original_name}".strip("/")
-        datalake_service.upload_file(
+        destination_key = f"{destination_prefix}/{Path(source_key).name}".strip("/")
+        head = client.head_object(Bucket=settings.datalake_raw_bucket, Key=source_key)
+        datalake_service.copy_object(
             client,
-            tmp_path,
+            settings.datalake_raw_bucket,
+            source_key,
             settings.datalake_golden_bucket,
             destination_key,
+            size=head.get("ContentLength"),
         )
 
         return PreprocessResponse(
@@ -508,9 +621,6 @@ async def promote_object(request: PreprocessRequest) -> PreprocessResponse:
             error_code="preprocess_failed",
             details={"source_key": source_key},
         ) from exc
-    finally:
-        if tmp_path:
-            tmp_path.unlink(missing_ok=True)
 
 
 @router.post(
@@ -577,12 +687,28 @@ async def promote_prefix(
     source_prefix = request.source_prefix.strip("/ ")
     destination_prefix = request.destination_prefix.strip("/ ") if request.destination_prefix else source_prefix
 
+    verified_scans: set[str] = set()
+
+    def verify(key: str) -> None:
+        scan_id = _extract_scan_id(key)
+        if scan_id:
+            _ensure_verified_scan(client, scan_id, verified_scans)
+
+    objects = (
+        item
+        for item in datalake_service.iter_objects(client, settings.datalake_raw_bucket, source_prefix)
+        if not item["Key"].endswith("/")
+    )
     try:
-        objects = client.list_objects_v2(
-            Bucket=settings.datalake_raw_bucket,
-            Prefix=source_prefix,
+        # Server-side copies: object bytes never pass through the API process.
+        promoted, failed = datalake_service.copy_objects(
+            client,
+            settings.datalake_raw_bucket,
+            objects,
+            settings.datalake_golden_bucket,
+            lambda key: f"{destination_prefix}/{Path(key).name}".strip("/"),
+            check=verify,
         )
-        keys = [item["Key"] for item in objects.get("Contents", []) if not item["Key"].endswith("/")]
     except Exception as exc:
         logger.exception("Failed to list objects for prefix %s", source_prefix)
         raise StorageError(
@@ -591,54 +717,18 @@ async def promote_prefix(
             details={"prefix": source_prefix},
         ) from exc
 
-    if not keys:
+    if not promoted and not failed:
         raise StorageFileNotFoundError(
             message="No objects found under prefix",
             error_code="prefix_not_found",
             details={"prefix": source_prefix},
         )
 
-    promoted: list[str] = []
-    failed: list[dict[str, str]] = []
-    verified_scans: set[str] = set()
-
-    for key in keys:
-        tmp_path: Path | None = None
-        try:
-            scan_id = _extract_scan_id(key)
-            if scan_id:
-                _ensure_verified_scan(client, scan_id, verified_scans)
-
-            suffix = Path(key).suffix or ""
-            original_name = Path(key).name
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-                tmp_path = Path(tmp_file.name)
-                client.download_file(
-                    settings.datalake_raw_bucket,
-                    key,
-                    str(tmp_path),
-                )
-
-            destination_key = f"{destination_prefix}/{original_name}".strip("/")
-            datalake_service.upload_file(
-                client,
-                tmp_path,
-                settings.datalake_golden_bucket,
-                destination_key,
-            )
-            promoted.append(key)
-        except Exception as exc:
-            failed.append({"key": key, "error": str(exc)})
-            logger.exception("Failed to promote %s during batch", key)
-        finally:
-            if tmp_path:
-                tmp_path.unlink(missing_ok=True)
-
     if not promoted:
         raise StorageError(
             message="Failed to promote any objects",
             error_code="batch_promote_failed",
-            details={"prefix": source_prefix, "total": len(keys)},
+            details={"prefix": source_prefix, "total": len(failed)},
         )
 
     return BatchPreprocessResponse(
@@ -651,7 +741,9 @@ async def promote_prefix(
 @router.post(
     "/ingest",
     response_model=IngestResponse,
+    dependencies=[Depends(admit_ingestion)],
     responses={
+        429: {"model": TooManyRequestsErrorResponse, "description": "Ingestion capacity exhausted"},
         500: {"model": InternalServerErrorResponse, "description": "Ingestion failed"},
     },
 )
@@ -706,7 +798,6 @@ async def ingest_from_s3(request: S3IngestRequest) -> IngestResponse:
     key = request.key.strip().lstrip("/")
 
     document_store = get_document_store()
-    pipeline = create_preprocessing_pipeline(document_store)
 
     tmp_path: Path | None = None
     try:
@@ -715,11 +806,12 @@ async def ingest_from_s3(request: S3IngestRequest) -> IngestResponse:
             tmp_path = Path(tmp_file.name)
             client.download_file(bucket, key, str(tmp_path))
 
-        pipeline.run({"file_type_router": {"sources": [tmp_path]}})
+        with get_pipeline_pool().acquire(document_store) as pipeline:
+            run_file_pipeline(pipeline, tmp_path)
 
         return IngestResponse(
             message=f"Ingested {key} from {bucket}",
-            document_count=document_store.count_documents(),
+            document_count=get_document_counts().count(document_store),
         )
 
     except Exception as exc:
@@ -737,8 +829,10 @@ async def ingest_from_s3(request: S3IngestRequest) -> IngestResponse:
 @router.post(
     "/ingest/batch",
     response_model=BatchIngestResponse,
+    dependencies=[Depends(admit_ingestion)],
     responses={
         404: {"model": NotFoundErrorResponse, "description": "No objects match prefix"},
+        429: {"model": TooManyRequestsErrorResponse, "description": "Ingestion capacity exhausted"},
         500: {"model": InternalServerErrorResponse, "description": "Batch ingestion failed"},
     },
 )
@@ -819,26 +913,33 @@ async def ingest_prefix(
         )
 
     document_store = get_document_store()
-    pipeline = create_preprocessing_pipeline(document_store)
 
     ingested: list[str] = []
     failed: list[dict[str, str]] = []
 
-    for key in keys:
-        tmp_path: Path | None = None
-        try:
-            suffix = Path(key).suffix or ""
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-                tmp_path = Path(tmp_file.name)
-                client.download_file(bucket, key, str(tmp_path))
-            pipeline.run({"file_type_router": {"sources": [tmp_path]}})
-            ingested.append(key)
-        except Exception as exc:
-            failed.append({"key": key, "error": str(exc)})
-            logger.exception("Failed to ingest %s during batch", key)
-        finally:
-            if tmp_path:
-                tmp_path.unlink(missing_ok=True)
+    with (
+        tempfile.TemporaryDirectory() as temp_dir,
+        get_pipeline_pool().acquire(document_store) as pipeline,
+    ):
+        # Later objects download while earlier ones are converted and embedded.
+        prefetched_objects = prefetch_objects(
+            [{"Key": key} for key in keys],
+            lambda key, local_path: client.download_file(bucket, key, str(local_path)),
+            Path(temp_dir),
+            event_prefix="datalake.ingest_batch",
+        )
+        for prefetched in prefetched_objects:
+            key = prefetched.key
+            if prefetched.error is not None:
+                failed.append({"key": key, "error": prefetched.error})
+                logger.error("Failed to download %s during batch: %s", key, prefetched.error)
+                continue
+            try:
+                run_file_pipeline(pipeline, prefetched.local_path)
+                ingested.append(key)
+            except Exception as exc:
+                failed.append({"key": key, "error": str(exc)})
+                logger.exception("Failed to ingest %s during batch", key)
 
     if not ingested:
         raise StorageError(
@@ -851,5 +952,5 @@ async def ingest_prefix(
         message=f"Ingested {len(ingested)} objects under {bucket}/{prefix}",
         ingested=ingested,
         failed=failed,
-        document_count=document_store.count_documents(),
+        document_count=get_document_counts().count(document_store),
     )
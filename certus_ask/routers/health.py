@@ -3,16 +3,27 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-from sentence_transformers import SentenceTransformer
 
 from certus_ask.core.config import settings
-from certus_ask.core.metrics import get_ingestion_metrics, get_query_metrics, get_service_uptime
+from certus_ask.core.metrics import (
+    get_ingestion_metrics,
+    get_pipeline_stage_metrics,
+    get_query_metrics,
+    get_service_uptime,
+)
+from certus_ask.pipelines.pipeline_pool import get_pipeline_pool
 from certus_ask.services import datalake as datalake_service
+from certus_ask.services.document_counts import get_document_counts
+from certus_ask.services.embedding_cache import get_embedding_cache
+from certus_ask.services.embedding_models import DEFAULT_EMBEDDING_MODEL, get_embedding_model_registry
+from certus_ask.services.ingestion.admission import get_admission_controller
 from certus_ask.services.opensearch import get_document_store
+from certus_ask.services.pii_analysis import get_pii_prefilter
 from certus_ask.services.s3 import get_s3_client
+from certus_integrity.services import get_pii_result_cache
 
 router = APIRouter(prefix="/v1/health", tags=["health"])
-EMBEDDING_MODEL_ID = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_MODEL_ID = DEFAULT_EMBEDDING_MODEL
 
 
 @router.get("")
@@ -41,12 +52,21 @@ async def evaluation_health() -> dict[str, str]:
 
 
 @router.get("/embedder")
-async def embedder_health() -> dict[str, str]:
+async def embedder_health() -> dict[str, Any]:
+    registry = get_embedding_model_registry()
     try:
-        SentenceTransformer(EMBEDDING_MODEL_ID)
+        registry.get(EMBEDDING_MODEL_ID)
     except Exception as exc:  # pragma: no cover - defensive
         raise HTTPException(status_code=503, detail=f"Embedding model unavailable: {exc}") from exc
-    return {"status": "ok"}
+    return {"status": "ok", "models": registry.stats()}
+
+
+@router.get("/pipelines")
+async def pipelines_health() -> dict[str, Any]:
+    """Report the state of the shared preprocessing pipeline pool."""
+    pool_stats = get_pipeline_pool().health()
+    failing = [key for key, entry in pool_stats["pools"].items() if entry["last_error"]]
+    return {"status": "degraded" if failing else "ok", **pool_stats}
 
 
 @router.get("/datalake")
@@ -73,6 +93,18 @@ class ServiceStats(BaseModel):
     neo4j: dict[str, Any] = Field(..., description="Neo4j knowledge graph statistics")
     ingestion: dict[str, Any] = Field(..., description="Ingestion operation statistics")
     query: dict[str, Any] = Field(..., description="Query operation statistics")
+    pipeline_stages: dict[str, Any] = Field(
+        default_factory=dict, description="Per-stage preprocessing time, documents and bytes, slowest first"
+    )
+    admission: dict[str, Any] = Field(
+        default_factory=dict, description="Ingestion admission slots, wait queue depth, waits and rejections"
+    )
+    embedding_models: dict[str, Any] = Field(
+        default_factory=dict, description="Shared embedding model load time, memory and hit counts"
+    )
+    embedding_cache: dict[str, Any] = Field(default_factory=dict, description="Embedding cache size and hit rate")
+    pii_prefilter: dict[str, Any] = Field(default_factory=dict, description="PII prefilter pass-through rate")
+    pii_result_cache: dict[str, Any] = Field(default_factory=dict, description="PII result cache size and hit rate")
     uptime_seconds: float = Field(..., description="Service uptime in seconds")
     timestamp: datetime = Field(..., description="When stats were generated")
 
@@ -88,7 +120,7 @@ async def get_stats() -> ServiceStats:
     opensearch_stats = {"total_documents": 0, "indices": []}
     try:
         doc_store = get_document_store()
-        opensearch_stats["total_documents"] = doc_store.count_documents()
+        opensearch_stats["total_documents"] = get_document_counts().count(doc_store)
         opensearch_stats["default_index"] = "ask_certus"
     except Exception as e:
         opensearch_stats["error"] = str(e)
@@ -123,11 +155,22 @@ async def get_stats() -> ServiceStats:
     query_metrics = get_query_metrics()
     query_stats = query_metrics.to_dict()
 
+    admission_controller = get_admission_controller()
+    embedding_cache = get_embedding_cache()
+    pii_prefilter = get_pii_prefilter()
+    pii_result_cache = get_pii_result_cache()
+
     return ServiceStats(
         opensearch=opensearch_stats,
         neo4j=neo4j_stats,
         ingestion=ingestion_stats,
         query=query_stats,
+        pipeline_stages=get_pipeline_stage_metrics().to_dict(),
+        admission=admission_controller.stats() if admission_controller is not None else {"enabled": False},
+        embedding_models=get_embedding_model_registry().stats(),
+        embedding_cache=embedding_cache.stats() if embedding_cache is not None else {"enabled": False},
+        pii_prefilter=pii_prefilter.stats() if pii_prefilter is not None else {"enabled": False},
+        pii_result_cache=pii_result_cache.stats() if pii_result_cache is not None else {"enabled": False},
         uptime_seconds=get_service_uptime(),
         timestamp=datetime.now(timezone.utc),
     )
@@ -20,15 +20,17 @@ from pathlib import Path
 from typing import Annotated, Any
 
 import structlog
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
+from certus_ask.core.config import settings
 from certus_ask.core.exceptions import (
     DocumentIngestionError,
     DocumentParseError,
     ValidationError,
 )
-from certus_ask.core.metrics import get_ingestion_metrics
+from certus_ask.core.metrics import get_ingestion_metrics, stage_attributes
 from certus_ask.core.request_context import get_request_id
 
 # Neo4j loaders and markdown generators now accessed via Neo4jService
@@ -36,13 +38,13 @@ from certus_ask.core.request_context import get_request_id
 # from certus_ask.pipelines.markdown_generators.spdx_markdown import SpdxToMarkdown
 # from certus_ask.pipelines.neo4j_loaders.sarif_loader import SarifToNeo4j
 # from certus_ask.pipelines.neo4j_loaders.spdx_loader import SpdxToNeo4j
-from certus_ask.pipelines.preprocessing import (
-    create_preprocessing_pipeline,
-)
+from certus_ask.pipelines.pipeline_pool import get_pipeline_pool
+from certus_ask.pipelines.streaming import run_file_pipeline
 from certus_ask.pipelines.web_scrapy import create_scrapy_crawl_pipeline
 from certus_ask.schemas.errors import (
     BadRequestErrorResponse,
     InternalServerErrorResponse,
+    TooManyRequestsErrorResponse,
 )
 from certus_ask.schemas.ingestion import (
     GitRepositoryRequest,
@@ -51,12 +53,18 @@ from certus_ask.schemas.ingestion import (
     WebCrawlRequest,
     WebIngestionRequest,
 )
+from certus_ask.services.document_counts import get_document_counts
 from certus_ask.services.ingestion import (
+    extract_document_ids,
     extract_metadata_preview,
     get_upload_file_size,
 )
+from certus_ask.services.ingestion.admission import admit_ingestion, hand_off_admission
+from certus_ask.services.ingestion.jobs import JobQueueFullError, get_ingestion_job_manager, report_progress
+from certus_ask.services.ingestion.s3_prefetch import prefetch_objects
 from certus_ask.services.opensearch import get_document_store_for_workspace
 from certus_ask.services.privacy_logger import PrivacyLogger
+from certus_ask.services.storage.bulk_indexing import bulk_ingest_mode
 
 router = APIRouter(prefix="/v1", tags=["ingestion"])
 
@@ -143,12 +151,16 @@ class FolderIngestionResponse(IngestionBaseResponse):
         message: Success message
         processed_files: Number of files successfully processed
         failed_files: Number of files that failed processing
+        skipped_files: Number of unchanged files skipped by incremental ingestion
+        deleted_files: Number of files whose chunks were removed because they no longer exist
         quarantined_documents: Number of documents quarantined due to PII
         document_count: Total documents in index
     """
 
     processed_files: int = Field(..., description="Number of files successfully processed")
     failed_files: int = Field(default=0, description="Number of files that failed")
+    skipped_files: int = Field(default=0, description="Files skipped because they were unchanged")
+    deleted_files: int = Field(default=0, description="Files removed from the index because they were deleted")
     quarantined_documents: int = Field(default=0, description="Documents quarantined due to PII")
 
 
@@ -159,11 +171,22 @@ class GitHubIngestionResponse(IngestionBaseResponse):
         ingestion_id: Unique identifier for tracing
         message: Success message
         file_count: Number of files indexed from repository
+        skipped_files: Number of unchanged files skipped by incremental ingestion
+        deleted_files: Number of files whose chunks were removed because they no longer exist
+        commit_sha: Commit indexed by an incremental run
+        base_commit_sha: Previously indexed commit used as the diff base
         quarantined_documents: Number of documents quarantined due to PII
         document_count: Total documents in index
     """
 
     file_count: int = Field(..., description="Number of files from repository")
+    skipped_files: int = Field(default=0, description="Files skipped because they were unchanged")
+    deleted_files: int = Field(default=0, description="Files removed from the index because they were deleted")
+    commit_sha: str | None = Field(default=None, description="Commit indexed by an incremental run")
+    base_commit_sha: str | None = Field(
+        default=None,
+        description="Previously indexed commit the changes were computed from (None for a full walk)",
+    )
     quarantined_documents: int = Field(default=0, description="Documents quarantined due to PII")
 
 
@@ -229,6 +252,38 @@ class WebCrawlIngestionResponse(IngestionBaseResponse):
     skipped_urls: list[str] = Field(default_factory=list, description="URLs that were skipped")
 
 
+class IngestionJobAcceptedResponse(BaseModel):
+    """Response for ingestion requests queued with ``background=true``."""
+
+    request_id: str | None = Field(default=None, description="Request identifier for tracing")
+    job_id: str = Field(..., description="Ingestion job identifier")
+    status: str = Field(..., description="Initial job status")
+    status_url: str = Field(..., description="Endpoint to poll for status and progress")
+
+
+class IngestionJobResponse(BaseModel):
+    """Status of an ingestion job.
+
+    Attributes:
+        job_id: Job identifier returned when the work was queued
+        status: queued, running, succeeded or failed
+        progress: Counters reported while running (e.g. processed_files, total_files)
+        result: Endpoint response once the job succeeded
+        error: Error details once the job failed
+    """
+
+    job_id: str = Field(..., description="Ingestion job identifier")
+    kind: str = Field(..., description="Ingestion type, e.g. folder, github, s3, web")
+    workspace_id: str = Field(..., description="Workspace the job ingests into")
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    submitted_at: float = Field(..., description="Submission time (Unix seconds)")
+    started_at: float | None = Field(default=None, description="Start time (Unix seconds)")
+    finished_at: float | None = Field(default=None, description="Completion time (Unix seconds)")
+    progress: dict[str, int] = Field(default_factory=dict, description="Progress counters")
+    result: dict[str, Any] | None = Field(default=None, description="Ingestion response when succeeded")
+    error: dict[str, Any] | None = Field(default=None, description="Error details when failed")
+
+
 # ============================================================================
 # CONSTANTS
 # ============================================================================
@@ -236,6 +291,49 @@ class WebCrawlIngestionResponse(IngestionBaseResponse):
 MAX_UPLOAD_SIZE_MB = 100
 MAX_UPLOAD_SIZE_BYTES = MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
+BACKGROUND_QUERY = Query(
+    False,
+    description="Queue the ingestion as a background job and return 202 with a job ID instead of waiting.",
+)
+
+
+async def _dispatch_ingestion_job(
+    kind: str,
+    workspace_id: str,
+    factory: Any,
+    background: bool,
+) -> Any:
+    """Run an ingestion coroutine on the ingestion job workers.
+
+    The event loop never executes the pipeline itself. With ``background`` the
+    job ID is returned immediately and the request's admission slot is held
+    until the job finishes; otherwise the job result (or its exception) is
+    awaited and returned as if the endpoint had run inline.
+    """
+    manager = get_ingestion_job_manager()
+    release_admission = hand_off_admission() if background else None
+    try:
+        job = manager.submit(kind, workspace_id, factory, on_done=release_admission)
+    except JobQueueFullError as exc:
+        if release_admission is not None:
+            release_admission()
+        # Same contract as admission control: the client should back off and retry.
+        raise HTTPException(
+            status_code=429,
+            detail=f"Ingestion queue is full: {exc}",
+            headers={"Retry-After": str(settings.ingestion_admission_retry_after_seconds)},
+        ) from exc
+
+    if background:
+        accepted = IngestionJobAcceptedResponse(
+            request_id=get_request_id(),
+            job_id=job.job_id,
+            status=job.status.value,
+            status_url=f"/v1/{workspace_id}/ingestion/jobs/{job.job_id}",
+        )
+        return JSONResponse(status_code=202, content=accepted.model_dump())
+    return await manager.wait(job)
+
 
 class SecurityS3IngestionRequest(BaseModel):
     """Request payload for streaming SARIF/SPDX ingestion from S3."""
@@ -383,15 +481,19 @@ async def _ingest_security_payload(
 @router.post(
     "/{workspace_id}/index/",
     response_model=DocumentIngestionResponse,
+    dependencies=[Depends(admit_ingestion)],
     responses={
+        202: {"model": IngestionJobAcceptedResponse, "description": "Queued as a background job"},
         400: {"model": BadRequestErrorResponse, "description": "File invalid or exceeds size limit"},
+        429: {"model": TooManyRequestsErrorResponse, "description": "Ingestion capacity exhausted"},
         500: {"model": InternalServerErrorResponse, "description": "Processing failed"},
     },
 )
 async def index_document(
     workspace_id: str,
     uploaded_file: Annotated[UploadFile, File(...)],
-) -> DocumentIngestionResponse:
+    background: bool = BACKGROUND_QUERY,
+) -> DocumentIngestionResponse | JSONResponse:
     """Upload and index a single document.
 
     Accepts a single file and processes it through the preprocessing pipeline,
@@ -451,6 +553,9 @@ async def index_document(
             - Error code: `processing_failed` - Pipeline execution failed
 
     Error codes are documented in `ERROR_CODES_REFERENCE.md`
+
+    Pass ``?background=true`` to queue the work and return ``202`` with a job ID
+    to poll at ``GET /v1/{workspace_id}/ingestion/jobs/{job_id}``.
     """
     ingestion_id = str(uuid.uuid4())
     file_size = get_upload_file_size(uploaded_file)
@@ -474,6 +579,30 @@ async def index_document(
     sys.stderr.write("DEBUG: Logged upload_start\n")
     sys.stderr.flush()
 
+    file_content = await uploaded_file.read()
+    filename = uploaded_file.filename
+
+    logger.info(
+        event="document.upload_complete",
+        doc_id=filename,
+        size_bytes=len(file_content),
+    )
+
+    return await _dispatch_ingestion_job(
+        "document",
+        workspace_id,
+        lambda: _index_document(workspace_id, filename, file_content, ingestion_id),
+        background,
+    )
+
+
+async def _index_document(
+    workspace_id: str,
+    filename: str | None,
+    file_content: bytes,
+    ingestion_id: str,
+) -> DocumentIngestionResponse:
+    """Single-document ingestion body, executed on an ingestion job worker."""
     from certus_ask.services.ingestion import FileProcessor, StorageService
 
     document_store = get_document_store_for_workspace(workspace_id)
@@ -489,18 +618,10 @@ async def index_document(
     metrics = get_ingestion_metrics()
 
     try:
-        file_content = await uploaded_file.read()
-
-        logger.info(
-            event="document.upload_complete",
-            doc_id=uploaded_file.filename,
-            size_bytes=len(file_content),
-        )
-
         # Process file using FileProcessor service
         result = await file_processor.process_file(
             file_content=file_content,
-            filename=uploaded_file.filename,
+            filename=filename,
             workspace_id=workspace_id,
             ingestion_id=ingestion_id,
             upload_dir=upload_dir,
@@ -510,13 +631,13 @@ async def index_document(
         if result.get("quarantined"):
             logger.warning(
                 event="document.quarantined",
-                doc_id=uploaded_file.filename,
+                doc_id=filename,
                 reason="PII detected",
             )
 
         logger.info(
             event="document.indexed",
-            doc_id=uploaded_file.filename,
+            doc_id=filename,
             index="ask_certus",
             chunks_indexed=result["documents_written"],
         )
@@ -531,8 +652,8 @@ async def index_document(
         return DocumentIngestionResponse(
             request_id=get_request_id(),
             ingestion_id=ingestion_id,
-            message=f"Indexed document {uploaded_file.filename}",
-            document_count=document_store.count_documents(),
+            message=f"Indexed document {filename}",
+            document_count=get_document_counts().count(document_store),
             metadata_preview=result.get("metadata_preview", []),
         )
 
@@ -543,7 +664,7 @@ async def index_document(
         raise DocumentParseError(
             message="Failed to parse document",
             error_code="parse_failed",
-            details={"filename": uploaded_file.filename, "error": str(exc)},
+            details={"filename": filename, "error": str(exc)},
         ) from exc
     except Exception as exc:
         # Record failed ingestion
@@ -551,29 +672,33 @@ async def index_document(
 
         logger.error(
             event="document.indexing_failed",
-            doc_id=uploaded_file.filename,
+            doc_id=filename,
             error=str(exc),
             exc_info=True,
         )
         raise DocumentIngestionError(
             message="Failed to process document",
             error_code="ingestion_failed",
-            details={"filename": uploaded_file.filename},
+            details={"filename": filename},
         ) from exc
 
 
 @router.post(
     "/{workspace_id}/index_folder/",
     response_model=FolderIngestionResponse,
+    dependencies=[Depends(admit_ingestion)],
     responses={
+        202: {"model": IngestionJobAcceptedResponse, "description": "Queued as a background job"},
         400: {"model": BadRequestErrorResponse, "description": "Path is not a valid directory"},
+        429: {"model": TooManyRequestsErrorResponse, "description": "Ingestion capacity exhausted"},
         500: {"model": InternalServerErrorResponse, "description": "Processing failed"},
     },
 )
 async def index_folder(
     workspace_id: str,
     request: IndexFolderRequest,
-) -> FolderIngestionResponse:
+    background: bool = BACKGROUND_QUERY,
+) -> FolderIngestionResponse | JSONResponse:
     """Index all documents in a folder recursively.
 
     Walks through directory tree and processes all files matching supported
@@ -618,7 +743,20 @@ async def index_folder(
     Raises:
         HTTPException 400: If path is not a valid directory
         HTTPException 500: If critical error occurs
+
+    Pass ``?background=true`` to queue the work and return ``202`` with a job ID
+    to poll at ``GET /v1/{workspace_id}/ingestion/jobs/{job_id}``.
     """
+    return await _dispatch_ingestion_job(
+        "folder", workspace_id, lambda: _index_folder(workspace_id, request), background
+    )
+
+
+async def _index_folder(
+    workspace_id: str,
+    request: IndexFolderRequest,
+) -> FolderIngestionResponse:
+    """Folder ingestion body, executed on an ingestion job worker."""
     ingestion_id = str(uuid.uuid4())
 
     root_path = Path(request.local_directory).expanduser().resolve()
@@ -641,12 +779,15 @@ async def index_folder(
 
     try:
         # Process folder using FileProcessor service
-        result = await file_processor.process_folder(
-            folder_path=root_path,
-            workspace_id=workspace_id,
-            ingestion_id=ingestion_id,
-            recursive=True,  # Process all files recursively
-        )
+        with bulk_ingest_mode(document_store):
+            result = await file_processor.process_folder(
+                folder_path=root_path,
+                workspace_id=workspace_id,
+                ingestion_id=ingestion_id,
+                recursive=True,  # Process all files recursively
+                parallel=request.parallel,
+                incremental=request.incremental,
+            )
 
         logger.info(
             event="ingestion.folder_complete",
@@ -655,7 +796,7 @@ async def index_folder(
             processed_files=result["processed_files"],
             failed_files=result["failed_files"],
             quarantined_count=result["quarantined_count"],
-            total_documents=document_store.count_documents(),
+            total_documents=get_document_counts().count(document_store),
         )
 
         return FolderIngestionResponse(
@@ -664,8 +805,10 @@ async def index_folder(
             message=f"Indexed {result['processed_files']} files from {root_path}",
             processed_files=result["processed_files"],
             failed_files=result["failed_files"],
+            skipped_files=result.get("skipped_files", 0),
+            deleted_files=result.get("deleted_files", 0),
             quarantined_documents=result["quarantined_count"],
-            document_count=document_store.count_documents(),
+            document_count=get_document_counts().count(document_store),
             metadata_preview=result.get("metadata_preview", [])[:3],
         )
 
@@ -686,15 +829,19 @@ async def index_folder(
 @router.post(
     "/{workspace_id}/index/github",
     response_model=GitHubIngestionResponse,
+    dependencies=[Depends(admit_ingestion)],
     responses={
+        202: {"model": IngestionJobAcceptedResponse, "description": "Queued as a background job"},
         400: {"model": BadRequestErrorResponse, "description": "No files match patterns"},
+        429: {"model": TooManyRequestsErrorResponse, "description": "Ingestion capacity exhausted"},
         500: {"model": InternalServerErrorResponse, "description": "Clone or processing failed"},
     },
 )
 async def index_github_repo(
     workspace_id: str,
     request: GitRepositoryRequest,
-) -> GitHubIngestionResponse:
+    background: bool = BACKGROUND_QUERY,
+) -> GitHubIngestionResponse | JSONResponse:
     """Clone and index documents from a GitHub repository.
 
     Clones repository (optionally to specific branch) and indexes all files
@@ -745,7 +892,20 @@ async def index_github_repo(
     Raises:
         HTTPException 400: If no files match patterns or invalid patterns
         HTTPException 500: If clone or processing fails
+
+    Pass ``?background=true`` to queue the work and return ``202`` with a job ID
+    to poll at ``GET /v1/{workspace_id}/ingestion/jobs/{job_id}``.
     """
+    return await _dispatch_ingestion_job(
+        "github", workspace_id, lambda: _index_github_repo(workspace_id, request), background
+    )
+
+
+async def _index_github_repo(
+    workspace_id: str,
+    request: GitRepositoryRequest,
+) -> GitHubIngestionResponse:
+    """Repository ingestion body, executed on an ingestion job worker."""
     ingestion_id = str(uuid.uuid4())
 
     logger.info(
@@ -770,6 +930,8 @@ async def index_github_repo(
             include_globs=request.include_globs,
             exclude_globs=request.exclude_globs,
             max_file_size_kb=request.max_file_size_kb,
+            parallel=request.parallel,
+            incremental=request.incremental,
         )
 
         logger.info(
@@ -778,7 +940,7 @@ async def index_github_repo(
             repo_url=request.repo_url,
             file_count=result["file_count"],
             quarantined_count=result["quarantined_count"],
-            total_documents=document_store.count_documents(),
+            total_documents=get_document_counts().count(document_store),
         )
 
         return GitHubIngestionResponse(
@@ -786,8 +948,12 @@ async def index_github_repo(
             ingestion_id=ingestion_id,
             message=f"Indexed {result['file_count']} files from {request.repo_url}",
             file_count=result["file_count"],
+            skipped_files=result.get("skipped_files", 0),
+            deleted_files=result.get("deleted_files", 0),
+            commit_sha=result.get("commit"),
+            base_commit_sha=result.get("base_commit"),
             quarantined_documents=result["quarantined_count"],
-            document_count=document_store.count_documents(),
+            document_count=get_document_counts().count(document_store),
             metadata_preview=result.get("metadata_preview", []),
         )
 
@@ -811,8 +977,11 @@ async def index_github_repo(
 @router.post(
     "/{workspace_id}/index/security",
     response_model=SarifIngestionResponse,
+    dependencies=[Depends(admit_ingestion)],
     responses={
+        202: {"model": IngestionJobAcceptedResponse, "description": "Queued as a background job"},
         400: {"model": BadRequestErrorResponse, "description": "Invalid file or file too large"},
+        429: {"model": TooManyRequestsErrorResponse, "description": "Ingestion capacity exhausted"},
         500: {"model": InternalServerErrorResponse, "description": "Processing failed"},
     },
 )
@@ -822,7 +991,8 @@ async def index_security_file(
     format: Annotated[str, Form()] = "auto",
     tool_hint: Annotated[str | None, Form()] = None,
     schema_dict: Annotated[dict | None, Form()] = None,
-) -> SarifIngestionResponse:
+    background: bool = BACKGROUND_QUERY,
+) -> SarifIngestionResponse | JSONResponse:
     """Upload and index security files (SARIF, SPDX, or custom JSONPath-based formats).
 
     Parses security scanning format files and loads them into:
@@ -863,6 +1033,9 @@ async def index_security_file(
     Raises:
         HTTPException 400: If file invalid, exceeds size limits, or schema is invalid
         HTTPException 500: If processing fails
+
+    Pass ``?background=true`` to queue the work and return ``202`` with a job ID
+    to poll at ``GET /v1/{workspace_id}/ingestion/jobs/{job_id}``.
     """
     from certus_ask.core.config import Settings
 
@@ -897,30 +1070,57 @@ async def index_security_file(
             detail="Uploaded file is empty",
         )
 
-    return await _ingest_security_payload(
+    source_name = uploaded_file.filename or "uploaded_security_file"
+    return await _dispatch_ingestion_job(
+        "security",
         workspace_id,
-        file_bytes=file_bytes,
-        source_name=uploaded_file.filename or "uploaded_security_file",
-        requested_format=format,
-        tool_hint=tool_hint,
-        schema_dict=schema_dict,
-        ingestion_id=ingestion_id,
+        lambda: _ingest_security_payload(
+            workspace_id,
+            file_bytes=file_bytes,
+            source_name=source_name,
+            requested_format=format,
+            tool_hint=tool_hint,
+            schema_dict=schema_dict,
+            ingestion_id=ingestion_id,
+        ),
+        background,
     )
 
 
 @router.post(
     "/{workspace_id}/index/security/s3",
     response_model=SarifIngestionResponse,
+    dependencies=[Depends(admit_ingestion)],
     responses={
+        202: {"model": IngestionJobAcceptedResponse, "description": "Queued as a background job"},
         400: {"model": BadRequestErrorResponse, "description": "Invalid bucket/key or schema"},
+        429: {"model": TooManyRequestsErrorResponse, "description": "Ingestion capacity exhausted"},
         500: {"model": InternalServerErrorResponse, "description": "Processing failed"},
     },
 )
 async def index_security_file_from_s3(
     workspace_id: str,
     request: SecurityS3IngestionRequest,
+    background: bool = BACKGROUND_QUERY,
+) -> SarifIngestionResponse | JSONResponse:
+    """Stream security scans (SARIF/SPDX) directly from S3 without downloading locally.
+
+    Pass ``?background=true`` to queue the work and return ``202`` with a job ID
+    to poll at ``GET /v1/{workspace_id}/ingestion/jobs/{job_id}``.
+    """
+    return await _dispatch_ingestion_job(
+        "security_s3",
+        workspace_id,
+        lambda: _index_security_file_from_s3(workspace_id, request),
+        background,
+    )
+
+
+async def _index_security_file_from_s3(
+    workspace_id: str,
+    request: SecurityS3IngestionRequest,
 ) -> SarifIngestionResponse:
-    """Stream security scans (SARIF/SPDX) directly from S3 without downloading locally."""
+    """Security S3 ingestion body, executed on an ingestion job worker."""
     import boto3
     from botocore.exceptions import ClientError
 
@@ -1008,14 +1208,18 @@ async def index_security_file_from_s3(
 @router.post(
     "/{workspace_id}/index/web",
     response_model=WebIngestionResponse,
+    dependencies=[Depends(admit_ingestion)],
     responses={
+        202: {"model": IngestionJobAcceptedResponse, "description": "Queued as a background job"},
+        429: {"model": TooManyRequestsErrorResponse, "description": "Ingestion capacity exhausted"},
         500: {"model": InternalServerErrorResponse, "description": "Web scraping failed"},
     },
 )
 async def index_web_pages(
     workspace_id: str,
     request: WebIngestionRequest,
-) -> WebIngestionResponse:
+    background: bool = BACKGROUND_QUERY,
+) -> WebIngestionResponse | JSONResponse:
     """Scrape and index documents from web URLs.
 
     Fetches and parses web pages, extracting content for indexing.
@@ -1063,7 +1267,20 @@ async def index_web_pages(
 
     Raises:
         HTTPException 500: If scraping fails
+
+    Pass ``?background=true`` to queue the work and return ``202`` with a job ID
+    to poll at ``GET /v1/{workspace_id}/ingestion/jobs/{job_id}``.
     """
+    return await _dispatch_ingestion_job(
+        "web", workspace_id, lambda: _index_web_pages(workspace_id, request), background
+    )
+
+
+async def _index_web_pages(
+    workspace_id: str,
+    request: WebIngestionRequest,
+) -> WebIngestionResponse:
+    """Web page ingestion body, executed on an ingestion job worker."""
     ingestion_id = str(uuid.uuid4())
 
     logger.info(
@@ -1091,7 +1308,7 @@ async def index_web_pages(
             ingestion_id=ingestion_id,
             indexed_count=result["indexed_count"],
             skipped_count=result["skipped_count"],
-            total_documents=document_store.count_documents(),
+            total_documents=get_document_counts().count(document_store),
         )
 
         return WebIngestionResponse(
@@ -1100,7 +1317,7 @@ async def index_web_pages(
             message=f"Indexed {result['indexed_count']} web pages.",
             indexed_count=result["indexed_count"],
             skipped_urls=result.get("skipped_urls", []),
-            document_count=document_store.count_documents(),
+            document_count=get_document_counts().count(document_store),
             metadata_preview=result.get("metadata_preview", []),
         )
 
@@ -1122,14 +1339,18 @@ async def index_web_pages(
 @router.post(
     "/{workspace_id}/index/web/crawl",
     response_model=WebCrawlIngestionResponse,
+    dependencies=[Depends(admit_ingestion)],
     responses={
+        202: {"model": IngestionJobAcceptedResponse, "description": "Queued as a background job"},
+        429: {"model": TooManyRequestsErrorResponse, "description": "Ingestion capacity exhausted"},
         500: {"model": InternalServerErrorResponse, "description": "Web crawling failed"},
     },
 )
 async def crawl_web_domain(
     workspace_id: str,
     request: WebCrawlRequest,
-) -> WebCrawlIngestionResponse:
+    background: bool = BACKGROUND_QUERY,
+) -> WebCrawlIngestionResponse | JSONResponse:
     """Crawl and index documents from web domains.
 
     Recursively crawls website starting from seed URLs, respecting depth,
@@ -1180,7 +1401,20 @@ async def crawl_web_domain(
 
     Raises:
         HTTPException 500: If crawling fails
+
+    Pass ``?background=true`` to queue the work and return ``202`` with a job ID
+    to poll at ``GET /v1/{workspace_id}/ingestion/jobs/{job_id}``.
     """
+    return await _dispatch_ingestion_job(
+        "web_crawl", workspace_id, lambda: _crawl_web_domain(workspace_id, request), background
+    )
+
+
+async def _crawl_web_domain(
+    workspace_id: str,
+    request: WebCrawlRequest,
+) -> WebCrawlIngestionResponse:
+    """Web crawl ingestion body, executed on an ingestion job worker."""
     ingestion_id = str(uuid.uuid4())
 
     logger.info(
@@ -1233,7 +1467,7 @@ async def crawl_web_domain(
             ingestion_id=ingestion_id,
             indexed_count=len(indexed_documents),
             skipped_count=len(skipped_urls),
-            total_documents=document_store.count_documents(),
+            total_documents=get_document_counts().count(document_store),
         )
 
         metadata_preview = extract_metadata_preview(result.get("document_writer") or {})
@@ -1244,7 +1478,7 @@ async def crawl_web_domain(
             message=f"Crawled {len(indexed_documents)} pages (limit {request.max_pages}).",
             indexed_count=len(indexed_documents),
             skipped_urls=skipped_urls,
-            document_count=document_store.count_documents(),
+            document_count=get_document_counts().count(document_store),
             metadata_preview=metadata_preview,
         )
 
@@ -1266,15 +1500,19 @@ async def crawl_web_domain(
 @router.post(
     "/{workspace_id}/index/s3",
     response_model=FolderIngestionResponse,
+    dependencies=[Depends(admit_ingestion)],
     responses={
+        202: {"model": IngestionJobAcceptedResponse, "description": "Queued as a background job"},
         400: {"model": BadRequestErrorResponse, "description": "Invalid S3 path or bucket"},
+        429: {"model": TooManyRequestsErrorResponse, "description": "Ingestion capacity exhausted"},
         500: {"model": InternalServerErrorResponse, "description": "Processing failed"},
     },
 )
 async def index_s3_folder(
     workspace_id: str,
     request: S3IndexRequest,
-) -> FolderIngestionResponse:
+    background: bool = BACKGROUND_QUERY,
+) -> FolderIngestionResponse | JSONResponse:
     """Index all documents in an S3 bucket/prefix.
 
     Downloads files from S3 to temp storage, processes them through the preprocessing pipeline,
@@ -1312,7 +1550,20 @@ async def index_s3_folder(
     Raises:
         HTTPException 400: If bucket doesn't exist or prefix is invalid
         HTTPException 500: If processing fails
+
+    Pass ``?background=true`` to queue the work and return ``202`` with a job ID
+    to poll at ``GET /v1/{workspace_id}/ingestion/jobs/{job_id}``.
     """
+    return await _dispatch_ingestion_job(
+        "s3", workspace_id, lambda: _index_s3_folder(workspace_id, request), background
+    )
+
+
+async def _index_s3_folder(
+    workspace_id: str,
+    request: S3IndexRequest,
+) -> FolderIngestionResponse:
+    """S3 prefix ingestion body, executed on an ingestion job worker."""
     import boto3
     from botocore.exceptions import ClientError
 
@@ -1338,7 +1589,6 @@ async def index_s3_folder(
     )
 
     document_store = get_document_store_for_workspace(workspace_id)
-    pipeline = create_preprocessing_pipeline(document_store)
 
     # Create S3 client
     try:
@@ -1370,55 +1620,90 @@ async def index_s3_folder(
 
     # Download and process files from S3
     from certus_ask.services.ingestion import FileProcessor
+    from certus_ask.services.ingestion.ledger import IncrementalSync, compute_file_sha256, get_ingestion_ledger
 
     file_processor = FileProcessor(s3_client=s3_client)
     processed_files = 0
     failed_files = 0
+    deleted_files = 0
     quarantined_count = 0
     metadata_preview: list[dict[str, Any]] = []
+    sync = IncrementalSync(
+        get_ingestion_ledger() if request.incremental else None,
+        document_store,
+        workspace_id,
+        f"s3://{bucket_name}/{prefix}",
+    )
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with (
+        tempfile.TemporaryDirectory() as temp_dir,
+        get_pipeline_pool().acquire(document_store) as pipeline,
+        bulk_ingest_mode(document_store),
+    ):
         temp_path = Path(temp_dir)
 
-        try:
-            # List objects in S3 using FileProcessor
-            objects = file_processor.list_s3_objects(bucket_name, prefix)
-
+        def objects_to_download(objects: list[dict[str, Any]]) -> Any:
             for obj in objects:
                 if obj["Key"].endswith("/"):
                     # Skip directory markers
                     continue
+                # Unchanged ETag: skip without downloading.
+                if sync.should_skip(obj["Key"], etag=obj.get("ETag")):
+                    logger.info(event="ingestion.s3_file_unchanged", ingestion_id=ingestion_id, s3_key=obj["Key"])
+                    continue
+                yield obj
+
+        def download(s3_key: str, local_file_path: Path) -> None:
+            logger.info(
+                event="ingestion.s3_downloading",
+                ingestion_id=ingestion_id,
+                s3_key=s3_key,
+            )
+            file_processor.download_file_to_local(
+                bucket_name=bucket_name,
+                key=s3_key,
+                local_path=local_file_path,
+            )
+
+        try:
+            # List objects in S3 using FileProcessor
+            objects = file_processor.list_s3_objects(bucket_name, prefix)
 
-                s3_key = obj["Key"]
-                file_name = Path(s3_key).name
-                local_file_path = temp_path / file_name
-
-                try:
-                    logger.info(
-                        event="ingestion.s3_downloading",
-                        ingestion_id=ingestion_id,
-                        s3_key=s3_key,
-                    )
-
-                    # Download file using FileProcessor
-                    file_processor.download_file_to_local(
-                        bucket_name=bucket_name,
-                        key=s3_key,
-                        local_path=local_file_path,
-                    )
-
-                    logger.info(
-                        event="ingestion.s3_processing",
-                        ingestion_id=ingestion_id,
-                        s3_key=s3_key,
-                        local_path=str(local_file_path),
-                    )
-
-                    # Process file
-                    result = pipeline.run({
-                        "file_type_router": {"sources": [local_file_path]},
-                        "document_writer": {
-                            "metadata_context": {
+            # Later objects download while earlier ones are converted and embedded.
+            with stage_attributes(workspace_id=workspace_id, source="s3"):
+                prefetched_objects = prefetch_objects(
+                    objects_to_download(objects), download, temp_path, event_prefix="ingestion.s3"
+                )
+                for prefetched in prefetched_objects:
+                    s3_key = prefetched.key
+                    etag = prefetched.object.get("ETag")
+                    local_file_path = prefetched.local_path
+
+                    try:
+                        if prefetched.error is not None:
+                            raise DocumentIngestionError(
+                                message=f"Failed to download {s3_key}: {prefetched.error}",
+                                error_code="s3_download_failed",
+                                details={"bucket": bucket_name, "key": s3_key},
+                            )
+
+                        content_hash = compute_file_sha256(local_file_path) if sync.enabled else None
+                        if content_hash is not None and sync.should_skip(s3_key, content_hash=content_hash, etag=etag):
+                            logger.info(event="ingestion.s3_file_unchanged", ingestion_id=ingestion_id, s3_key=s3_key)
+                            continue
+
+                        logger.info(
+                            event="ingestion.s3_processing",
+                            ingestion_id=ingestion_id,
+                            s3_key=s3_key,
+                            local_path=str(local_file_path),
+                        )
+
+                        # Process file
+                        result = run_file_pipeline(
+                            pipeline,
+                            local_file_path,
+                            {
                                 "workspace_id": workspace_id,
                                 "ingestion_id": ingestion_id,
                                 "source": "s3",
@@ -1427,39 +1712,46 @@ async def index_s3_folder(
                                     "bucket": bucket_name,
                                     "s3_prefix": prefix,
                                 },
-                            }
-                        },
-                    })
-
-                    processed_files += 1
-
-                    if len(metadata_preview) < 3:
-                        writer_result = result.get("document_writer") or {}
-                        metadata_preview.extend(
-                            extract_metadata_preview(writer_result, limit=3 - len(metadata_preview))
+                            },
                         )
 
-                    # Track quarantined documents
-                    quarantined = result.get("presidio_anonymizer", {}).get("quarantined", [])
-                    if quarantined:
-                        quarantined_count += len(quarantined)
-                        logger.warning(
-                            event="ingestion.s3_file_quarantined",
+                        writer_result = result.get("document_writer") or {}
+                        if content_hash is not None:
+                            sync.commit(s3_key, content_hash, extract_document_ids(writer_result), etag=etag)
+                        processed_files += 1
+
+                        if len(metadata_preview) < 3:
+                            metadata_preview.extend(
+                                extract_metadata_preview(writer_result, limit=3 - len(metadata_preview))
+                            )
+
+                        # Track quarantined documents
+                        quarantined = result.get("presidio_anonymizer", {}).get("quarantined", [])
+                        if quarantined:
+                            quarantined_count += len(quarantined)
+                            logger.warning(
+                                event="ingestion.s3_file_quarantined",
+                                ingestion_id=ingestion_id,
+                                s3_key=s3_key,
+                                quarantined_count=len(quarantined),
+                            )
+
+                    except Exception as exc:
+                        failed_files += 1
+                        logger.error(
+                            event="ingestion.s3_file_processing_failed",
                             ingestion_id=ingestion_id,
                             s3_key=s3_key,
-                            quarantined_count=len(quarantined),
+                            error=str(exc),
+                            exc_info=True,
+                        )
+                        continue
+                    finally:
+                        report_progress(
+                            processed_files=processed_files, failed_files=failed_files, skipped_files=sync.skipped
                         )
 
-                except Exception as exc:
-                    failed_files += 1
-                    logger.error(
-                        event="ingestion.s3_file_processing_failed",
-                        ingestion_id=ingestion_id,
-                        s3_key=s3_key,
-                        error=str(exc),
-                        exc_info=True,
-                    )
-                    continue
+            deleted_files = sync.finalize()
 
         except Exception as exc:
             logger.error(
@@ -1483,8 +1775,10 @@ async def index_s3_folder(
         prefix=prefix,
         processed_files=processed_files,
         failed_files=failed_files,
+        skipped_files=sync.skipped,
+        deleted_files=deleted_files,
         quarantined_count=quarantined_count,
-        total_documents=document_store.count_documents(),
+        total_documents=get_document_counts().count(document_store),
     )
 
     return FolderIngestionResponse(
@@ -1493,7 +1787,32 @@ async def index_s3_folder(
         message=f"Indexed {processed_files} files from s3://{bucket_name}/{prefix}",
         processed_files=processed_files,
         failed_files=failed_files,
+        skipped_files=sync.skipped,
+        deleted_files=deleted_files,
         quarantined_documents=quarantined_count,
-        document_count=document_store.count_documents(),
+        document_count=get_document_counts().count(document_store),
         metadata_preview=metadata_preview[:3],
     )
+
+
+@router.get(
+    "/{workspace_id}/ingestion/jobs/{job_id}",
+    response_model=IngestionJobResponse,
+    responses={404: {"description": "Unknown job"}},
+)
+async def get_ingestion_job(workspace_id: str, job_id: str) -> IngestionJobResponse:
+    """Return the status, progress and (once finished) result of an ingestion job."""
+    job = get_ingestion_job_manager().get(job_id)
+    if job is None or job.workspace_id != workspace_id:
+        raise HTTPException(status_code=404, detail=f"Ingestion job {job_id} not found")
+    return IngestionJobResponse(**job.to_dict())
+
+
+@router.get("/{workspace_id}/ingestion/jobs", response_model=list[IngestionJobResponse])
+async def list_ingestion_jobs(
+    workspace_id: str,
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of jobs to return"),
+) -> list[IngestionJobResponse]:
+    """List recent ingestion jobs of a workspace, newest first."""
+    jobs = get_ingestion_job_manager().list(workspace_id=workspace_id, limit=limit)
+    return [IngestionJobResponse(**job.to_dict()) for job in jobs]
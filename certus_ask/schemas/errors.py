@@ -172,6 +172,23 @@ class BadRequestErrorResponse(ErrorDetailResponse):
     pass
 
 
+class TooManyRequestsErrorResponse(ErrorDetailResponse):
+    """Response for saturation errors (HTTP 429).
+
+    Indicates that the service is at capacity and the request was not admitted.
+    The ``Retry-After`` response header says when to try again.
+
+    Example:
+        >>> error = TooManyRequestsErrorResponse(
+        ...     error="ingestion_saturated",
+        ...     message="Ingestion capacity exhausted (queue_full); retry later",
+        ...     detail={"retry_after_seconds": 10}
+        ... )
+    """
+
+    pass
+
+
 class InternalServerErrorResponse(ErrorDetailResponse):
     """Response for internal server errors (HTTP 500).
 
@@ -228,6 +245,10 @@ ERROR_RESPONSES = {
         "model": ValidationErrorResponse,
         "description": "Unprocessable Entity - Request validation failed",
     },
+    429: {
+        "model": TooManyRequestsErrorResponse,
+        "description": "Too Many Requests - Service is saturated, retry after the given delay",
+    },
     500: {
         "model": InternalServerErrorResponse,
         "description": "Internal Server Error - Unexpected processing failure",
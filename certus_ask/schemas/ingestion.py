@@ -5,11 +5,23 @@ from pydantic import BaseModel, Field
 
 class IndexFolderRequest(BaseModel):
     local_directory: str = Field(..., description="Absolute or relative path to the folder containing documents.")
+    parallel: bool = Field(
+        False,
+        description="Convert files on a worker process pool and batch embedding/indexing across files.",
+    )
+    incremental: bool = Field(
+        False,
+        description="Skip files unchanged since the last ingestion and drop chunks of deleted files.",
+    )
 
 
 class S3IndexRequest(BaseModel):
     bucket_name: str = Field(..., description="S3 bucket name to scan for documents.")
     prefix: str = Field("", description="Optional prefix to filter objects.")
+    incremental: bool = Field(
+        False,
+        description="Skip files unchanged since the last ingestion and drop chunks of deleted files.",
+    )
 
 
 class S3UploadRequest(BaseModel):
@@ -35,6 +47,17 @@ class GitRepositoryRequest(BaseModel):
         ge=1,
         description="Maximum file size (KB) per file to ingest from the repository.",
     )
+    parallel: bool = Field(
+        False,
+        description="Convert files on a worker process pool and batch embedding/indexing across files.",
+    )
+    incremental: bool = Field(
+        False,
+        description=(
+            "Fetch only the commits since the last indexed one and ingest just the files they added, "
+            "modified or deleted."
+        ),
+    )
 
 
 class WebIngestionRequest(BaseModel):
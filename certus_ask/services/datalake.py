@@ -1,13 +1,19 @@
+import hashlib
 import os
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
+from boto3.s3.transfer import TransferConfig
 from botocore.client import BaseClient
 from botocore.exceptions import ClientError
 
 from certus_ask.core.config import settings
 from certus_ask.core.logging import get_logger
-from certus_integrity.services import get_analyzer, get_anonymizer
+from certus_integrity.services import analyze_cached, get_analyzer, get_anonymizer
 
 logger = get_logger(__name__)
 
@@ -59,8 +65,33 @@ def ensure_folders(client: BaseClient, bucket_name: str, folders: Iterable[str])
         raise
 
 
-def upload_file(client: BaseClient, file_path: Path, bucket_name: str, target_key: str) -> None:
-    """Upload a file to S3."""
+def transfer_config(
+    multipart_threshold_mb: int | None = None,
+    multipart_chunk_mb: int | None = None,
+    max_concurrency: int | None = None,
+) -> TransferConfig:
+    """Multipart transfer settings for datalake uploads and copies (defaults from settings.datalake_*)."""
+    if multipart_threshold_mb is None:
+        multipart_threshold_mb = settings.datalake_multipart_threshold_mb
+    if multipart_chunk_mb is None:
+        multipart_chunk_mb = settings.datalake_multipart_chunk_mb
+    if max_concurrency is None:
+        max_concurrency = settings.datalake_multipart_concurrency
+    return TransferConfig(
+        multipart_threshold=multipart_threshold_mb * 1024 * 1024,
+        multipart_chunksize=multipart_chunk_mb * 1024 * 1024,
+        max_concurrency=max(1, max_concurrency),
+    )
+
+
+def upload_file(
+    client: BaseClient,
+    file_path: Path,
+    bucket_name: str,
+    target_key: str,
+    config: TransferConfig | None = None,
+) -> None:
+    """Upload a file to S3 (multipart above the configured threshold)."""
     file_size = file_path.stat().st_size if file_path.exists() else 0
 
     logger.info(
@@ -72,7 +103,7 @@ def upload_file(client: BaseClient, file_path: Path, bucket_name: str, target_ke
     )
 
     try:
-        client.upload_file(str(file_path), bucket_name, target_key)
+        client.upload_file(str(file_path), bucket_name, target_key, Config=config or transfer_config())
         logger.info(
             "file.upload_complete",
             bucket_name=bucket_name,
@@ -89,42 +120,266 @@ def upload_file(client: BaseClient, file_path: Path, bucket_name: str, target_ke
         raise
 
 
-def upload_directory(client: BaseClient, directory: Path, bucket_name: str, target_prefix: str = "") -> None:
-    """Upload an entire directory to S3."""
+@dataclass
+class DirectoryUploadResult:
+    """Outcome of a directory upload."""
+
+    uploaded: int = 0
+    skipped: int = 0
+    uploaded_bytes: int = 0
+    failed: list[dict[str, str]] = field(default_factory=list)
+
+
+def _local_etag(file_path: Path, file_size: int, config: TransferConfig) -> tuple[str, int]:
+    """Return the ETag S3 would assign to this file uploaded with ``config``, and its part count."""
+    if file_size < config.multipart_threshold:
+        digest = hashlib.md5(usedforsecurity=False)
+        with file_path.open("rb") as handle:
+            for block in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest(), 1
+
+    part_digests = []
+    with file_path.open("rb") as handle:
+        for part in iter(lambda: handle.read(config.multipart_chunksize), b""):
+            part_digests.append(hashlib.md5(part, usedforsecurity=False).digest())
+    combined = hashlib.md5(b"".join(part_digests), usedforsecurity=False).hexdigest()
+    return f"{combined}-{len(part_digests)}", len(part_digests)
+
+
+def _already_uploaded(file_path: Path, file_size: int, existing: dict[str, Any] | None, config: TransferConfig) -> bool:
+    """True when the stored object matches the local file by ETag, or by size when the ETag is not comparable."""
+    if existing is None or existing.get("Size") != file_size:
+        return False
+    remote_etag = str(existing.get("ETag", "")).strip('"')
+    remote_parts = int(remote_etag.rsplit("-", 1)[1]) if "-" in remote_etag else 1
+    local_etag, local_parts = _local_etag(file_path, file_size, config)
+    if remote_parts != local_parts:
+        # Uploaded with a different part size: the ETag cannot be recomputed, so the size match decides.
+        return True
+    return remote_etag == local_etag
+
+
+def upload_directory(
+    client: BaseClient,
+    directory: Path,
+    bucket_name: str,
+    target_prefix: str = "",
+    max_workers: int | None = None,
+    config: TransferConfig | None = None,
+    skip_existing: bool = True,
+) -> DirectoryUploadResult:
+    """Upload an entire directory to S3 with parallel, multipart, resumable transfers.
+
+    Args:
+        client: S3 client
+        directory: Local directory to upload
+        bucket_name: Destination bucket
+        target_prefix: Key prefix for the uploaded files
+        max_workers: Files uploaded at once (default: settings.datalake_transfer_workers)
+        config: Per-file multipart settings (default: ``transfer_config()``)
+        skip_existing: Skip files whose object already exists with a matching ETag or size
+
+    Returns:
+        DirectoryUploadResult with uploaded/skipped counts and per-file failures
+    """
     directory = directory.resolve()
-    file_count = 0
+    workers = max(1, max_workers if max_workers is not None else settings.datalake_transfer_workers)
+    config = config or transfer_config()
+    result = DirectoryUploadResult()
+    pending: deque[tuple[str, int, Future]] = deque()
 
     logger.info(
         "directory.upload_start",
         bucket_name=bucket_name,
         directory=str(directory),
         target_prefix=target_prefix,
+        workers=workers,
     )
 
-    try:
+    existing: dict[str, dict[str, Any]] = {}
+    if skip_existing:
+        list_prefix = target_prefix.strip("/")
+        existing = {
+            item["Key"]: item for item in iter_objects(client, bucket_name, f"{list_prefix}/" if list_prefix else "")
+        }
+
+    def upload_one(file_path: Path, key: str, file_size: int) -> bool:
+        if skip_existing and _already_uploaded(file_path, file_size, existing.get(key), config):
+            logger.debug("file.upload_skipped", bucket_name=bucket_name, target_key=key)
+            return False
+        upload_file(client, file_path, bucket_name, key, config=config)
+        return True
+
+    def collect_oldest() -> None:
+        key, file_size, future = pending.popleft()
+        try:
+            uploaded = future.result()
+        except Exception as exc:
+            result.failed.append({"key": key, "error": str(exc)})
+            return
+        if uploaded:
+            result.uploaded += 1
+            result.uploaded_bytes += file_size
+        else:
+            result.skipped += 1
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="datalake-upload") as executor:
         for root, _, files in os.walk(directory):
             for filename in files:
                 file_path = Path(root) / filename
                 relative_path = file_path.relative_to(directory)
                 key = str(Path(target_prefix) / relative_path).replace("\\", "/")
-                upload_file(client, file_path, bucket_name, key)
-                file_count += 1
+                # Bound queued uploads so huge trees are walked as uploads complete.
+                while len(pending) >= workers * 2:
+                    collect_oldest()
+                file_size = file_path.stat().st_size
+                pending.append((key, file_size, executor.submit(upload_one, file_path, key, file_size)))
+        while pending:
+            collect_oldest()
 
-        logger.info(
-            "directory.upload_complete",
-            bucket_name=bucket_name,
-            directory=str(directory),
-            file_count=file_count,
-        )
-    except Exception as exc:
-        logger.exception(
-            "directory.upload_failed",
-            bucket_name=bucket_name,
-            directory=str(directory),
-            file_count=file_count,
-            error=str(exc),
-        )
-        raise
+    logger.info(
+        "directory.upload_complete",
+        bucket_name=bucket_name,
+        directory=str(directory),
+        file_count=result.uploaded,
+        skipped_count=result.skipped,
+        failed_count=len(result.failed),
+        uploaded_bytes=result.uploaded_bytes,
+    )
+    return result
+
+
+def iter_objects(client: BaseClient, bucket_name: str, prefix: str = "") -> Iterator[dict[str, Any]]:
+    """Yield every object under a prefix, following continuation tokens page by page."""
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        yield from page.get("Contents", [])
+
+
+def list_objects_page(
+    client: BaseClient,
+    bucket_name: str,
+    prefix: str = "",
+    delimiter: str | None = None,
+    page_size: int = 1000,
+    cursor: str | None = None,
+) -> dict[str, Any]:
+    """List one page of a bucket.
+
+    Returns:
+        Dictionary with ``objects`` (listing entries), ``prefixes`` (common
+        prefixes when a delimiter is given) and ``next_cursor`` (continuation
+        token, None on the last page)
+    """
+    params: dict[str, Any] = {"Bucket": bucket_name, "Prefix": prefix, "MaxKeys": page_size}
+    if delimiter:
+        params["Delimiter"] = delimiter
+    if cursor:
+        params["ContinuationToken"] = cursor
+    response = client.list_objects_v2(**params)
+    return {
+        "objects": response.get("Contents", []),
+        "prefixes": [item["Prefix"] for item in response.get("CommonPrefixes", [])],
+        "next_cursor": response.get("NextContinuationToken") if response.get("IsTruncated") else None,
+    }
+
+
+def copy_object(
+    client: BaseClient,
+    source_bucket: str,
+    source_key: str,
+    bucket_name: str,
+    target_key: str,
+    size: int | None = None,
+    config: TransferConfig | None = None,
+) -> None:
+    """Copy an object server-side, switching to multipart copy above the multipart threshold."""
+    config = config or transfer_config()
+    copy_source = {"Bucket": source_bucket, "Key": source_key}
+
+    logger.debug(
+        "object.copy_start",
+        source_bucket=source_bucket,
+        source_key=source_key,
+        bucket_name=bucket_name,
+        target_key=target_key,
+        size_bytes=size,
+    )
+    if size is not None and size < config.multipart_threshold:
+        client.copy_object(CopySource=copy_source, Bucket=bucket_name, Key=target_key)
+    else:
+        # Managed copy: HEADs the source and uses UploadPartCopy for large objects.
+        client.copy(copy_source, bucket_name, target_key, Config=config)
+
+
+def copy_objects(
+    client: BaseClient,
+    source_bucket: str,
+    objects: Iterable[dict[str, Any]],
+    bucket_name: str,
+    target_key: Callable[[str], str],
+    check: Callable[[str], None] | None = None,
+    max_workers: int | None = None,
+) -> tuple[list[str], list[dict[str, str]]]:
+    """Copy objects server-side with bounded concurrency.
+
+    Args:
+        client: S3 client
+        source_bucket: Bucket holding the objects
+        objects: Listing entries with ``Key`` (and ``Size`` when known); consumed lazily
+        bucket_name: Destination bucket
+        target_key: Maps a source key to its destination key
+        check: Called with each source key before copying; raising fails that key
+        max_workers: Objects copied at once (default: settings.datalake_transfer_workers)
+
+    Returns:
+        Tuple of (copied source keys, failures as ``{"key", "error"}``), both in listing order
+    """
+    workers = max(1, max_workers if max_workers is not None else settings.datalake_transfer_workers)
+    config = transfer_config()
+    copied: list[str] = []
+    failed: list[dict[str, str]] = []
+    pending: deque[tuple[str, Future]] = deque()
+
+    def copy_one(obj: dict[str, Any]) -> None:
+        key = obj["Key"]
+        if check is not None:
+            check(key)
+        copy_object(client, source_bucket, key, bucket_name, target_key(key), size=obj.get("Size"), config=config)
+
+    def collect_oldest() -> None:
+        key, future = pending.popleft()
+        try:
+            future.result()
+        except Exception as exc:
+            failed.append({"key": key, "error": str(exc)})
+            logger.exception("object.copy_failed", source_key=key, bucket_name=bucket_name, error=str(exc))
+        else:
+            copied.append(key)
+
+    logger.info("objects.copy_start", source_bucket=source_bucket, bucket_name=bucket_name, workers=workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="datalake-copy") as executor:
+        try:
+            for obj in objects:
+                # Bound in-flight copies so huge listings are never materialized up front.
+                while len(pending) >= workers * 2:
+                    collect_oldest()
+                pending.append((obj["Key"], executor.submit(copy_one, obj)))
+            while pending:
+                collect_oldest()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    logger.info(
+        "objects.copy_complete",
+        source_bucket=source_bucket,
+        bucket_name=bucket_name,
+        copied_count=len(copied),
+        failed_count=len(failed),
+    )
+    return copied, failed
 
 
 def scan_file_for_privacy_data(file_path: Path) -> list:
@@ -134,7 +389,7 @@ def scan_file_for_privacy_data(file_path: Path) -> list:
     try:
         analyzer = get_analyzer()
         text = file_path.read_text(encoding="utf-8")
-        results = analyzer.analyze(text=text, language="en")
+        results = analyze_cached(analyzer, text, language="en")
     except Exception as exc:
         logger.exception("privacy.scan_failed", file_path=str(file_path), error=str(exc))
         raise
@@ -195,12 +450,18 @@ def initialize_datalake_structure(client: BaseClient) -> None:
 
 
 __all__ = [
+    "DirectoryUploadResult",
     "bucket_exists",
+    "copy_object",
+    "copy_objects",
     "ensure_bucket",
     "ensure_folders",
     "initialize_datalake_structure",
+    "iter_objects",
+    "list_objects_page",
     "mask_file",
     "scan_file_for_privacy_data",
+    "transfer_config",
     "upload_directory",
     "upload_file",
 ]
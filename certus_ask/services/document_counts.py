@@ -0,0 +1,84 @@
+"""Cached per-index document counts for ingestion responses.
+
+Ingestion responses report the workspace's ``document_count``; querying
+``_count`` for every upload adds a full count request on large indices.
+Counts are cached per index, advanced by the document writers as they write,
+invalidated when chunks are deleted, and reconciled with ``_count`` once they
+are older than ``settings.document_count_max_age_seconds``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from functools import lru_cache
+from typing import Any
+
+import structlog
+
+from certus_ask.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+def _index_name(document_store: Any) -> str | None:
+    index = getattr(document_store, "_index", None)
+    return index if isinstance(index, str) else None
+
+
+class DocumentCountCache:
+    """Per-index document counters, periodically reconciled with the index."""
+
+    def __init__(self, max_age_seconds: float):
+        """Initialize the cache.
+
+        Args:
+            max_age_seconds: Age after which a count is re-read from the index (0 disables caching)
+        """
+        self.max_age_seconds = max_age_seconds
+        self._counts: dict[str, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def count(self, document_store: Any) -> int:
+        """Return the store's document count, querying the index only if the cached value is stale."""
+        index = _index_name(document_store)
+        if index is None or self.max_age_seconds <= 0:
+            return document_store.count_documents()
+
+        now = time.monotonic()
+        with self._lock:
+            cached = self._counts.get(index)
+        if cached is not None and now - cached[1] < self.max_age_seconds:
+            return cached[0]
+
+        count = document_store.count_documents()
+        with self._lock:
+            self._counts[index] = (count, now)
+        logger.debug("document_counts.reconciled", index=index, count=count)
+        return count
+
+    def add(self, document_store: Any, written: int) -> None:
+        """Advance the cached count after documents were written."""
+        index = _index_name(document_store)
+        if index is None or not written:
+            return
+        with self._lock:
+            cached = self._counts.get(index)
+            if cached is not None:
+                self._counts[index] = (cached[0] + written, cached[1])
+
+    def invalidate(self, document_store: Any) -> None:
+        """Drop the cached count so the next read queries the index (e.g. after deletes)."""
+        index = _index_name(document_store)
+        if index is not None:
+            with self._lock:
+                self._counts.pop(index, None)
+
+
+@lru_cache(maxsize=1)
+def get_document_counts() -> DocumentCountCache:
+    """Get the process-wide document count cache."""
+    return DocumentCountCache(settings.document_count_max_age_seconds)
+
+
+__all__ = ["DocumentCountCache", "get_document_counts"]
@@ -0,0 +1,160 @@
+"""Persistent cache of chunk embeddings keyed by model and content hash.
+
+Re-ingesting unchanged documents, and security findings that repeat the same
+rule text, would otherwise recompute identical embeddings. Vectors are stored
+as float32 blobs in SQLite, keyed by ``(model, sha256(text))``, and the least
+recently used entries are evicted once the configured size is exceeded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from certus_ask.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (model, text_hash)
+);
+CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used);
+"""
+
+# SQLite limits the number of bound parameters per statement.
+_LOOKUP_CHUNK = 500
+
+
+def hash_text(text: str) -> str:
+    """Return the hex SHA-256 of a chunk's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _pack(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+class EmbeddingCache:
+    """SQLite-backed ``(model, text hash) -> embedding`` store with LRU eviction."""
+
+    def __init__(self, path: str | Path, max_entries: int = 1_000_000):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: SQLite database file, or ":memory:"
+            max_entries: Entries kept before the least recently used are evicted
+        """
+        self.path = str(path)
+        self.max_entries = max(1, max_entries)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._size = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_many(self, model: str, text_hashes: Iterable[str]) -> dict[str, list[float]]:
+        """Return cached vectors for the given hashes and refresh their recency.
+
+        Args:
+            model: Embedding model identifier
+            text_hashes: Chunk text hashes (see ``hash_text``)
+
+        Returns:
+            Mapping of hash to vector for the hashes found in the cache
+        """
+        wanted = list(dict.fromkeys(text_hashes))
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for start in range(0, len(wanted), _LOOKUP_CHUNK):
+                chunk = wanted[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                query = f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})"  # noqa: S608
+                rows = self._conn.execute(query, (model, *chunk)).fetchall()
+                found.update((text_hash, _unpack(vector)) for text_hash, vector in rows)
+            if found:
+                with self._conn:
+                    now = time.time()
+                    self._conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash = ?",
+                        [(now, model, text_hash) for text_hash in found],
+                    )
+            self.hits += len(found)
+            self.misses += len(wanted) - len(found)
+        return found
+
+    def put_many(self, model: str, vectors: dict[str, Sequence[float]]) -> None:
+        """Store vectors keyed by text hash, evicting old entries if the cache is full."""
+        if not vectors:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (model, text_hash, vector, last_used) VALUES (?, ?, ?, ?)",
+                [(model, text_hash, _pack(vector), now) for text_hash, vector in vectors.items()],
+            )
+            # Re-count inside the write transaction: other processes may share the file.
+            self._size = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            overflow = self._size - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM embeddings WHERE rowid IN (SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (overflow,),
+                )
+                self._size -= overflow
+                logger.info("embedding_cache.evicted", evicted=overflow, entries=self._size)
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry count and lookup hit rate since start."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": self._size,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache(maxsize=1)
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Get the process-wide embedding cache, or None when disabled."""
+    if not settings.embedding_cache_enabled:
+        return None
+    try:
+        return EmbeddingCache(settings.embedding_cache_path, max_entries=settings.embedding_cache_max_entries)
+    except (OSError, sqlite3.Error) as exc:
+        # Embedding still works without the cache; never fail ingestion over it.
+        logger.warning("embedding_cache.unavailable", path=settings.embedding_cache_path, error=str(exc))
+        return None
+
+
+__all__ = ["EmbeddingCache", "get_embedding_cache", "hash_text"]
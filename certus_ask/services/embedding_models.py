@@ -0,0 +1,283 @@
+"""Process-wide registry of sentence-transformers embedding models.
+
+Document embedders, the security ingestion path and the RAG query embedder
+all use the same model. Loading it once per process and sharing the instance
+avoids holding several copies of the same weights per worker and removes the
+model cold start from every ingest.
+
+On CPU-only nodes the model can run through ONNX Runtime or int8 dynamic
+quantization instead of fp32 PyTorch (``settings.embedding_backend``). Such
+backends are compared with the fp32 model on load and replaced by it if their
+vectors drift too far.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any
+
+import structlog
+
+from certus_ask.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+@dataclass
+class EmbeddingModelStats:
+    """Load and usage statistics for a registered model."""
+
+    load_time_ms: int = 0
+    memory_bytes: int = 0
+    hits: int = 0
+    loaded_at: float = 0.0
+    backend: str = "torch"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "load_time_ms": self.load_time_ms,
+            "memory_bytes": self.memory_bytes,
+            "hits": self.hits,
+            "loaded_at": self.loaded_at,
+            "backend": self.backend,
+        }
+
+
+EMBEDDING_BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+
+# Short, varied texts used to compare a quantized/ONNX backend against the fp32 model.
+DRIFT_SAMPLE_TEXTS = [
+    "SQL injection vulnerability in the login form allows authentication bypass.",
+    "The service account key was rotated and stored in the secrets manager.",
+    "Install the package with pip and run the test suite before opening a pull request.",
+    "Quarterly revenue grew eight percent driven by subscription renewals.",
+    "CVE-2021-44228 remote code execution in Apache Log4j JNDI lookups.",
+    "def add(a, b):\n    return a + b",
+    "Personal data must be deleted within thirty days of the account closure request.",
+    "Kubernetes pods are restarted when the liveness probe fails three times.",
+]
+
+
+def _load_sentence_transformer(model_name: str, device: str | None, backend: str = "torch") -> Any:
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "torch":
+        return SentenceTransformer(model_name, device=device)
+    if backend == "torch-int8":
+        import torch
+
+        # Dynamic int8 quantization of the Linear layers; CPU only.
+        model = SentenceTransformer(model_name, device="cpu")
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    if backend == "onnx":
+        return SentenceTransformer(model_name, device=device, backend="onnx")
+    if backend == "onnx-int8":
+        return SentenceTransformer(
+            model_name,
+            device=device,
+            backend="onnx",
+            model_kwargs={"file_name": settings.embedding_onnx_int8_file},
+        )
+    raise ValueError(f"Unknown embedding backend '{backend}'; expected one of {', '.join(EMBEDDING_BACKENDS)}")
+
+
+def measure_embedding_drift(candidate: Any, baseline: Any, texts: list[str] | None = None) -> dict[str, Any]:
+    """Compare a candidate model's embeddings against a baseline model.
+
+    Args:
+        candidate: Model with ``encode`` (e.g. ONNX or int8 backend)
+        baseline: Reference fp32 model with ``encode``
+        texts: Sample texts (default: DRIFT_SAMPLE_TEXTS)
+
+    Returns:
+        Dictionary with ``dimension``, ``baseline_dimension``, ``min_cosine`` and ``mean_cosine``
+    """
+    import numpy as np
+
+    texts = texts or DRIFT_SAMPLE_TEXTS
+    got = np.asarray(candidate.encode(texts, show_progress_bar=False), dtype=np.float32)
+    expected = np.asarray(baseline.encode(texts, show_progress_bar=False), dtype=np.float32)
+    result: dict[str, Any] = {"dimension": int(got.shape[-1]), "baseline_dimension": int(expected.shape[-1])}
+    if got.shape != expected.shape:
+        return {**result, "min_cosine": 0.0, "mean_cosine": 0.0}
+
+    norms = np.linalg.norm(got, axis=1) * np.linalg.norm(expected, axis=1)
+    cosines = (got * expected).sum(axis=1) / np.maximum(norms, 1e-12)
+    return {**result, "min_cosine": float(cosines.min()), "mean_cosine": float(cosines.mean())}
+
+
+def _load_with_backend(model_name: str, device: str | None, backend: str) -> tuple[Any, str]:
+    """Load a model with the requested backend, falling back to fp32 if it drifts too far.
+
+    Returns:
+        Tuple of (model, backend the model actually runs on)
+    """
+    model = _load_sentence_transformer(model_name, device, backend)
+    if backend == "torch" or not settings.embedding_backend_drift_check:
+        return model, backend
+
+    baseline = _load_sentence_transformer(model_name, device, "torch")
+    drift = measure_embedding_drift(model, baseline)
+    if drift["dimension"] != drift["baseline_dimension"] or drift["min_cosine"] < settings.embedding_backend_min_cosine:
+        logger.error(
+            "embedding_model.backend_drift_exceeded",
+            model=model_name,
+            backend=backend,
+            min_cosine_required=settings.embedding_backend_min_cosine,
+            **drift,
+        )
+        return baseline, "torch"
+
+    logger.info("embedding_model.backend_drift", model=model_name, backend=backend, **drift)
+    return model, backend
+
+
+def embedding_cache_key(model_name: str, device: str | None = None) -> str:
+    """Key under which a model's embeddings are cached (backends may differ slightly from fp32).
+
+    Uses the backend the shared model was actually loaded with, so vectors from
+    an fp32 fallback never share a key with quantized ones. Until the model is
+    loaded the configured backend is assumed.
+    """
+    backend = get_embedding_model_registry().loaded_backend(model_name, device) or settings.embedding_backend
+    return model_name if backend == "torch" else f"{model_name}@{backend}"
+
+
+def _model_memory_bytes(model: Any) -> int:
+    """Estimate the in-memory size of a torch model's parameters and buffers."""
+    try:
+        tensors = list(model.parameters()) + list(model.buffers())
+        return int(sum(tensor.numel() * tensor.element_size() for tensor in tensors))
+    except Exception:  # pragma: no cover - non-torch backends
+        return 0
+
+
+class EmbeddingModelRegistry:
+    """Loads each embedding model once per process and hands out the shared instance."""
+
+    def __init__(self, loader: Any = None, backend: str | None = None):
+        """Initialize the registry.
+
+        Args:
+            loader: Callable ``(model_name, device) -> model`` (default: SentenceTransformer
+                with the configured backend)
+            backend: Inference backend, one of EMBEDDING_BACKENDS (default: settings.embedding_backend)
+        """
+        self.backend = backend or settings.embedding_backend
+        self._loader = loader or partial(_load_with_backend, backend=self.backend)
+        # The default loader also reports the backend it ended up using.
+        self._loader_reports_backend = loader is None
+        self._models: dict[tuple[str, str | None], Any] = {}
+        self._stats: dict[tuple[str, str | None], EmbeddingModelStats] = {}
+        self._load_locks: dict[tuple[str, str | None], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_name: str = DEFAULT_EMBEDDING_MODEL, device: str | None = None) -> Any:
+        """Return the shared model instance, loading it on first use.
+
+        Args:
+            model_name: sentence-transformers model identifier
+            device: Optional torch device (e.g. "cpu", "cuda")
+
+        Returns:
+            Loaded model instance shared by all callers
+        """
+        key = (model_name, device)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._stats[key].hits += 1
+                return model
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Load outside the registry lock so other models stay available while this one loads.
+        with load_lock:
+            with self._lock:
+                model = self._models.get(key)
+                if model is not None:
+                    self._stats[key].hits += 1
+                    return model
+
+            logger.info("embedding_model.load_start", model=model_name, device=device, backend=self.backend)
+            start_time = time.time()
+            try:
+                loaded = self._loader(model_name, device)
+            except Exception as exc:
+                logger.error(
+                    "embedding_model.load_failed",
+                    model=model_name,
+                    device=device,
+                    error=str(exc),
+                    exc_info=True,
+                )
+                raise
+
+            model, backend = loaded if self._loader_reports_backend else (loaded, self.backend)
+            stats = EmbeddingModelStats(
+                load_time_ms=int((time.time() - start_time) * 1000),
+                memory_bytes=_model_memory_bytes(model),
+                hits=1,
+                loaded_at=time.time(),
+                backend=backend,
+            )
+            with self._lock:
+                self._models[key] = model
+                self._stats[key] = stats
+
+            logger.info(
+                "embedding_model.load_complete",
+                model=model_name,
+                device=device,
+                load_time_ms=stats.load_time_ms,
+                memory_bytes=stats.memory_bytes,
+                backend=backend,
+            )
+            return model
+
+    def is_loaded(self, model_name: str = DEFAULT_EMBEDDING_MODEL, device: str | None = None) -> bool:
+        """Return True if the model has already been loaded."""
+        with self._lock:
+            return (model_name, device) in self._models
+
+    def loaded_backend(self, model_name: str = DEFAULT_EMBEDDING_MODEL, device: str | None = None) -> str | None:
+        """Return the backend the model was loaded with, or None if it is not loaded."""
+        with self._lock:
+            stats = self._stats.get((model_name, device))
+            return stats.backend if stats is not None else None
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-model load time, memory footprint and hit counts."""
+        with self._lock:
+            return {
+                (model_name if device is None else f"{model_name}@{device}"): stats.to_dict()
+                for (model_name, device), stats in self._stats.items()
+            }
+
+    def clear(self) -> None:
+        """Drop all loaded models (mainly for tests)."""
+        with self._lock:
+            self._models.clear()
+            self._stats.clear()
+            self._load_locks.clear()
+
+
+@lru_cache(maxsize=1)
+def get_embedding_model_registry() -> EmbeddingModelRegistry:
+    """Get the process-wide embedding model registry."""
+    return EmbeddingModelRegistry()
+
+
+__all__ = [
+    "DEFAULT_EMBEDDING_MODEL",
+    "EMBEDDING_BACKENDS",
+    "EmbeddingModelRegistry",
+    "EmbeddingModelStats",
+    "embedding_cache_key",
+    "get_embedding_model_registry",
+    "measure_embedding_drift",
+]
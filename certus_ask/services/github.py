@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+import base64
+import hashlib
 import shutil
 import tempfile
+import threading
 from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import structlog
+
 from certus_ask.core.config import settings
 
 GIT_EXTRA_MESSAGE = "Git integration requires the 'git' extra. Install with: pip install 'certus-tap[git]'"
 
 # Import guards for optional git integration dependencies
 try:
-    from git import Repo
+    from git import GitCommandError, Repo
 except ImportError as exc:
     raise ImportError(GIT_EXTRA_MESSAGE) from exc
 
+logger = structlog.get_logger(__name__)
+
 DEFAULT_INCLUDE_GLOBS = [
     "**/*.md",
     "**/*.mdx",
@@ -67,33 +75,168 @@ def clone_repository(repo_url: str, branch: str | None = None) -> GitRepository:
     return GitRepository(tmp_dir)
 
 
+class RepositoryCheckout:
+    """Persistent shallow checkout of a repository branch, locked while in use."""
+
+    def __init__(self, path: Path, head_commit: str, lock: threading.Lock) -> None:
+        self.path = path
+        self.head_commit = head_commit
+        self._lock = lock
+
+    def __enter__(self) -> RepositoryCheckout:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        self._lock.release()
+
+
+@dataclass
+class RepositoryChanges:
+    """Paths (relative, POSIX) changed between two commits."""
+
+    changed: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+
+
+_checkout_locks: dict[Path, threading.Lock] = {}
+_checkout_locks_guard = threading.Lock()
+
+
+def _checkout_lock(path: Path) -> threading.Lock:
+    with _checkout_locks_guard:
+        return _checkout_locks.setdefault(path, threading.Lock())
+
+
+def sync_repository(repo_url: str, branch: str | None = None) -> RepositoryCheckout:
+    """Bring the cached checkout of ``repo_url``/``branch`` up to date and lock it.
+
+    The first call clones with depth 1 into ``settings.github_cache_dir``; later
+    calls fetch only the objects added since the cached head. The access token
+    is passed to each git command through its environment, so it never appears
+    in the checkout's git config, the command line or git error messages.
+
+    Returns:
+        RepositoryCheckout to use as a context manager; the lock is released on exit.
+    """
+    key = hashlib.sha256(f"{repo_url}@{branch or ''}".encode()).hexdigest()[:16]
+    path = Path(settings.github_cache_dir).expanduser().resolve() / key
+    lock = _checkout_lock(path)
+    lock.acquire()
+    try:
+        head_commit = _update_checkout(path, repo_url, branch)
+    except Exception:
+        lock.release()
+        raise
+    return RepositoryCheckout(path, head_commit, lock)
+
+
+def _update_checkout(path: Path, repo_url: str, branch: str | None) -> str:
+    auth_env = _auth_env(repo_url)
+    if (path / ".git").is_dir():
+        try:
+            repo = Repo(path)
+            repo.git.fetch(repo_url, branch or "HEAD", depth=1, env=auth_env)
+            repo.git.reset("--hard", "FETCH_HEAD")
+            repo.git.clean("-ffdx")
+            head_commit = repo.head.commit.hexsha
+            logger.info("github.checkout_fetched", repo_url=repo_url, branch=branch, commit=head_commit)
+            return head_commit
+        except GitCommandError as exc:
+            # Only the exit status: git output may echo remote URLs or credentials.
+            logger.warning("github.checkout_reset", repo_url=repo_url, branch=branch, status=exc.status)
+            shutil.rmtree(path, ignore_errors=True)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    clone_kwargs = {"depth": 1}
+    if branch:
+        clone_kwargs["branch"] = branch
+    repo = Repo.clone_from(repo_url, path, env=auth_env, **clone_kwargs)  # type: ignore[arg-type]
+    if repo.submodules:
+        repo.git.submodule("deinit", "--all")
+    head_commit = repo.head.commit.hexsha
+    logger.info("github.checkout_cloned", repo_url=repo_url, branch=branch, commit=head_commit)
+    return head_commit
+
+
+def diff_repository(repo_path: Path, base_commit: str, head_commit: str) -> RepositoryChanges | None:
+    """List files added, modified or deleted between two commits.
+
+    Returns:
+        RepositoryChanges, or None when ``base_commit`` is not available locally
+        (e.g. the cache was rebuilt or history was rewritten) and a full walk is needed.
+    """
+    repo = Repo(repo_path)
+    try:
+        repo.git.cat_file("-e", f"{base_commit}^{{commit}}")
+    except GitCommandError:
+        return None
+
+    changes = RepositoryChanges()
+    # -z keeps paths unquoted: alternating NUL-separated status and path fields.
+    fields = repo.git.diff("--name-status", "--no-renames", "-z", base_commit, head_commit).split("\0")
+    for status, rel_path in zip(fields[::2], fields[1::2]):
+        if not rel_path:
+            continue
+        if status.startswith("D"):
+            changes.deleted.append(rel_path)
+        else:
+            changes.changed.append(rel_path)
+    return changes
+
+
+def _matches_filters(path: Path, rel: Path, includes: list[str], excludes: list[str], max_bytes: int) -> bool:
+    if excludes and any(rel.match(pattern) for pattern in excludes):
+        return False
+    if includes and not any(rel.match(pattern) for pattern in includes):
+        return False
+    try:
+        return path.stat().st_size <= max_bytes
+    except OSError:
+        return False
+
+
 def iter_repository_files(
     repo_path: Path,
     include_globs: Iterable[str] | None = None,
     exclude_globs: Iterable[str] | None = None,
     max_file_size_kb: int = 256,
+    paths: Iterable[str] | None = None,
 ) -> list[Path]:
+    """Return repository files matching the include/exclude globs and size limit.
+
+    Args:
+        paths: Optional relative paths to consider instead of walking the whole tree
+    """
     includes = list(include_globs or DEFAULT_INCLUDE_GLOBS)
     excludes = list(exclude_globs or DEFAULT_EXCLUDE_GLOBS)
     max_bytes = max(1, max_file_size_kb) * 1024
+    candidates = (repo_path / rel for rel in paths) if paths is not None else repo_path.rglob("*")
     files: list[Path] = []
-    for path in repo_path.rglob("*"):
+    for path in candidates:
         if not path.is_file():
             continue
-        rel = path.relative_to(repo_path)
-        if excludes and any(rel.match(pattern) for pattern in excludes):
-            continue
-        if includes and not any(rel.match(pattern) for pattern in includes):
-            continue
-        try:
-            if path.stat().st_size > max_bytes:
-                continue
-        except OSError:
-            continue
-        files.append(path)
+        if _matches_filters(path, path.relative_to(repo_path), includes, excludes, max_bytes):
+            files.append(path)
     return files
 
 
+def _auth_env(repo_url: str) -> dict[str, str] | None:
+    """Git environment supplying the access token as an HTTP header for one command.
+
+    Unlike ``_inject_token`` this keeps the token out of the URL, so it cannot
+    leak through git's error messages or the stored remote URL.
+    """
+    token = settings.github_token
+    if not token or not repo_url.startswith("https://") or "@" in repo_url.split("://", 1)[1]:
+        return None
+    credentials = base64.b64encode(f"x-access-token:{token}".encode()).decode()
+    return {
+        "GIT_CONFIG_COUNT": "1",
+        "GIT_CONFIG_KEY_0": "http.extraHeader",
+        "GIT_CONFIG_VALUE_0": f"Authorization: Basic {credentials}",
+    }
+
+
 def _inject_token(repo_url: str) -> str:
     token = settings.github_token
     if not token or not repo_url.startswith("https://"):
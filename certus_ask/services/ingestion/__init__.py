@@ -20,6 +20,7 @@ from certus_ask.services.ingestion.storage_service import StorageService
 from certus_ask.services.ingestion.utils import (
     compute_sha256_digest,
     enforce_verified_digest,
+    extract_document_ids,
     extract_filename_from_source,
     extract_metadata_preview,
     get_upload_file_size,
@@ -33,6 +34,7 @@ __all__ = [
     "StorageService",
     "compute_sha256_digest",
     "enforce_verified_digest",
+    "extract_document_ids",
     "extract_filename_from_source",
     # Utility functions
     "extract_metadata_preview",
@@ -0,0 +1,294 @@
+"""Admission control for ingestion endpoints.
+
+Each ingestion request builds or checks out a pipeline, loads models and
+competes for the same cores and memory, so unbounded concurrency turns
+overload into OOM kills. Ingestion routes are admitted through a per-process
+controller instead: at most ``settings.ingestion_admission_max_concurrent``
+requests run at once, up to ``settings.ingestion_admission_max_queued`` more
+wait (for at most ``settings.ingestion_admission_max_wait_seconds``) in FIFO
+order, and anything beyond that is rejected with ``429`` and ``Retry-After``.
+
+A request queued as a background job hands its slot to the job
+(``hand_off_admission``), so the slot stays taken until the job finishes
+rather than until the ``202`` response is sent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+
+import structlog
+from fastapi import HTTPException, Request
+from opentelemetry import metrics
+
+from certus_ask.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+meter = metrics.get_meter("certus.ask.admission")
+
+admission_wait = meter.create_histogram(
+    "ingestion_admission_wait_seconds",
+    description="Time ingestion requests waited for an admission slot",
+    unit="s",
+)
+
+admission_queue_depth = meter.create_up_down_counter(
+    "ingestion_admission_queue_depth",
+    description="Ingestion requests waiting for an admission slot",
+    unit="1",
+)
+
+admission_rejections = meter.create_counter(
+    "ingestion_admission_rejections_total",
+    description="Ingestion requests rejected because the service was saturated",
+    unit="1",
+)
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when an ingestion request cannot be admitted."""
+
+    def __init__(self, message: str, retry_after_seconds: int):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class AdmissionController:
+    """Concurrency cap with a bounded FIFO wait queue.
+
+    Waiters are futures on the caller's event loop, woken thread-safely, so the
+    controller can be shared by requests on any loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int | None = None,
+        max_queued: int | None = None,
+        max_wait_seconds: float | None = None,
+        retry_after_seconds: int | None = None,
+    ):
+        """Initialize the controller.
+
+        Args:
+            max_concurrent: Requests admitted at once
+            max_queued: Requests allowed to wait for a slot
+            max_wait_seconds: Longest wait before rejection (0 = wait indefinitely)
+            retry_after_seconds: Retry-After sent on rejection
+
+        Unset arguments default to the matching ``settings.ingestion_admission_*`` value.
+        """
+        if max_concurrent is None:
+            max_concurrent = settings.ingestion_admission_max_concurrent
+        if max_queued is None:
+            max_queued = settings.ingestion_admission_max_queued
+        if max_wait_seconds is None:
+            max_wait_seconds = settings.ingestion_admission_max_wait_seconds
+        if retry_after_seconds is None:
+            retry_after_seconds = settings.ingestion_admission_retry_after_seconds
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max(0, max_queued)
+        self.max_wait_seconds = max_wait_seconds
+        self.retry_after_seconds = max(1, retry_after_seconds)
+        self._active = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+        self.admitted = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_observed_wait_seconds = 0.0
+
+    def _reject(self, route: str, reason: str) -> AdmissionRejectedError:
+        self.rejected += 1
+        admission_rejections.add(1, {"route": route, "reason": reason})
+        logger.warning(
+            "ingestion_admission.rejected",
+            route=route,
+            reason=reason,
+            active=self._active,
+            queued=len(self._waiters),
+        )
+        return AdmissionRejectedError(
+            f"Ingestion capacity exhausted ({reason}); retry later", retry_after_seconds=self.retry_after_seconds
+        )
+
+    async def acquire(self, route: str = "ingestion") -> float:
+        """Wait for a slot and return the time spent waiting.
+
+        Raises:
+            AdmissionRejectedError: If the wait queue is full or the wait times out
+        """
+        start_time = time.monotonic()
+        with self._lock:
+            if self._active < self.max_concurrent and not self._waiters:
+                self._active += 1
+                self.admitted += 1
+                admission_wait.record(0.0, {"route": route})
+                return 0.0
+            if len(self._waiters) >= self.max_queued:
+                raise self._reject(route, "queue_full")
+            loop = asyncio.get_running_loop()
+            waiter = loop.create_future()
+            entry = (loop, waiter)
+            self._waiters.append(entry)
+        admission_queue_depth.add(1, {"route": route})
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.max_wait_seconds or None)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            with self._lock:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    granted = False
+                else:
+                    # The slot was handed over just as the wait ended; pass it on.
+                    granted = True
+            if granted:
+                self.release()
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            with self._lock:
+                raise self._reject(route, "wait_timeout") from exc
+        finally:
+            admission_queue_depth.add(-1, {"route": route})
+
+        waited = time.monotonic() - start_time
+        admission_wait.record(waited, {"route": route})
+        with self._lock:
+            self.admitted += 1
+            self.total_wait_seconds += waited
+            self.max_observed_wait_seconds = max(self.max_observed_wait_seconds, waited)
+        return waited
+
+    def release(self) -> None:
+        """Free a slot, handing it directly to the oldest waiter."""
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                if not waiter.done():
+                    # The slot moves to the waiter, so the active count is unchanged.
+                    loop.call_soon_threadsafe(_grant, waiter)
+                    return
+            self._active -= 1
+
+    @asynccontextmanager
+    async def admit(self, route: str = "ingestion") -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire(route)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            admitted = self.admitted
+            return {
+                "max_concurrent": self.max_concurrent,
+                "max_queued": self.max_queued,
+                "active": self._active,
+                "queued": len(self._waiters),
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.total_wait_seconds * 1000 / admitted, 1) if admitted else 0.0,
+                "max_wait_ms": round(self.max_observed_wait_seconds * 1000, 1),
+            }
+
+
+def _grant(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class _AdmissionSlot:
+    """A slot held by an admitted request, which a background job can take over."""
+
+    def __init__(self, controller: AdmissionController):
+        self._controller = controller
+        self._released = False
+        self._lock = threading.Lock()
+        self.handed_off = False
+
+    def release(self) -> None:
+        """Free the slot; later calls are no-ops."""
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._controller.release()
+
+
+_current_slot: contextvars.ContextVar[_AdmissionSlot | None] = contextvars.ContextVar("admission_slot", default=None)
+
+
+def hand_off_admission() -> Callable[[], None] | None:
+    """Transfer the current request's admission slot to work that outlives the request.
+
+    The request no longer frees the slot when it returns; the caller must call
+    the returned function once that work finishes (calling it more than once
+    is harmless).
+
+    Returns:
+        Function releasing the slot, or None outside an admitted request
+    """
+    slot = _current_slot.get()
+    if slot is None or slot.handed_off:
+        return None
+    slot.handed_off = True
+    return slot.release
+
+
+@lru_cache(maxsize=1)
+def get_admission_controller() -> AdmissionController | None:
+    """Get the process-wide ingestion admission controller, or None when disabled."""
+    if settings.ingestion_admission_max_concurrent <= 0:
+        return None
+    return AdmissionController()
+
+
+async def admit_ingestion(request: Request) -> AsyncIterator[None]:
+    """FastAPI dependency holding an admission slot for the duration of an ingestion request.
+
+    Background jobs keep the slot past the response via ``hand_off_admission``.
+
+    Raises:
+        HTTPException: 429 with ``Retry-After`` when the service is saturated
+    """
+    controller = get_admission_controller()
+    if controller is None:
+        yield
+        return
+
+    route = getattr(request.scope.get("route"), "path", request.url.path)
+    try:
+        await controller.acquire(route)
+    except AdmissionRejectedError as exc:
+        raise HTTPException(
+            status_code=429,
+            detail=str(exc),
+            headers={"Retry-After": str(exc.retry_after_seconds)},
+        ) from exc
+    slot = _AdmissionSlot(controller)
+    _current_slot.set(slot)
+    try:
+        yield
+    finally:
+        if not slot.handed_off:
+            slot.release()
+
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionRejectedError",
+    "admit_ingestion",
+    "get_admission_controller",
+    "hand_off_admission",
+]
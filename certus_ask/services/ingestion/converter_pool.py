@@ -0,0 +1,301 @@
+"""Isolated, resource-limited worker processes for binary format converters.
+
+PDF, DOCX and PPTX parsing runs third-party code over untrusted input, and a
+single pathological file can pin a CPU or grow memory without bound. These
+converters run in a pool of spawned worker processes instead: each worker has
+an address-space limit, each file gets a CPU-time budget, and a file may run
+for at most ``settings.converter_timeout_seconds`` once a worker picks it up.
+A file that breaches a limit is reported as a per-file failure. A file that
+hangs gets its pool terminated and rebuilt; other files that were running on
+that pool are resubmitted to the new one rather than failed.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import signal
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from functools import lru_cache
+from typing import Any
+
+import structlog
+
+from certus_ask.core.config import settings
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+logger = structlog.get_logger(__name__)
+
+# Pipeline component name -> Haystack converter class, resolved inside the worker.
+ISOLATED_CONVERTERS = {
+    "pdf_converter": "PyPDFToDocument",
+    "docx_converter": "DOCXToDocument",
+    "pptx_converter": "PPTXToDocument",
+}
+
+
+# How often a caller waiting for an idle worker re-checks for a replaced pool.
+_SLOT_POLL_SECONDS = 0.5
+# Runs per file when its pool breaks; a file that breaks two pools is failed.
+_MAX_ATTEMPTS = 2
+
+
+class ConversionLimitExceeded(RuntimeError):
+    """Raised inside a worker when a file exhausts its CPU-time budget."""
+
+
+# Per-worker-process state.
+_worker_converters: dict[str, Any] = {}
+_cpu_limit_hit = False
+
+
+def _on_cpu_limit(signum: int, frame: Any) -> None:
+    global _cpu_limit_hit
+    _cpu_limit_hit = True
+    raise ConversionLimitExceeded("CPU time limit exceeded")
+
+
+def _init_worker(memory_mb: int) -> None:
+    """Apply the memory limit and install the CPU-limit handler (runs once per worker)."""
+    if resource is None:
+        return
+    if memory_mb > 0:
+        limit = memory_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    signal.signal(signal.SIGXCPU, _on_cpu_limit)
+
+
+def _set_cpu_budget(cpu_seconds: int | None) -> None:
+    # RLIMIT_CPU counts the worker's lifetime usage, so the soft limit is moved per file.
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if cpu_seconds is None or cpu_seconds <= 0:
+        resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + 1 + cpu_seconds
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _get_worker_converter(converter_name: str) -> Any:
+    converter = _worker_converters.get(converter_name)
+    if converter is None:
+        from haystack.components import converters
+
+        converter = _worker_converters[converter_name] = getattr(converters, ISOLATED_CONVERTERS[converter_name])()
+    return converter
+
+
+def convert_source(converter_name: str, source: Any, meta: dict[str, Any], cpu_seconds: int) -> dict[str, Any]:
+    """Convert a single source with a CPU-time budget (runs inside a worker process).
+
+    Returns:
+        Dictionary with ``documents``, or ``error`` when the file could not be converted.
+    """
+    global _cpu_limit_hit
+    _cpu_limit_hit = False
+    try:
+        _set_cpu_budget(cpu_seconds)
+        documents = _get_worker_converter(converter_name).run(sources=[source], meta=meta)["documents"]
+    except (ConversionLimitExceeded, MemoryError) as exc:
+        return {"error": f"{type(exc).__name__}: {exc}"}
+    except Exception as exc:
+        # Return the message rather than raising: arbitrary exceptions do not always pickle.
+        return {"error": str(exc)}
+    finally:
+        _set_cpu_budget(None)
+    if _cpu_limit_hit:
+        # Converters skip sources they fail to read, so the limit error may have been swallowed.
+        return {"error": "ConversionLimitExceeded: CPU time limit exceeded"}
+    return {"documents": documents}
+
+
+def _spawn_converter_pool(max_workers: int) -> Executor:
+    # Spawn rather than fork so workers never inherit model threads or open client sockets.
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(settings.converter_memory_mb,),
+    )
+
+
+def terminate_executor(executor: Executor) -> None:
+    """Kill a process pool's workers (hung ones included) and shut it down without waiting."""
+    for process in list((getattr(executor, "_processes", None) or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ConverterPool:
+    """Runs converters on an isolated worker pool with per-file time limits."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        timeout_seconds: float | None = None,
+        cpu_seconds: int | None = None,
+        executor_factory: Callable[[int], Executor] | None = None,
+        convert: Callable[[str, Any, dict[str, Any], int], dict[str, Any]] | None = None,
+    ):
+        """Initialize the pool; worker processes start on the first conversion.
+
+        Args:
+            max_workers: Worker processes (default: settings.converter_workers)
+            timeout_seconds: Wall-clock limit per running file (default: settings.converter_timeout_seconds)
+            cpu_seconds: CPU-time budget per file (default: settings.converter_cpu_seconds)
+            executor_factory: Callable ``(max_workers) -> Executor`` (default: spawn process pool)
+            convert: Per-file worker function (default: ``convert_source``)
+        """
+        self.max_workers = max(1, max_workers if max_workers is not None else settings.converter_workers)
+        self.timeout_seconds = timeout_seconds if timeout_seconds is not None else settings.converter_timeout_seconds
+        self.cpu_seconds = cpu_seconds if cpu_seconds is not None else settings.converter_cpu_seconds
+        self._executor_factory = executor_factory or _spawn_converter_pool
+        self._convert = convert or convert_source
+        self._executor: Executor | None = None
+        self._slots = threading.Semaphore(self.max_workers)
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> tuple[Executor, threading.Semaphore]:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._executor_factory(self.max_workers)
+                self._slots = threading.Semaphore(self.max_workers)
+            return self._executor, self._slots
+
+    def _dispatch(self, blocking: bool, *args: Any) -> tuple[Executor, Future] | None:
+        """Submit one file once the current executor has an idle worker.
+
+        Files are only handed to idle workers, so a file's time limit starts
+        when it begins converting rather than while it waits behind other work.
+        Returns None if no worker became idle in time.
+        """
+        executor, slots = self._get_executor()
+        if not (slots.acquire(timeout=_SLOT_POLL_SECONDS) if blocking else slots.acquire(blocking=False)):
+            return None
+        try:
+            future = executor.submit(self._convert, *args)
+        except RuntimeError:  # broken, or shut down by another caller since we fetched it
+            slots.release()
+            self._discard(executor)
+            return None
+        future.add_done_callback(lambda _: slots.release())
+        return executor, future
+
+    def _discard(self, executor: Executor) -> None:
+        """Terminate a hung or broken executor; the next conversion starts a fresh one."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        terminate_executor(executor)
+
+    def convert(
+        self,
+        converter_name: str,
+        sources: Sequence[Any],
+        meta: Sequence[dict[str, Any]],
+    ) -> tuple[list[Any], list[dict[str, str]]]:
+        """Convert sources in parallel, collecting results in source order.
+
+        Args:
+            converter_name: Pipeline converter name, e.g. "pdf_converter"
+            sources: File paths or ByteStreams
+            meta: Metadata for each source
+
+        Returns:
+            Tuple of (documents, failures); each failure has ``source`` and ``error``.
+        """
+        items = list(zip(sources, meta, strict=True))
+        queued = deque(range(len(items)))
+        attempts = [0] * len(items)
+        outcomes: dict[int, dict[str, Any]] = {}
+        running: dict[Future, tuple[int, Executor, float]] = {}
+
+        while queued or running:
+            # Start files while workers are idle; block for one only when none of ours is running.
+            while queued:
+                index = queued[0]
+                source, source_meta = items[index]
+                dispatched = self._dispatch(not running, converter_name, source, source_meta, self.cpu_seconds)
+                if dispatched is None:
+                    break
+                queued.popleft()
+                attempts[index] += 1
+                running[dispatched[1]] = (index, dispatched[0], time.monotonic())
+            if not running:
+                continue
+
+            timeout = None
+            if self.timeout_seconds:
+                oldest = min(started for _, _, started in running.values())
+                timeout = max(0.0, oldest + self.timeout_seconds - time.monotonic())
+            if queued:
+                timeout = _SLOT_POLL_SECONDS if timeout is None else min(timeout, _SLOT_POLL_SECONDS)
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                index, executor, _ = running.pop(future)
+                try:
+                    outcomes[index] = future.result()
+                except Exception as exc:  # BrokenProcessPool or cancellation when a pool is terminated
+                    self._discard(executor)
+                    if attempts[index] < _MAX_ATTEMPTS:
+                        # Usually another file hung or crashed the pool; run this one again on a fresh one.
+                        queued.appendleft(index)
+                    else:
+                        outcomes[index] = {"error": str(exc) or type(exc).__name__}
+
+            if self.timeout_seconds:
+                now = time.monotonic()
+                for future, (index, executor, started) in list(running.items()):
+                    if now - started >= self.timeout_seconds:
+                        del running[future]
+                        outcomes[index] = {"error": f"conversion timed out after {self.timeout_seconds}s"}
+                        # Recycle only the pool running the hung file; its other files are requeued above.
+                        self._discard(executor)
+
+        documents: list[Any] = []
+        failures: list[dict[str, str]] = []
+        for index, (source, _) in enumerate(items):
+            outcome = outcomes[index]
+            if "error" in outcome:
+                failures.append({"source": str(source), "error": outcome["error"]})
+                logger.error("converter.file_failed", converter=converter_name, source=str(source), **outcome)
+                continue
+            documents.extend(outcome["documents"])
+        return documents, failures
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=1)
+def get_converter_pool() -> ConverterPool:
+    """Get the process-wide converter pool."""
+    return ConverterPool()
+
+
+__all__ = [
+    "ISOLATED_CONVERTERS",
+    "ConversionLimitExceeded",
+    "ConverterPool",
+    "convert_source",
+    "get_converter_pool",
+    "terminate_executor",
+]
@@ -8,6 +8,7 @@ Handles file I/O operations and document processing for general ingestion:
 - Web scraping and indexing
 """
 
+import asyncio
 import tempfile
 from pathlib import Path
 from typing import Any, Optional
@@ -15,6 +16,10 @@ from typing import Any, Optional
 import structlog
 
 from certus_ask.core.exceptions import ValidationError
+from certus_ask.pipelines.streaming import quarantined_count as count_quarantined
+from certus_ask.pipelines.streaming import run_file_pipeline
+from certus_ask.services.ingestion.jobs import report_progress
+from certus_ask.services.ingestion.utils import extract_document_ids
 
 logger = structlog.get_logger(__name__)
 
@@ -36,6 +41,7 @@ class FileProcessor:
         s3_client: Optional[Any] = None,
         document_store: Optional[Any] = None,
         storage_service: Optional[Any] = None,
+        pipeline_pool: Optional[Any] = None,
     ):
         """Initialize the file processor.
 
@@ -43,6 +49,7 @@ class FileProcessor:
             s3_client: S3Client wrapper or boto3 S3 client (for backwards compatibility)
             document_store: OpenSearch document store
             storage_service: Storage service for file operations
+            pipeline_pool: Preprocessing pipeline pool (default: process-wide pool)
         """
         # Support both S3Client wrapper and raw boto3 client for backwards compatibility
         from certus_ask.services.storage import S3Client
@@ -55,6 +62,12 @@ class FileProcessor:
 
         self.document_store = document_store
         self.storage_service = storage_service
+
+        if pipeline_pool is None:
+            from certus_ask.pipelines.pipeline_pool import get_pipeline_pool
+
+            pipeline_pool = get_pipeline_pool()
+        self.pipeline_pool = pipeline_pool
         logger.info("FileProcessor initialized")
 
     def download_from_s3(
@@ -205,14 +218,13 @@ class FileProcessor:
         Returns:
             Dictionary with processing results:
             - documents_written: int
-            - quarantined: list
+            - quarantined: list (a sample of at most a few documents for streamed files)
+            - quarantined_count: int
             - metadata_preview: list
 
         Raises:
             Exception: If processing fails
         """
-        from certus_ask.pipelines.preprocessing import create_preprocessing_pipeline
-
         logger.info(
             "process_file.start",
             filename=filename,
@@ -241,21 +253,19 @@ class FileProcessor:
                 size_bytes=len(file_content),
             )
 
-            # Create and run Haystack pipeline
-            pipeline = create_preprocessing_pipeline(self.document_store)
-
-            result = pipeline.run({
-                "file_type_router": {"sources": [file_path]},
-                "document_writer": {
-                    "metadata_context": {
+            # Run a pooled Haystack pipeline
+            with self.pipeline_pool.acquire(self.document_store) as pipeline:
+                result = run_file_pipeline(
+                    pipeline,
+                    file_path,
+                    {
                         "workspace_id": workspace_id,
                         "ingestion_id": ingestion_id,
                         "source": "upload",
                         "source_location": str(file_path),
                         "extra_meta": {"filename": filename},
-                    }
-                },
-            })
+                    },
+                )
 
             # Extract results
             writer_result = result.get("document_writer") or {}
@@ -263,23 +273,25 @@ class FileProcessor:
             metadata_preview = writer_result.get("metadata_preview", [])
 
             quarantined = result.get("presidio_anonymizer", {}).get("quarantined", [])
-            if quarantined:
+            quarantined_count = count_quarantined(result)
+            if quarantined_count:
                 logger.warning(
                     "process_file.quarantined",
                     filename=filename,
-                    quarantined_count=len(quarantined),
+                    quarantined_count=quarantined_count,
                 )
 
             logger.info(
                 "process_file.complete",
                 filename=filename,
                 documents_written=documents_written,
-                quarantined_count=len(quarantined),
+                quarantined_count=quarantined_count,
             )
 
             return {
                 "documents_written": documents_written,
                 "quarantined": quarantined,
+                "quarantined_count": quarantined_count,
                 "metadata_preview": metadata_preview[:3],  # First 3 for preview
             }
 
@@ -295,6 +307,8 @@ class FileProcessor:
         ingestion_id: str,
         recursive: bool = False,
         pattern: str | None = None,
+        parallel: bool = False,
+        incremental: bool = False,
     ) -> dict[str, Any]:
         """Process all files in a folder through Haystack pipeline.
 
@@ -304,18 +318,21 @@ class FileProcessor:
             ingestion_id: Unique ingestion ID for tracking
             recursive: Whether to process subfolders recursively
             pattern: Optional glob pattern override (e.g., "**/*.md")
+            parallel: Convert files on a worker process pool and batch embedding/writes
+            incremental: Skip files whose content hash matches the ingestion ledger and
+                remove chunks of files that no longer exist
 
         Returns:
             Dictionary with processing results:
             - processed_files: int
             - failed_files: int
+            - skipped_files: int
+            - deleted_files: int
             - metadata_preview: list
 
         Raises:
             ValueError: If folder_path is not a directory
         """
-        from certus_ask.pipelines.preprocessing import create_preprocessing_pipeline
-
         if not folder_path.is_dir():
             raise ValueError(f"{folder_path} is not a valid directory")
 
@@ -324,11 +341,10 @@ class FileProcessor:
             folder_path=str(folder_path),
             workspace_id=workspace_id,
             recursive=recursive,
+            parallel=parallel,
+            incremental=incremental,
         )
 
-        # Create pipeline
-        pipeline = create_preprocessing_pipeline(self.document_store)
-
         processed_files = 0
         failed_files = 0
         quarantined_count = 0
@@ -336,68 +352,111 @@ class FileProcessor:
 
         # Determine glob pattern
         glob_pattern = pattern if pattern else ("**/*" if recursive else "*")
+        sync = self._incremental_sync(workspace_id, str(folder_path), incremental)
+        content_hashes: dict[str, str] = {}
+
+        if parallel:
+            files = (
+                (
+                    file_path,
+                    {
+                        "workspace_id": workspace_id,
+                        "ingestion_id": ingestion_id,
+                        "source": "folder",
+                        "source_location": str(file_path),
+                        "extra_meta": {"filename": file_path.name},
+                    },
+                )
+                for file_path in folder_path.glob(glob_pattern)
+                if file_path.is_file() and not self._skip_unchanged(sync, str(file_path), file_path, content_hashes)
+            )
+            outcome = await self._ingest_parallel(
+                files,
+                event_prefix="process_folder",
+                on_file_indexed=lambda file_path, document_ids: self._commit_indexed(
+                    sync, str(file_path), content_hashes, document_ids
+                ),
+            )
+            processed_files = outcome.processed_files
+            failed_files = outcome.failed_files
+            quarantined_count = outcome.quarantined_count
+            metadata_preview = outcome.metadata_preview
+        else:
+            with self.pipeline_pool.acquire(self.document_store) as pipeline:
+                for file_path in folder_path.glob(glob_pattern):
+                    if not file_path.is_file():
+                        continue
 
-        for file_path in folder_path.glob(glob_pattern):
-            if not file_path.is_file():
-                continue
+                    try:
+                        if self._skip_unchanged(sync, str(file_path), file_path, content_hashes):
+                            continue
 
-            try:
-                logger.info(
-                    "process_folder.processing_file",
-                    file_path=str(file_path),
-                )
+                        logger.info(
+                            "process_folder.processing_file",
+                            file_path=str(file_path),
+                        )
 
-                result = pipeline.run({
-                    "file_type_router": {"sources": [file_path]},
-                    "document_writer": {
-                        "metadata_context": {
-                            "workspace_id": workspace_id,
-                            "ingestion_id": ingestion_id,
-                            "source": "folder",
-                            "source_location": str(file_path),
-                            "extra_meta": {"filename": file_path.name},
-                        }
-                    },
-                })
-
-                processed_files += 1
-
-                # Track quarantined documents
-                quarantined = result.get("presidio_anonymizer", {}).get("quarantined", [])
-                if quarantined:
-                    quarantined_count += len(quarantined)
-                    logger.warning(
-                        "process_folder.file_quarantined",
-                        file_path=str(file_path),
-                        quarantined_count=len(quarantined),
-                    )
-
-                # Collect metadata preview (up to 3 files)
-                if len(metadata_preview) < 3:
-                    writer_result = result.get("document_writer") or {}
-                    preview = writer_result.get("metadata_preview", [])
-                    metadata_preview.extend(preview[: 3 - len(metadata_preview)])
-
-            except Exception as exc:
-                failed_files += 1
-                logger.error(
-                    "process_folder.file_failed",
-                    file_path=str(file_path),
-                    error=str(exc),
-                )
-                continue
+                        result = run_file_pipeline(
+                            pipeline,
+                            file_path,
+                            {
+                                "workspace_id": workspace_id,
+                                "ingestion_id": ingestion_id,
+                                "source": "folder",
+                                "source_location": str(file_path),
+                                "extra_meta": {"filename": file_path.name},
+                            },
+                        )
+
+                        writer_result = result.get("document_writer") or {}
+                        self._commit_indexed(sync, str(file_path), content_hashes, extract_document_ids(writer_result))
+                        processed_files += 1
+
+                        # Track quarantined documents
+                        quarantined = count_quarantined(result)
+                        if quarantined:
+                            quarantined_count += quarantined
+                            logger.warning(
+                                "process_folder.file_quarantined",
+                                file_path=str(file_path),
+                                quarantined_count=quarantined,
+                            )
+
+                        # Collect metadata preview (up to 3 files)
+                        if len(metadata_preview) < 3:
+                            preview = writer_result.get("metadata_preview", [])
+                            metadata_preview.extend(preview[: 3 - len(metadata_preview)])
+
+                    except Exception as exc:
+                        failed_files += 1
+                        logger.error(
+                            "process_folder.file_failed",
+                            file_path=str(file_path),
+                            error=str(exc),
+                        )
+                        continue
+                    finally:
+                        report_progress(
+                            processed_files=processed_files, failed_files=failed_files, skipped_files=sync.skipped
+                        )
+
+        deleted_files = sync.finalize()
 
         logger.info(
             "process_folder.complete",
             folder_path=str(folder_path),
             processed_files=processed_files,
             failed_files=failed_files,
+            skipped_files=sync.skipped,
+            deleted_files=deleted_files,
             quarantined_count=quarantined_count,
         )
 
         return {
             "processed_files": processed_files,
             "failed_files": failed_files,
+            "skipped_files": sync.skipped,
+            "deleted_files": deleted_files,
             "quarantined_count": quarantined_count,
             "metadata_preview": metadata_preview,
         }
@@ -411,6 +470,8 @@ class FileProcessor:
         include_globs: Optional[list[str]] = None,
         exclude_globs: Optional[list[str]] = None,
         max_file_size_kb: int = 256,
+        parallel: bool = False,
+        incremental: bool = False,
     ) -> dict[str, Any]:
         """Process files from a GitHub repository.
 
@@ -422,42 +483,87 @@ class FileProcessor:
             ingestion_id: Unique ingestion ID for tracking
             branch: Git branch to clone (default: None for default branch)
             file_globs: List of glob patterns to match files (default: ["**/*.md"])
+            parallel: Convert files on a worker process pool and batch embedding/writes
+            incremental: Keep a cached checkout, ingest only files changed since the last
+                indexed commit and skip files whose content hash matches the ingestion ledger
 
         Returns:
             Dictionary with processing results:
-            - processed_files: int
+            - file_count: int
             - failed_files: int
+            - skipped_files: int
+            - deleted_files: int
+            - commit: indexed commit SHA (incremental runs)
+            - base_commit: commit the diff was computed from, if any
             - metadata_preview: list
 
         Raises:
             Exception: If cloning or processing fails
         """
-        from certus_ask.pipelines.preprocessing import create_preprocessing_pipeline
-        from certus_ask.services.github import clone_repository, iter_repository_files
+        from certus_ask.services.github import (
+            RepositoryChanges,
+            clone_repository,
+            diff_repository,
+            iter_repository_files,
+            sync_repository,
+        )
 
         logger.info(
             "process_github.start",
             repo_url=repo_url,
             workspace_id=workspace_id,
             branch=branch,
+            parallel=parallel,
+            incremental=incremental,
         )
 
         requested_includes = include_globs or []
         requested_excludes = exclude_globs or []
+        sync = self._incremental_sync(workspace_id, f"{repo_url}@{branch or 'default'}", incremental)
 
-        # Clone repository and ensure cleanup
-        with clone_repository(repo_url, branch=branch) as repo:
+        # Incremental runs reuse a cached checkout so only the delta is fetched;
+        # otherwise clone into a temporary directory and clean it up afterwards.
+        if incremental:
+            checkout = sync_repository(repo_url, branch=branch)
+        else:
+            checkout = clone_repository(repo_url, branch=branch)
+        with checkout as repo:
             repo_path = repo.path
+            head_commit: str | None = repo.head_commit if incremental else None
+            base_commit = sync.revision if head_commit else None
+            deleted_files = 0
+
+            def repo_location(file_path: Path) -> str:
+                return file_path.relative_to(repo_path).as_posix()
+
+            changes: RepositoryChanges | None = None
+            if base_commit == head_commit and base_commit is not None:
+                changes = RepositoryChanges()
+            elif base_commit is not None:
+                changes = diff_repository(repo_path, base_commit, head_commit)
 
-            pipeline = create_preprocessing_pipeline(self.document_store)
             matching_files = iter_repository_files(
                 repo_path,
                 include_globs=requested_includes or None,
                 exclude_globs=requested_excludes or None,
                 max_file_size_kb=max_file_size_kb,
+                paths=changes.changed if changes is not None else None,
             )
 
-            if not matching_files:
+            if changes is not None:
+                # Files deleted upstream, or changed so they no longer match the filters, lose their chunks.
+                matched = {repo_location(file_path) for file_path in matching_files}
+                removed = changes.deleted + [path for path in changes.changed if path not in matched]
+                deleted_files = sync.forget(removed)
+                logger.info(
+                    "process_github.diff",
+                    repo_url=repo_url,
+                    base_commit=base_commit,
+                    head_commit=head_commit,
+                    changed_files=len(changes.changed),
+                    removed_files=len(removed),
+                )
+            elif not matching_files:
                 raise ValidationError(
                     message="No files matched the provided patterns",
                     error_code="no_matching_files",
@@ -472,71 +578,163 @@ class FileProcessor:
             failed_files = 0
             quarantined_count = 0
             metadata_preview: list[dict[str, Any]] = []
-
-            for file_path in matching_files:
-                try:
-                    logger.info(
-                        "process_github.processing_file",
-                        file_path=str(file_path),
-                        repo_url=repo_url,
-                    )
-
-                    result = pipeline.run({
-                        "file_type_router": {"sources": [file_path]},
-                        "document_writer": {
-                            "metadata_context": {
-                                "workspace_id": workspace_id,
-                                "ingestion_id": ingestion_id,
-                                "source": "github",
-                                "source_location": repo_url,
-                                "extra_meta": {
-                                    "filename": file_path.name,
-                                    "repo_url": repo_url,
-                                    "branch": branch or "default",
-                                },
-                            }
-                        },
-                    })
-
-                    file_count += 1
-
-                    quarantined = result.get("presidio_anonymizer", {}).get("quarantined", [])
-                    if quarantined:
-                        quarantined_count += len(quarantined)
-                        logger.warning(
-                            "process_github.file_quarantined",
-                            file_path=str(file_path),
-                            quarantined_count=len(quarantined),
-                        )
-
-                    if len(metadata_preview) < 3:
-                        writer_result = result.get("document_writer") or {}
-                        preview = writer_result.get("metadata_preview", [])
-                        metadata_preview.extend(preview[: 3 - len(metadata_preview)])
-
-                except Exception as exc:
-                    failed_files += 1
-                    logger.error(
-                        "process_github.file_failed",
-                        file_path=str(file_path),
-                        error=str(exc),
-                    )
+            content_hashes: dict[str, str] = {}
+            report_progress(total_files=len(matching_files))
+
+            def github_metadata_context(file_path: Path) -> dict[str, Any]:
+                return {
+                    "workspace_id": workspace_id,
+                    "ingestion_id": ingestion_id,
+                    "source": "github",
+                    "source_location": repo_url,
+                    "extra_meta": {
+                        "filename": file_path.name,
+                        "repo_url": repo_url,
+                        "branch": branch or "default",
+                    },
+                }
+
+            if parallel:
+                outcome = await self._ingest_parallel(
+                    (
+                        (file_path, github_metadata_context(file_path))
+                        for file_path in matching_files
+                        if not self._skip_unchanged(sync, repo_location(file_path), file_path, content_hashes)
+                    ),
+                    event_prefix="process_github",
+                    on_file_indexed=lambda file_path, document_ids: self._commit_indexed(
+                        sync, repo_location(file_path), content_hashes, document_ids
+                    ),
+                )
+                file_count = outcome.processed_files
+                failed_files = outcome.failed_files
+                quarantined_count = outcome.quarantined_count
+                metadata_preview = outcome.metadata_preview
+            else:
+                with self.pipeline_pool.acquire(self.document_store) as pipeline:
+                    for file_path in matching_files:
+                        try:
+                            if self._skip_unchanged(sync, repo_location(file_path), file_path, content_hashes):
+                                continue
+
+                            logger.info(
+                                "process_github.processing_file",
+                                file_path=str(file_path),
+                                repo_url=repo_url,
+                            )
+
+                            result = run_file_pipeline(pipeline, file_path, github_metadata_context(file_path))
+
+                            writer_result = result.get("document_writer") or {}
+                            self._commit_indexed(
+                                sync, repo_location(file_path), content_hashes, extract_document_ids(writer_result)
+                            )
+                            file_count += 1
+
+                            quarantined = count_quarantined(result)
+                            if quarantined:
+                                quarantined_count += quarantined
+                                logger.warning(
+                                    "process_github.file_quarantined",
+                                    file_path=str(file_path),
+                                    quarantined_count=quarantined,
+                                )
+
+                            if len(metadata_preview) < 3:
+                                preview = writer_result.get("metadata_preview", [])
+                                metadata_preview.extend(preview[: 3 - len(metadata_preview)])
+
+                        except Exception as exc:
+                            failed_files += 1
+                            logger.error(
+                                "process_github.file_failed",
+                                file_path=str(file_path),
+                                error=str(exc),
+                            )
+                        finally:
+                            report_progress(
+                                processed_files=file_count, failed_files=failed_files, skipped_files=sync.skipped
+                            )
+
+            if changes is None:
+                deleted_files = sync.finalize()
+            # Only advance the diff base once every file made it in; failed files are retried next run.
+            if head_commit and failed_files == 0:
+                sync.set_revision(head_commit)
 
             logger.info(
                 "process_github.complete",
                 repo_url=repo_url,
+                commit=head_commit,
+                base_commit=base_commit if changes is not None else None,
                 file_count=file_count,
                 failed_files=failed_files,
+                skipped_files=sync.skipped,
+                deleted_files=deleted_files,
                 quarantined_count=quarantined_count,
             )
 
             return {
                 "file_count": file_count,
                 "failed_files": failed_files,
+                "skipped_files": sync.skipped,
+                "deleted_files": deleted_files,
+                "commit": head_commit,
+                "base_commit": base_commit if changes is not None else None,
                 "quarantined_count": quarantined_count,
                 "metadata_preview": metadata_preview,
             }
 
+    async def _ingest_parallel(self, files: Any, event_prefix: str, on_file_indexed: Any = None) -> Any:
+        """Run parallel ingestion off the event loop.
+
+        Args:
+            files: Iterable of ``(file_path, metadata_context)`` pairs
+            event_prefix: Log event prefix for per-file events
+            on_file_indexed: Optional ``(file_path, chunk_ids)`` callback per indexed file
+
+        Returns:
+            ParallelIngestionResult with per-file counts
+        """
+        from certus_ask.services.ingestion.parallel_ingestion import ParallelFileIngestor
+
+        ingestor = ParallelFileIngestor(self.document_store)
+        return await asyncio.to_thread(ingestor.ingest, files, event_prefix, on_file_indexed)
+
+    def _incremental_sync(self, workspace_id: str, scope: str, incremental: bool) -> Any:
+        """Create the ledger tracker for one run (a no-op tracker when not incremental)."""
+        from certus_ask.services.ingestion.ledger import IncrementalSync, get_ingestion_ledger
+
+        ledger = get_ingestion_ledger() if incremental else None
+        return IncrementalSync(ledger, self.document_store, workspace_id, scope)
+
+    @staticmethod
+    def _skip_unchanged(sync: Any, location: str, file_path: Path, content_hashes: dict[str, str]) -> bool:
+        """Hash a file and return True if the ledger says it is unchanged."""
+        if not sync.enabled:
+            return False
+
+        from certus_ask.services.ingestion.ledger import compute_file_sha256
+
+        try:
+            content_hash = compute_file_sha256(file_path)
+        except OSError as exc:
+            # Let conversion surface the error as a per-file failure.
+            logger.warning("ingestion_ledger.hash_failed", location=location, error=str(exc))
+            sync.should_skip(location)
+            return False
+        content_hashes[location] = content_hash
+        if sync.should_skip(location, content_hash=content_hash):
+            logger.info("ingestion_ledger.file_unchanged", location=location)
+            return True
+        return False
+
+    @staticmethod
+    def _commit_indexed(sync: Any, location: str, content_hashes: dict[str, str], document_ids: list[str]) -> None:
+        content_hash = content_hashes.pop(location, None)
+        if sync.enabled and content_hash is not None:
+            sync.commit(location, content_hash, document_ids)
+
     async def process_web(
         self,
         urls: list[str],
@@ -545,7 +743,9 @@ class FileProcessor:
     ) -> dict[str, Any]:
         """Process web pages by URL.
 
-        Fetches HTML content and processes through Haystack pipeline.
+        Fetches pages concurrently (bounded overall and per host) and indexes
+        them through the clean, split, embed and write stages in batches that
+        span many pages.
 
         Args:
             urls: List of URLs to fetch and process
@@ -554,17 +754,13 @@ class FileProcessor:
 
         Returns:
             Dictionary with processing results:
-            - processed_urls: int
-            - failed_urls: int
+            - indexed_count: int
+            - skipped_count: int
+            - skipped_urls: list
+            - documents_written: int
             - metadata_preview: list
-
-        Raises:
-            Exception: If fetching or processing fails
         """
-        import httpx
-        from haystack.components.converters import HTMLToDocument
-
-        from certus_ask.pipelines.preprocessing import create_preprocessing_pipeline
+        from certus_ask.services.ingestion.web_ingestion import WebPageIngestor
 
         logger.info(
             "process_web.start",
@@ -572,86 +768,16 @@ class FileProcessor:
             workspace_id=workspace_id,
         )
 
-        # Create pipeline and converter
-        pipeline = create_preprocessing_pipeline(self.document_store)
-        html_converter = HTMLToDocument()
-
-        processed_urls = 0
-        failed_urls = 0
-        metadata_preview = []
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for url in urls:
-                try:
-                    logger.info(
-                        "process_web.fetching",
-                        url=url,
-                    )
-
-                    # Fetch URL
-                    response = await client.get(url, follow_redirects=True)
-                    response.raise_for_status()
-
-                    # Convert HTML to document
-                    html_docs = html_converter.run(sources=[response.text])
-                    documents = html_docs.get("documents", [])
-
-                    if not documents:
-                        logger.warning(
-                            "process_web.no_content",
-                            url=url,
-                        )
-                        failed_urls += 1
-                        continue
-
-                    # Add metadata and index
-                    for doc in documents:
-                        doc.meta.update({
-                            "workspace_id": workspace_id,
-                            "ingestion_id": ingestion_id,
-                            "source": "web",
-                            "source_location": url,
-                            "url": url,
-                        })
-
-                    # Write to document store
-                    from haystack.components.writers import DocumentWriter
-
-                    writer = DocumentWriter(document_store=self.document_store)
-                    writer.run(documents=documents)
-
-                    processed_urls += 1
-
-                    # Collect metadata preview
-                    if len(metadata_preview) < 3 and documents:
-                        metadata_preview.append({
-                            "url": url,
-                            "title": documents[0].meta.get("title", "Untitled"),
-                        })
-
-                    logger.info(
-                        "process_web.processed",
-                        url=url,
-                        document_count=len(documents),
-                    )
-
-                except Exception as exc:
-                    failed_urls += 1
-                    logger.error(
-                        "process_web.failed",
-                        url=url,
-                        error=str(exc),
-                    )
-                    continue
-
-        logger.info(
-            "process_web.complete",
-            processed_urls=processed_urls,
-            failed_urls=failed_urls,
+        ingestor = WebPageIngestor(self.document_store)
+        result = await ingestor.ingest(
+            urls,
+            {"workspace_id": workspace_id, "ingestion_id": ingestion_id, "source": "web"},
         )
 
         return {
-            "processed_urls": processed_urls,
-            "failed_urls": failed_urls,
-            "metadata_preview": metadata_preview,
+            "indexed_count": len(result.indexed_urls),
+            "skipped_count": len(result.skipped_urls),
+            "skipped_urls": result.skipped_urls,
+            "documents_written": result.documents_written,
+            "metadata_preview": result.metadata_preview,
         }
@@ -0,0 +1,278 @@
+"""Ingestion job subsystem.
+
+Ingestion work (conversion, PII scanning, embedding, indexing) is CPU and I/O
+heavy and mostly synchronous. Running it inside request handlers blocks the
+event loop and ties the HTTP request to the full ingestion time. Jobs are
+executed on a dedicated, bounded pool of worker threads instead, each running
+the job coroutine on its own event loop. Callers can either wait for the
+result or return a job ID immediately and poll for status and progress.
+
+Jobs are tracked in memory per API process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from typing import Any
+
+import structlog
+
+from certus_ask.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+_current_job: contextvars.ContextVar[IngestionJob | None] = contextvars.ContextVar("ingestion_job", default=None)
+
+
+class JobQueueFullError(Exception):
+    """Raised when the number of queued jobs reaches the configured limit."""
+
+
+class IngestionJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass
+class IngestionJob:
+    """State of a single ingestion job."""
+
+    job_id: str
+    kind: str
+    workspace_id: str
+    status: IngestionJobStatus = IngestionJobStatus.QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    progress: dict[str, int] = field(default_factory=dict)
+    result: Any = None
+    error: dict[str, Any] | None = None
+    future: Future = field(default_factory=Future, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in (IngestionJobStatus.SUCCEEDED, IngestionJobStatus.FAILED)
+
+    def to_dict(self) -> dict[str, Any]:
+        result = self.result.model_dump() if hasattr(self.result, "model_dump") else self.result
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "workspace_id": self.workspace_id,
+            "status": self.status.value,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": dict(self.progress),
+            "result": result,
+            "error": self.error,
+        }
+
+
+def report_progress(**counters: int) -> None:
+    """Update progress counters of the job running in the current context.
+
+    Safe to call outside a job (it is then a no-op), so services can report
+    progress unconditionally.
+    """
+    job = _current_job.get()
+    if job is not None:
+        job.progress.update(counters)
+
+
+def _describe_error(exc: BaseException) -> dict[str, Any]:
+    status_code = getattr(exc, "status_code", None)
+    if status_code is not None:
+        return {"error": "http_error", "status_code": status_code, "message": str(getattr(exc, "detail", exc))}
+    if hasattr(exc, "to_dict"):
+        return exc.to_dict()
+    return {"error": exc.__class__.__name__, "message": str(exc)}
+
+
+class IngestionJobManager:
+    """Runs ingestion jobs on a bounded worker pool and tracks their state."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queued: int | None = None,
+        retention: int | None = None,
+    ):
+        """Initialize the manager.
+
+        Args:
+            max_workers: Concurrent jobs (default: settings.ingestion_job_workers)
+            max_queued: Jobs waiting for a worker before submissions are rejected
+                (default: settings.ingestion_job_max_queued)
+            retention: Finished jobs kept for status lookups (default: settings.ingestion_job_retention)
+        """
+        self.max_workers = max(1, max_workers or settings.ingestion_job_workers)
+        self.max_queued = max(0, max_queued if max_queued is not None else settings.ingestion_job_max_queued)
+        self.retention = max(1, retention or settings.ingestion_job_retention)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ingestion-job")
+        self._jobs: OrderedDict[str, IngestionJob] = OrderedDict()
+        # Executor futures and completion callbacks of jobs that have not finished yet.
+        self._tasks: dict[str, tuple[Future, Callable[[], None] | None]] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        kind: str,
+        workspace_id: str,
+        factory: Callable[[], Awaitable[Any]],
+        on_done: Callable[[], None] | None = None,
+    ) -> IngestionJob:
+        """Queue a job.
+
+        Args:
+            kind: Job type, e.g. "folder", "github", "s3"
+            workspace_id: Workspace the job ingests into
+            factory: Zero-argument callable returning the coroutine to run
+            on_done: Called once the job has finished, whether it succeeded or failed
+
+        Returns:
+            The queued IngestionJob
+
+        Raises:
+            JobQueueFullError: If ``max_queued`` jobs are already waiting
+        """
+        job = IngestionJob(job_id=str(uuid.uuid4()), kind=kind, workspace_id=workspace_id)
+        with self._lock:
+            queued = sum(1 for item in self._jobs.values() if item.status == IngestionJobStatus.QUEUED)
+            if queued >= self.max_queued + self.max_workers - self._running_locked():
+                raise JobQueueFullError(f"{queued} ingestion jobs already queued")
+            self._jobs[job.job_id] = job
+            self._evict_locked()
+            # Copy the caller's context so request IDs and logging context follow the job.
+            context = contextvars.copy_context()
+            task = self._executor.submit(context.run, self._run, job, factory, on_done)
+            self._tasks[job.job_id] = (task, on_done)
+
+        logger.info("ingestion_job.queued", job_id=job.job_id, kind=kind, workspace_id=workspace_id)
+        return job
+
+    def _run(
+        self,
+        job: IngestionJob,
+        factory: Callable[[], Awaitable[Any]],
+        on_done: Callable[[], None] | None = None,
+    ) -> None:
+        try:
+            self._execute(job, factory)
+        finally:
+            with self._lock:
+                self._tasks.pop(job.job_id, None)
+            if on_done is not None:
+                on_done()
+
+    def _execute(self, job: IngestionJob, factory: Callable[[], Awaitable[Any]]) -> None:
+        _current_job.set(job)
+        job.status = IngestionJobStatus.RUNNING
+        job.started_at = time.time()
+        logger.info("ingestion_job.started", job_id=job.job_id, kind=job.kind, workspace_id=job.workspace_id)
+        try:
+            job.result = asyncio.run(factory())
+        except BaseException as exc:
+            job.error = _describe_error(exc)
+            job.status = IngestionJobStatus.FAILED
+            job.finished_at = time.time()
+            logger.error(
+                "ingestion_job.failed",
+                job_id=job.job_id,
+                kind=job.kind,
+                error=str(exc),
+                duration_ms=int((job.finished_at - job.started_at) * 1000),
+            )
+            job.future.set_exception(exc)
+        else:
+            job.status = IngestionJobStatus.SUCCEEDED
+            job.finished_at = time.time()
+            logger.info(
+                "ingestion_job.succeeded",
+                job_id=job.job_id,
+                kind=job.kind,
+                duration_ms=int((job.finished_at - job.started_at) * 1000),
+            )
+            job.future.set_result(job.result)
+
+    async def wait(self, job: IngestionJob) -> Any:
+        """Await a job's result without blocking the event loop (re-raises its error)."""
+        return await asyncio.wrap_future(job.future)
+
+    def get(self, job_id: str) -> IngestionJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, workspace_id: str | None = None, limit: int = 50) -> list[IngestionJob]:
+        """Return the most recently submitted jobs, newest first."""
+        with self._lock:
+            jobs = [job for job in reversed(self._jobs.values()) if workspace_id in (None, job.workspace_id)]
+        return jobs[:limit]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            counts = {status.value: 0 for status in IngestionJobStatus}
+            for job in self._jobs.values():
+                counts[job.status.value] += 1
+        return {"workers": self.max_workers, "max_queued": self.max_queued, **counts}
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting jobs and fail the queued ones so their waiters and callbacks are released."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            cancelled = [
+                (self._jobs[job_id], on_done) for job_id, (task, on_done) in self._tasks.items() if task.cancelled()
+            ]
+            for job, _ in cancelled:
+                del self._tasks[job.job_id]
+        for job, on_done in cancelled:
+            self._cancel(job)
+            if on_done is not None:
+                on_done()
+        if wait:
+            self._executor.shutdown(wait=True)
+
+    @staticmethod
+    def _cancel(job: IngestionJob) -> None:
+        exc = RuntimeError("Ingestion job cancelled by shutdown before it started")
+        job.error = _describe_error(exc)
+        job.status = IngestionJobStatus.FAILED
+        job.finished_at = time.time()
+        logger.warning("ingestion_job.cancelled", job_id=job.job_id, kind=job.kind, workspace_id=job.workspace_id)
+        job.future.set_exception(exc)
+
+    def _running_locked(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == IngestionJobStatus.RUNNING)
+
+    def _evict_locked(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[: max(0, len(finished) - self.retention)]:
+            del self._jobs[job_id]
+
+
+@lru_cache(maxsize=1)
+def get_ingestion_job_manager() -> IngestionJobManager:
+    """Get the process-wide ingestion job manager."""
+    return IngestionJobManager()
+
+
+__all__ = [
+    "IngestionJob",
+    "IngestionJobManager",
+    "IngestionJobStatus",
+    "JobQueueFullError",
+    "get_ingestion_job_manager",
+    "report_progress",
+]
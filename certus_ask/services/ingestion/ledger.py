@@ -0,0 +1,357 @@
+"""Ingestion ledger for content-hash incremental re-ingestion.
+
+Records, per workspace and source, the SHA-256 of every ingested file and the
+IDs of the chunks it produced. Re-running a folder, S3 prefix or repository
+ingestion consults the ledger to skip unchanged files before conversion,
+replace the chunks of files whose content changed, and remove the chunks of
+files that disappeared from the source.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from certus_ask.core.config import settings
+from certus_ask.services.document_counts import get_document_counts
+
+logger = structlog.get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingestion_ledger (
+    workspace_id TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    location TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    etag TEXT,
+    document_ids TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (workspace_id, scope, location)
+);
+CREATE TABLE IF NOT EXISTS source_revisions (
+    workspace_id TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    revision TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (workspace_id, scope)
+);
+"""
+
+
+def compute_file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Return the hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class LedgerEntry:
+    """Ledger record for one ingested file."""
+
+    workspace_id: str
+    scope: str
+    location: str
+    content_hash: str
+    document_ids: list[str] = field(default_factory=list)
+    etag: str | None = None
+    updated_at: float = 0.0
+
+
+class IngestionLedger:
+    """SQLite-backed store of ingested file hashes and their chunk IDs."""
+
+    def __init__(self, path: str | Path):
+        """Open (and create if needed) the ledger database.
+
+        Args:
+            path: SQLite database file, or ":memory:"
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def entries(self, workspace_id: str, scope: str) -> dict[str, LedgerEntry]:
+        """Return all entries recorded for a workspace and source scope, keyed by location."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT location, content_hash, etag, document_ids, updated_at FROM ingestion_ledger "
+                "WHERE workspace_id = ? AND scope = ?",
+                (workspace_id, scope),
+            ).fetchall()
+        return {
+            location: LedgerEntry(
+                workspace_id=workspace_id,
+                scope=scope,
+                location=location,
+                content_hash=content_hash,
+                etag=etag,
+                document_ids=json.loads(document_ids),
+                updated_at=updated_at,
+            )
+            for location, content_hash, etag, document_ids, updated_at in rows
+        }
+
+    def record(self, entry: LedgerEntry) -> None:
+        """Insert or replace an entry."""
+        entry.updated_at = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ingestion_ledger "
+                "(workspace_id, scope, location, content_hash, etag, document_ids, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.workspace_id,
+                    entry.scope,
+                    entry.location,
+                    entry.content_hash,
+                    entry.etag,
+                    json.dumps(entry.document_ids),
+                    entry.updated_at,
+                ),
+            )
+
+    def remove(self, workspace_id: str, scope: str, locations: Iterable[str]) -> None:
+        """Delete entries for the given locations."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM ingestion_ledger WHERE workspace_id = ? AND scope = ? AND location = ?",
+                [(workspace_id, scope, location) for location in locations],
+            )
+
+    def get_revision(self, workspace_id: str, scope: str) -> str | None:
+        """Return the last fully indexed revision (e.g. commit SHA) of a source."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT revision FROM source_revisions WHERE workspace_id = ? AND scope = ?",
+                (workspace_id, scope),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_revision(self, workspace_id: str, scope: str, revision: str | None) -> None:
+        """Store (or clear, with None) the last fully indexed revision of a source."""
+        with self._lock, self._conn:
+            if revision is None:
+                self._conn.execute(
+                    "DELETE FROM source_revisions WHERE workspace_id = ? AND scope = ?",
+                    (workspace_id, scope),
+                )
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO source_revisions (workspace_id, scope, revision, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (workspace_id, scope, revision, time.time()),
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class IncrementalSync:
+    """Tracks one ingestion run against the ledger for a single source scope.
+
+    Call ``should_skip`` for every file found in the source (before conversion),
+    ``commit`` after a file's chunks were written, and ``finalize`` once the
+    whole source was enumerated to drop chunks of files that no longer exist.
+    """
+
+    def __init__(
+        self,
+        ledger: IngestionLedger | None,
+        document_store: Any,
+        workspace_id: str,
+        scope: str,
+    ):
+        """Initialize the run.
+
+        Args:
+            ledger: Ledger to consult, or None to disable incremental behaviour
+            document_store: Document store whose stale chunks are deleted
+            workspace_id: Workspace identifier
+            scope: Source identifier (folder path, ``s3://bucket/prefix``, ``repo@branch``)
+        """
+        self.ledger = ledger
+        self.document_store = document_store
+        self.workspace_id = workspace_id
+        self.scope = scope
+        self._known = ledger.entries(workspace_id, scope) if ledger is not None else {}
+        self._seen: set[str] = set()
+        self.skipped = 0
+
+        # Exact count (one query per run): a cached count could hide an index dropped moments ago
+        # or by another worker, and then every file would be skipped.
+        if self._known and document_store.count_documents() == 0:
+            # The index was dropped or recreated; the ledger no longer describes it.
+            logger.warning(
+                "ingestion_ledger.index_empty_reset",
+                workspace_id=workspace_id,
+                scope=scope,
+                entries=len(self._known),
+            )
+            ledger.remove(workspace_id, scope, list(self._known))
+            ledger.set_revision(workspace_id, scope, None)
+            self._known = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ledger is not None
+
+    @property
+    def revision(self) -> str | None:
+        """Last fully indexed revision of this source, if any."""
+        if self.ledger is None:
+            return None
+        return self.ledger.get_revision(self.workspace_id, self.scope)
+
+    def set_revision(self, revision: str) -> None:
+        if self.ledger is not None:
+            self.ledger.set_revision(self.workspace_id, self.scope, revision)
+
+    def should_skip(self, location: str, content_hash: str | None = None, etag: str | None = None) -> bool:
+        """Mark ``location`` as present and return True if its content is unchanged.
+
+        Args:
+            location: File location within the scope
+            content_hash: SHA-256 of the file content, if already computed
+            etag: Cheap version marker (e.g. S3 ETag) checked before hashing
+        """
+        self._seen.add(location)
+        entry = self._known.get(location)
+        if entry is None:
+            return False
+        unchanged = (etag is not None and entry.etag == etag) or (
+            content_hash is not None and entry.content_hash == content_hash
+        )
+        if unchanged:
+            self.skipped += 1
+            if etag is not None and entry.etag != etag and self.ledger is not None:
+                # Same bytes under a new version marker (e.g. re-upload): remember it to skip the download next time.
+                entry.etag = etag
+                self.ledger.record(entry)
+        return unchanged
+
+    def commit(
+        self,
+        location: str,
+        content_hash: str,
+        document_ids: list[str],
+        etag: str | None = None,
+    ) -> None:
+        """Record a successfully indexed file and delete chunks it no longer produces."""
+        if self.ledger is None:
+            return
+        tracked_ids = list(document_ids)
+        previous = self._known.get(location)
+        if previous is not None:
+            stale = sorted(set(previous.document_ids) - set(document_ids))
+            if stale:
+                try:
+                    self.document_store.delete_documents(document_ids=stale)
+                except Exception as exc:
+                    # Keep tracking the stale chunks so the next run retries the delete.
+                    tracked_ids.extend(stale)
+                    logger.warning(
+                        "ingestion_ledger.chunk_delete_failed",
+                        workspace_id=self.workspace_id,
+                        location=location,
+                        error=str(exc),
+                    )
+                else:
+                    get_document_counts().invalidate(self.document_store)
+                    logger.info(
+                        "ingestion_ledger.chunks_replaced",
+                        workspace_id=self.workspace_id,
+                        location=location,
+                        removed=len(stale),
+                    )
+        entry = LedgerEntry(
+            workspace_id=self.workspace_id,
+            scope=self.scope,
+            location=location,
+            content_hash=content_hash,
+            document_ids=tracked_ids,
+            etag=etag,
+        )
+        self.ledger.record(entry)
+        self._known[location] = entry
+
+    def finalize(self) -> int:
+        """Remove chunks and entries of files that were not seen in this run.
+
+        Returns:
+            Number of deleted files
+        """
+        if self.ledger is None:
+            return 0
+        return self.forget([location for location in self._known if location not in self._seen])
+
+    def forget(self, locations: Iterable[str]) -> int:
+        """Remove chunks and entries of files known to be deleted from the source.
+
+        Returns:
+            Number of deleted files that were tracked in the ledger
+        """
+        if self.ledger is None:
+            return 0
+        deleted = [location for location in dict.fromkeys(locations) if location in self._known]
+        if not deleted:
+            return 0
+
+        document_ids = [doc_id for location in deleted for doc_id in self._known[location].document_ids]
+        if document_ids:
+            try:
+                self.document_store.delete_documents(document_ids=document_ids)
+            except Exception as exc:
+                # Leave the entries in place so the next run retries the delete.
+                logger.warning(
+                    "ingestion_ledger.chunk_delete_failed",
+                    workspace_id=self.workspace_id,
+                    scope=self.scope,
+                    error=str(exc),
+                )
+                return 0
+        self.ledger.remove(self.workspace_id, self.scope, deleted)
+        get_document_counts().invalidate(self.document_store)
+        for location in deleted:
+            self._known.pop(location, None)
+
+        logger.info(
+            "ingestion_ledger.files_deleted",
+            workspace_id=self.workspace_id,
+            scope=self.scope,
+            deleted_files=len(deleted),
+            removed_chunks=len(document_ids),
+        )
+        return len(deleted)
+
+
+@lru_cache(maxsize=1)
+def get_ingestion_ledger() -> IngestionLedger:
+    """Get the process-wide ingestion ledger."""
+    return IngestionLedger(settings.ingestion_ledger_path)
+
+
+__all__ = [
+    "IncrementalSync",
+    "IngestionLedger",
+    "LedgerEntry",
+    "compute_file_sha256",
+    "get_ingestion_ledger",
+]
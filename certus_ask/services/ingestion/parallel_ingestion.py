@@ -0,0 +1,338 @@
+"""Parallel file ingestion backed by a bounded worker process pool.
+
+The sequential ingestion path runs the full preprocessing pipeline once per
+file, so conversion, cleaning and PII scanning of large folders and
+repositories are limited to a single core. Here those CPU-bound stages run in
+worker processes (one conversion pipeline per worker), while the parent
+embeds and writes chunks in batches that span many files, keeping the shared
+embedding model and the OpenSearch bulk writes busy.
+
+Files are only handed to idle workers, and each may run for at most
+``settings.converter_timeout_seconds`` once a worker starts it. A file that
+hangs gets its pool terminated and rebuilt, and a worker that dies breaks its
+pool the same way; the other files that were running on that pool are run
+once more on the new one rather than failed.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from certus_ask.core.config import settings
+from certus_ask.core.metrics import stage_attributes
+from certus_ask.services.ingestion.converter_pool import terminate_executor
+from certus_ask.services.ingestion.jobs import report_progress
+
+logger = structlog.get_logger(__name__)
+
+# Runs per file when its pool breaks; a file that breaks two pools is failed.
+_MAX_ATTEMPTS = 2
+
+# Per-worker-process state, built on the first file each worker handles.
+_worker_components: tuple[Any, Any] | None = None
+
+
+def _get_worker_components() -> tuple[Any, Any]:
+    global _worker_components
+    if _worker_components is None:
+        from certus_ask.pipelines.preprocessing import LoggingDocumentSplitter, create_conversion_pipeline
+
+        _worker_components = (
+            create_conversion_pipeline(),
+            LoggingDocumentSplitter(split_by="word", split_length=150, split_overlap=50),
+        )
+    return _worker_components
+
+
+def prepare_file(file_path: str, metadata_context: dict[str, Any]) -> dict[str, Any]:
+    """Convert, clean, scan and chunk a single file (runs inside a worker process).
+
+    Args:
+        file_path: Path of the file to convert
+        metadata_context: Keyword arguments for ``enrich_documents_with_metadata``
+
+    Returns:
+        Dictionary with ``documents`` (enriched chunks), ``quarantined`` (count)
+        and ``metadata_preview``, or ``error`` when the file could not be processed.
+    """
+    from certus_ask.pipelines.metadata import enrich_documents_with_metadata
+
+    try:
+        conversion_pipeline, splitter = _get_worker_components()
+        result = conversion_pipeline.run({"file_type_router": {"sources": [Path(file_path)]}})
+        stage = result.get("presidio_anonymizer") or result.get("document_cleaner") or {}
+        documents = stage.get("documents", [])
+        chunks = splitter.run(documents=documents)["documents"] if documents else []
+        metadata_preview = enrich_documents_with_metadata(chunks, **metadata_context) if chunks else []
+    except Exception as exc:
+        # Return the message rather than raising: arbitrary exceptions do not always pickle.
+        return {"error": str(exc)}
+
+    return {
+        "documents": chunks,
+        "quarantined": len(stage.get("quarantined", [])),
+        "metadata_preview": metadata_preview,
+    }
+
+
+def _spawn_process_pool(max_workers: int) -> Executor:
+    # Spawn rather than fork so workers never inherit model threads or open client sockets.
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+@dataclass
+class _PreparedFile:
+    file_path: Path
+    documents: list[Any]
+    quarantined: int
+    metadata_preview: list[dict[str, Any]]
+
+
+@dataclass
+class ParallelIngestionResult:
+    """Aggregate outcome of a parallel ingestion run."""
+
+    processed_files: int = 0
+    failed_files: int = 0
+    quarantined_count: int = 0
+    documents_written: int = 0
+    metadata_preview: list[dict[str, Any]] = field(default_factory=list)
+
+
+class ParallelFileIngestor:
+    """Ingest many files with conversion on a process pool and batched embedding/writes."""
+
+    def __init__(
+        self,
+        document_store: Any,
+        max_workers: int | None = None,
+        batch_size: int | None = None,
+        timeout_seconds: float | None = None,
+        executor_factory: Callable[[int], Executor] | None = None,
+        prepare: Callable[[str, dict[str, Any]], dict[str, Any]] | None = None,
+        embedder: Any = None,
+        writer: Any = None,
+    ):
+        """Initialize the ingestor.
+
+        Args:
+            document_store: OpenSearch document store receiving the chunks
+            max_workers: Worker processes (default: settings.ingestion_workers, 0 = CPU count)
+            batch_size: Chunks embedded and written per batch (default: settings.ingestion_batch_size)
+            timeout_seconds: Wall-clock limit per running file (default: settings.converter_timeout_seconds)
+            executor_factory: Callable ``(max_workers) -> Executor`` (default: spawn process pool)
+            prepare: Per-file worker function (default: ``prepare_file``)
+            embedder: Component with ``run(documents=...)`` (default: LoggingDocumentEmbedder)
+            writer: Component with ``run(documents=...)`` (default: LoggingDocumentWriter with SKIP policy)
+        """
+        workers = max_workers if max_workers is not None else settings.ingestion_workers
+        self.max_workers = max(1, workers or os.cpu_count() or 1)
+        self.batch_size = max(1, batch_size if batch_size is not None else settings.ingestion_batch_size)
+        self.timeout_seconds = timeout_seconds if timeout_seconds is not None else settings.converter_timeout_seconds
+        self._executor_factory = executor_factory or _spawn_process_pool
+        self._prepare = prepare or prepare_file
+
+        if embedder is None:
+            from certus_ask.pipelines.preprocessing import LoggingDocumentEmbedder
+            from certus_ask.services.embedding_models import DEFAULT_EMBEDDING_MODEL
+
+            embedder = LoggingDocumentEmbedder(model=DEFAULT_EMBEDDING_MODEL)
+        if writer is None:
+            from haystack.document_stores.types import DuplicatePolicy
+
+            from certus_ask.pipelines.preprocessing import LoggingDocumentWriter
+
+            writer = LoggingDocumentWriter(document_store, policy=DuplicatePolicy.SKIP)
+        self.embedder = embedder
+        self.writer = writer
+
+    def ingest(
+        self,
+        files: Iterable[tuple[Path, dict[str, Any]]],
+        event_prefix: str = "parallel_ingestion",
+        on_file_indexed: Callable[[Path, list[str]], None] | None = None,
+    ) -> ParallelIngestionResult:
+        """Ingest files and report per-file outcomes.
+
+        Args:
+            files: ``(file_path, metadata_context)`` pairs; consumed lazily
+            event_prefix: Log event prefix, e.g. "process_folder" or "process_github"
+            on_file_indexed: Called with ``(file_path, chunk_ids)`` once a file's chunks are written
+
+        Returns:
+            ParallelIngestionResult with processed/failed/quarantined counts
+        """
+        result = ParallelIngestionResult()
+        # future -> (file_path, metadata_context, attempt, executor, started)
+        running: dict[Future, tuple[Path, dict[str, Any], int, Executor, float]] = {}
+        retries: deque[tuple[Path, dict[str, Any], int]] = deque()
+        batch: list[_PreparedFile] = []
+        pending_files = iter(files)
+        start_time = time.time()
+        executor = self._executor_factory(self.max_workers)
+
+        def recycle(broken: Executor) -> None:
+            """Terminate a hung or broken pool; later files run on a fresh one."""
+            nonlocal executor
+            terminate_executor(broken)
+            if broken is executor:
+                executor = self._executor_factory(self.max_workers)
+
+        def submit(file_path: Path, metadata_context: dict[str, Any], attempt: int) -> None:
+            try:
+                future = executor.submit(self._prepare, str(file_path), metadata_context)
+            except RuntimeError:  # BrokenProcessPool: a worker died since the last collection
+                recycle(executor)
+                future = executor.submit(self._prepare, str(file_path), metadata_context)
+            running[future] = (file_path, metadata_context, attempt, executor, time.monotonic())
+
+        def fail(file_path: Path, error: str) -> None:
+            result.failed_files += 1
+            logger.error(f"{event_prefix}.file_failed", file_path=str(file_path), error=error)
+
+        try:
+            while True:
+                # Only hand files to idle workers, so a file's time limit starts when it begins running.
+                while len(running) < self.max_workers:
+                    if retries:
+                        submit(*retries.popleft())
+                        continue
+                    next_file = next(pending_files, None)
+                    if next_file is None:
+                        break
+                    logger.info(f"{event_prefix}.processing_file", file_path=str(next_file[0]))
+                    submit(next_file[0], next_file[1], 1)
+                if not running:
+                    break
+
+                timeout = None
+                if self.timeout_seconds:
+                    oldest = min(started for *_, started in running.values())
+                    timeout = max(0.0, oldest + self.timeout_seconds - time.monotonic())
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    file_path, metadata_context, attempt, pool, _ = running.pop(future)
+                    try:
+                        outcome = future.result()
+                    except Exception as exc:  # BrokenProcessPool or cancellation when a pool is terminated
+                        recycle(pool)
+                        if attempt < _MAX_ATTEMPTS:
+                            # Usually another file hung or crashed the pool; run this one again on a fresh one.
+                            logger.warning(f"{event_prefix}.file_requeued", file_path=str(file_path), error=str(exc))
+                            retries.append((file_path, metadata_context, attempt + 1))
+                        else:
+                            fail(file_path, str(exc) or type(exc).__name__)
+                        continue
+                    if "error" in outcome:
+                        fail(file_path, outcome["error"])
+                        continue
+                    batch.append(
+                        _PreparedFile(
+                            file_path=file_path,
+                            documents=outcome.get("documents", []),
+                            quarantined=outcome.get("quarantined", 0),
+                            metadata_preview=outcome.get("metadata_preview", []),
+                        )
+                    )
+
+                if self.timeout_seconds:
+                    now = time.monotonic()
+                    for future, (file_path, _, _, pool, started) in list(running.items()):
+                        if now - started >= self.timeout_seconds:
+                            del running[future]
+                            fail(file_path, f"processing timed out after {self.timeout_seconds}s")
+                            # Recycle only the pool running the hung file; its other files are requeued above.
+                            recycle(pool)
+
+                if sum(len(item.documents) for item in batch) >= self.batch_size:
+                    self._flush(batch, result, event_prefix, on_file_indexed)
+                    batch.clear()
+                report_progress(processed_files=result.processed_files, failed_files=result.failed_files)
+        finally:
+            if running:
+                terminate_executor(executor)
+            else:
+                executor.shutdown(wait=True)
+
+        if batch:
+            self._flush(batch, result, event_prefix, on_file_indexed)
+            report_progress(processed_files=result.processed_files, failed_files=result.failed_files)
+
+        logger.info(
+            f"{event_prefix}.parallel_complete",
+            workers=self.max_workers,
+            processed_files=result.processed_files,
+            failed_files=result.failed_files,
+            documents_written=result.documents_written,
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+        return result
+
+    def _flush(
+        self,
+        batch: list[_PreparedFile],
+        result: ParallelIngestionResult,
+        event_prefix: str,
+        on_file_indexed: Callable[[Path, list[str]], None] | None = None,
+    ) -> None:
+        """Embed and write one cross-file batch; a failure fails every file in it."""
+        documents = [doc for item in batch for doc in item.documents]
+        # Chunks carry their metadata envelope; attribute stage metrics to the job's workspace and source.
+        meta = documents[0].meta if documents and isinstance(documents[0].meta, dict) else {}
+        with stage_attributes(meta.get("metadata_envelope", {}).get("workspace_id"), meta.get("source")):
+            self._embed_and_write(batch, documents, result, event_prefix, on_file_indexed)
+
+    def _embed_and_write(
+        self,
+        batch: list[_PreparedFile],
+        documents: list[Any],
+        result: ParallelIngestionResult,
+        event_prefix: str,
+        on_file_indexed: Callable[[Path, list[str]], None] | None,
+    ) -> None:
+        try:
+            written = 0
+            if documents:
+                embedded = self.embedder.run(documents=documents)["documents"]
+                written = self.writer.run(documents=embedded).get("documents_written", 0)
+        except Exception as exc:
+            for item in batch:
+                result.failed_files += 1
+                logger.error(f"{event_prefix}.file_failed", file_path=str(item.file_path), error=str(exc))
+            return
+
+        result.documents_written += written
+        logger.info(
+            f"{event_prefix}.batch_written",
+            file_count=len(batch),
+            chunk_count=len(documents),
+            documents_written=written,
+        )
+
+        for item in batch:
+            result.processed_files += 1
+            if on_file_indexed is not None:
+                on_file_indexed(item.file_path, [doc.id for doc in item.documents])
+            if item.quarantined:
+                result.quarantined_count += item.quarantined
+                logger.warning(
+                    f"{event_prefix}.file_quarantined",
+                    file_path=str(item.file_path),
+                    quarantined_count=item.quarantined,
+                )
+            if len(result.metadata_preview) < 3:
+                result.metadata_preview.extend(item.metadata_preview[: 3 - len(result.metadata_preview)])
+
+
+__all__ = ["ParallelFileIngestor", "ParallelIngestionResult", "prepare_file"]
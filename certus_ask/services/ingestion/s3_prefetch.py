@@ -0,0 +1,149 @@
+"""Prefetching S3 downloads for prefix ingestion.
+
+Prefix ingestion used to download one object, run the pipeline on it and only
+then start the next download, so the network sat idle during conversion and
+embedding and the CPU sat idle during downloads. ``prefetch_objects`` keeps up
+to ``settings.s3_prefetch_objects`` downloads running or buffered on a small
+thread pool while the caller processes earlier objects. Each local copy is
+deleted as soon as the caller moves on.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from certus_ask.core.config import settings
+from certus_ask.core.metrics import get_pipeline_stage_metrics
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class PrefetchedObject:
+    """An S3 object downloaded ahead of processing (or the error that prevented it)."""
+
+    key: str
+    object: dict[str, Any]
+    local_path: Path | None = None
+    error: str | None = None
+    size_bytes: int = 0
+    download_seconds: float = 0.0
+
+
+def _download(
+    download: Callable[[str, Path], None],
+    obj: dict[str, Any],
+    local_path: Path,
+) -> PrefetchedObject:
+    key = obj["Key"]
+    start_time = time.time()
+    try:
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        download(key, local_path)
+        size_bytes = local_path.stat().st_size
+    except Exception as exc:
+        duration = time.time() - start_time
+        get_pipeline_stage_metrics().record_stage("download", duration, document_count=1, success=False)
+        return PrefetchedObject(key=key, object=obj, error=str(exc), download_seconds=duration)
+
+    duration = time.time() - start_time
+    get_pipeline_stage_metrics().record_stage("download", duration, document_count=1, size_bytes=size_bytes)
+    return PrefetchedObject(
+        key=key, object=obj, local_path=local_path, size_bytes=size_bytes, download_seconds=duration
+    )
+
+
+def prefetch_objects(
+    objects: Iterable[dict[str, Any]],
+    download: Callable[[str, Path], None],
+    temp_dir: Path,
+    max_prefetch: int | None = None,
+    max_workers: int | None = None,
+    event_prefix: str = "s3_prefetch",
+) -> Iterator[PrefetchedObject]:
+    """Download objects ahead of the consumer and yield them in listing order.
+
+    Args:
+        objects: Object dicts with at least ``Key``; consumed lazily, so callers can filter as they go
+        download: ``(key, local_path)`` callable performing one download
+        temp_dir: Directory receiving the local copies
+        max_prefetch: Objects downloading or downloaded but not yet consumed (default: settings.s3_prefetch_objects)
+        max_workers: Concurrent downloads (default: settings.s3_download_workers)
+        event_prefix: Log event prefix
+
+    Yields:
+        PrefetchedObject per object; its local file is removed when the consumer advances
+    """
+    prefetch = max(1, max_prefetch if max_prefetch is not None else settings.s3_prefetch_objects)
+    workers = max(1, min(prefetch, max_workers if max_workers is not None else settings.s3_download_workers))
+    pending: deque[Future] = deque()
+    source = iter(objects)
+    exhausted = False
+    sequence = 0
+    downloaded_bytes = 0
+    download_seconds = 0.0
+    wait_seconds = 0.0
+    busy_seconds = 0.0
+    count = 0
+    start_time = time.time()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-prefetch") as executor:
+        try:
+            while True:
+                while not exhausted and len(pending) < prefetch:
+                    obj = next(source, None)
+                    if obj is None:
+                        exhausted = True
+                        break
+                    # One directory per object keeps the original file name without collisions.
+                    local_path = temp_dir / f"{sequence:06d}" / Path(obj["Key"]).name
+                    sequence += 1
+                    # Copy the context so stage metrics keep the caller's workspace/source attributes.
+                    context = contextvars.copy_context()
+                    pending.append(executor.submit(context.run, _download, download, obj, local_path))
+                if not pending:
+                    break
+
+                wait_start = time.time()
+                prefetched = pending.popleft().result()
+                wait_seconds += time.time() - wait_start
+                downloaded_bytes += prefetched.size_bytes
+                download_seconds += prefetched.download_seconds
+                count += 1
+
+                busy_start = time.time()
+                try:
+                    yield prefetched
+                finally:
+                    busy_seconds += time.time() - busy_start
+                    if prefetched.local_path is not None:
+                        prefetched.local_path.unlink(missing_ok=True)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    elapsed = time.time() - start_time
+    logger.info(
+        f"{event_prefix}.complete",
+        object_count=count,
+        download_workers=workers,
+        prefetch=prefetch,
+        downloaded_bytes=downloaded_bytes,
+        download_mb_per_s=round(downloaded_bytes / elapsed / (1024 * 1024), 2) if elapsed else 0.0,
+        download_seconds=round(download_seconds, 3),
+        processing_seconds=round(busy_seconds, 3),
+        waiting_on_download_seconds=round(wait_seconds, 3),
+        objects_per_s=round(count / elapsed, 2) if elapsed else 0.0,
+    )
+
+
+__all__ = ["PrefetchedObject", "prefetch_objects"]
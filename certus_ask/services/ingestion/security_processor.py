@@ -627,10 +627,12 @@ class SecurityProcessor:
             List of documents with embeddings attached
         """
         from certus_ask.pipelines.preprocessing import LoggingDocumentEmbedder
+        from certus_ask.services.embedding_models import DEFAULT_EMBEDDING_MODEL
 
         logger.info("embed_documents called", document_count=len(documents))
 
-        document_embedder = LoggingDocumentEmbedder(model="sentence-transformers/all-MiniLM-L6-v2")
+        # The embedder resolves its model from the shared registry, so construction is cheap.
+        document_embedder = LoggingDocumentEmbedder(model=DEFAULT_EMBEDDING_MODEL)
         embed_result = document_embedder.run(documents=documents)
         embedded_documents = embed_result.get("documents", [])
 
@@ -707,6 +709,7 @@ class SecurityProcessor:
         """
         from certus_ask.core.exceptions import DocumentParseError, ValidationError
         from certus_ask.pipelines.components import LoggingDocumentWriter
+        from certus_ask.services.document_counts import get_document_counts
         from certus_ask.services.ingestion import FileProcessor
 
         logger.info(
@@ -936,7 +939,7 @@ class SecurityProcessor:
                     filename=source_name,
                     format=detected_format,
                     items_indexed=findings_indexed,
-                    total_documents=document_store.count_documents(),
+                    total_documents=get_document_counts().count(document_store),
                     neo4j_enabled=settings and settings.neo4j_enabled,
                 )
 
@@ -944,7 +947,9 @@ class SecurityProcessor:
             return {
                 "ingestion_id": ingestion_id,
                 "findings_indexed": findings_indexed,
-                "document_count": document_store.count_documents() if document_store else len(embedded_documents),
+                "document_count": get_document_counts().count(document_store)
+                if document_store
+                else len(embedded_documents),
                 "neo4j_scan_id": neo4j_scan_id,
                 "neo4j_sbom_id": neo4j_sbom_id,
                 "format": detected_format,
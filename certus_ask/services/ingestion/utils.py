@@ -29,6 +29,21 @@ def extract_metadata_preview(writer_result: dict[str, Any], limit: int = 3) -> l
     return list(preview[:limit])
 
 
+def extract_document_ids(writer_result: dict[str, Any]) -> list[str]:
+    """Extract the IDs of documents handed to the DocumentWriter.
+
+    Args:
+        writer_result: Result dictionary from DocumentWriter
+
+    Returns:
+        List of document IDs (chunks skipped as duplicates included)
+    """
+    if "document_ids" in writer_result:
+        # Streamed files report IDs instead of holding on to every written chunk.
+        return list(writer_result["document_ids"])
+    return [doc.id for doc in writer_result.get("documents") or []]
+
+
 def get_upload_file_size(uploaded_file: UploadFile) -> int:
     """Get the size of an uploaded file without relying on UploadFile.size.
 
@@ -0,0 +1,256 @@
+"""Concurrent web page ingestion with batched embedding and writes.
+
+Pages are fetched concurrently (bounded overall and per host) on one shared
+HTTP client. Fetched pages are converted, cleaned and split, then embedded and
+written in batches that span many pages. Fetching continues while a batch is
+processed off the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+import structlog
+
+from certus_ask.core.config import settings
+from certus_ask.core.metrics import stage_attributes
+from certus_ask.services.ingestion.jobs import report_progress
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class _FetchedPage:
+    url: str
+    html: str | None
+
+
+@dataclass
+class WebIngestionResult:
+    """Aggregate outcome of a web ingestion run."""
+
+    indexed_urls: list[str] = field(default_factory=list)
+    skipped_urls: list[str] = field(default_factory=list)
+    documents_written: int = 0
+    metadata_preview: list[dict[str, Any]] = field(default_factory=list)
+
+
+class WebPageIngestor:
+    """Fetch pages concurrently and index them in cross-page batches."""
+
+    def __init__(
+        self,
+        document_store: Any,
+        max_concurrency: int | None = None,
+        per_host_limit: int | None = None,
+        batch_pages: int | None = None,
+        timeout_seconds: float | None = None,
+        client_factory: Callable[..., Any] | None = None,
+        converter: Any = None,
+        cleaner: Any = None,
+        splitter: Any = None,
+        embedder: Any = None,
+        writer: Any = None,
+    ):
+        """Initialize the ingestor.
+
+        Args:
+            document_store: OpenSearch document store receiving the chunks
+            max_concurrency: Concurrent fetches overall (default: settings.web_fetch_concurrency)
+            per_host_limit: Concurrent fetches per host (default: settings.web_fetch_per_host)
+            batch_pages: Pages converted, embedded and written per batch (default: settings.web_ingest_batch_pages)
+            timeout_seconds: Per-request timeout (default: settings.web_fetch_timeout_seconds)
+            client_factory: Callable returning an async HTTP client context manager (default: httpx.AsyncClient)
+            converter: HTML converter with ``run(sources=...)`` (default: HTMLToDocument)
+            cleaner: Component with ``run(documents=...)`` (default: LoggingDocumentCleaner)
+            splitter: Component with ``run(documents=...)`` (default: LoggingDocumentSplitter)
+            embedder: Component with ``run(documents=...)`` (default: LoggingDocumentEmbedder)
+            writer: Component with ``run(documents=..., metadata_context=...)`` (default: LoggingDocumentWriter)
+        """
+        concurrency = max_concurrency if max_concurrency is not None else settings.web_fetch_concurrency
+        per_host = per_host_limit if per_host_limit is not None else settings.web_fetch_per_host
+        self.max_concurrency = max(1, concurrency)
+        self.per_host_limit = max(1, min(per_host, self.max_concurrency))
+        self.batch_pages = max(1, batch_pages if batch_pages is not None else settings.web_ingest_batch_pages)
+        self.timeout_seconds = timeout_seconds if timeout_seconds is not None else settings.web_fetch_timeout_seconds
+        self._client_factory = client_factory
+
+        from certus_ask.pipelines import preprocessing
+
+        if converter is None:
+            from haystack.components.converters.html import HTMLToDocument
+
+            converter = HTMLToDocument()
+        if embedder is None:
+            from certus_ask.services.embedding_models import DEFAULT_EMBEDDING_MODEL
+
+            embedder = preprocessing.LoggingDocumentEmbedder(model=DEFAULT_EMBEDDING_MODEL)
+        if writer is None:
+            from haystack.document_stores.types import DuplicatePolicy
+
+            writer = preprocessing.LoggingDocumentWriter(document_store, policy=DuplicatePolicy.SKIP)
+        self.converter = converter
+        self.cleaner = cleaner or preprocessing.LoggingDocumentCleaner()
+        self.splitter = splitter or preprocessing.LoggingDocumentSplitter(
+            split_by="word", split_length=150, split_overlap=50
+        )
+        self.embedder = embedder
+        self.writer = writer
+
+    def _create_client(self) -> Any:
+        if self._client_factory is not None:
+            return self._client_factory()
+
+        import httpx
+
+        return httpx.AsyncClient(
+            timeout=self.timeout_seconds,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+
+    async def ingest(
+        self,
+        urls: list[str],
+        metadata_context: dict[str, Any],
+        event_prefix: str = "process_web",
+    ) -> WebIngestionResult:
+        """Fetch and index pages, reporting which URLs were indexed and which were skipped.
+
+        Args:
+            urls: Page URLs; duplicates are fetched once
+            metadata_context: Keyword arguments for ``enrich_documents_with_metadata``
+            event_prefix: Log event prefix
+
+        Returns:
+            WebIngestionResult with indexed and skipped URLs in completion order
+        """
+        result = WebIngestionResult()
+        unique_urls = list(dict.fromkeys(urls))
+        overall = asyncio.Semaphore(self.max_concurrency)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+        batch: list[_FetchedPage] = []
+        start_time = time.time()
+
+        async def fetch(client: Any, url: str) -> _FetchedPage:
+            host = urlparse(url).netloc.lower()
+            host_limit = host_limits.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+            async with host_limit, overall:
+                logger.info(f"{event_prefix}.fetching", url=url)
+                try:
+                    response = await client.get(url, follow_redirects=True)
+                    response.raise_for_status()
+                    return _FetchedPage(url=url, html=response.text)
+                except Exception as exc:
+                    logger.error(f"{event_prefix}.failed", url=url, error=str(exc))
+                    return _FetchedPage(url=url, html=None)
+
+        async with self._create_client() as client:
+            tasks = [asyncio.create_task(fetch(client, url)) for url in unique_urls]
+            try:
+                for next_page in asyncio.as_completed(tasks):
+                    page = await next_page
+                    if page.html is None:
+                        result.skipped_urls.append(page.url)
+                    else:
+                        batch.append(page)
+                    if len(batch) >= self.batch_pages:
+                        await self._flush(batch, metadata_context, result, event_prefix)
+                        batch = []
+                    report_progress(indexed_urls=len(result.indexed_urls), skipped_urls=len(result.skipped_urls))
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        if batch:
+            await self._flush(batch, metadata_context, result, event_prefix)
+            report_progress(indexed_urls=len(result.indexed_urls), skipped_urls=len(result.skipped_urls))
+
+        logger.info(
+            f"{event_prefix}.complete",
+            indexed_count=len(result.indexed_urls),
+            skipped_count=len(result.skipped_urls),
+            documents_written=result.documents_written,
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+        return result
+
+    async def _flush(
+        self,
+        batch: list[_FetchedPage],
+        metadata_context: dict[str, Any],
+        result: WebIngestionResult,
+        event_prefix: str,
+    ) -> None:
+        """Index one cross-page batch off the event loop; fetches keep running meanwhile."""
+        with stage_attributes(metadata_context.get("workspace_id"), metadata_context.get("source")):
+            await asyncio.to_thread(self._index_batch, batch, metadata_context, result, event_prefix)
+
+    def _convert(self, page: _FetchedPage, event_prefix: str) -> list[Any]:
+        from haystack.dataclasses import ByteStream
+
+        try:
+            source = ByteStream.from_string(page.html, meta={"url": page.url})
+            documents = self.converter.run(sources=[source]).get("documents", [])
+        except Exception as exc:
+            logger.error(f"{event_prefix}.failed", url=page.url, error=str(exc))
+            return []
+        if not documents:
+            logger.warning(f"{event_prefix}.no_content", url=page.url)
+        for doc in documents:
+            doc.meta.update({"url": page.url, "source_location": page.url})
+        return documents
+
+    def _index_batch(
+        self,
+        batch: list[_FetchedPage],
+        metadata_context: dict[str, Any],
+        result: WebIngestionResult,
+        event_prefix: str,
+    ) -> None:
+        """Convert, clean, split, embed and write one batch; a failure after conversion skips every page in it."""
+        converted: list[tuple[str, list[Any]]] = []
+        for page in batch:
+            documents = self._convert(page, event_prefix)
+            if documents:
+                converted.append((page.url, documents))
+            else:
+                result.skipped_urls.append(page.url)
+        if not converted:
+            return
+
+        documents = [doc for _, page_documents in converted for doc in page_documents]
+        try:
+            cleaned = self.cleaner.run(documents=documents)["documents"]
+            chunks = self.splitter.run(documents=cleaned)["documents"] if cleaned else []
+            embedded = self.embedder.run(documents=chunks)["documents"] if chunks else []
+            written = self.writer.run(documents=embedded, metadata_context=metadata_context).get("documents_written", 0)
+        except Exception as exc:
+            for url, _ in converted:
+                result.skipped_urls.append(url)
+                logger.error(f"{event_prefix}.failed", url=url, error=str(exc))
+            return
+
+        result.documents_written += written
+        logger.info(
+            f"{event_prefix}.batch_written",
+            page_count=len(converted),
+            chunk_count=len(chunks),
+            documents_written=written,
+        )
+        for url, page_documents in converted:
+            result.indexed_urls.append(url)
+            logger.info(f"{event_prefix}.processed", url=url, document_count=len(page_documents))
+            if len(result.metadata_preview) < 3:
+                result.metadata_preview.append({"url": url, "title": page_documents[0].meta.get("title", "Untitled")})
+
+
+__all__ = ["WebIngestionResult", "WebPageIngestor"]
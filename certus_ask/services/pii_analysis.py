@@ -0,0 +1,351 @@
+"""Batched PII analysis for the preprocessing pipeline.
+
+Presidio's ``AnalyzerEngine.analyze`` runs the full spaCy pipeline once per
+call, so scanning documents one at a time pays per-document NLP overhead.
+Here texts are analyzed in batches through Presidio's ``BatchAnalyzerEngine``
+(which feeds spaCy via ``nlp.pipe``), and large batches can be spread across a
+process pool whose workers load the spaCy model once each. Very large documents
+are analyzed as overlapping windows whose entity spans are merged afterwards.
+An optional regex/checksum prefilter skips NLP for texts without PII candidates,
+and results for previously seen texts are served from the shared result cache.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import re
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, ClassVar
+
+import structlog
+
+from certus_ask.core.config import settings
+from certus_integrity.services.presidio import (
+    CARD_NUMBER_PATTERN,
+    IPV4_PATTERN,
+    SSN_PATTERN,
+    valid_card_number,
+    valid_ipv4,
+    valid_ssn,
+)
+
+logger = structlog.get_logger(__name__)
+
+try:  # pragma: no cover - optional heavy dependency
+    from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine
+except Exception:  # pragma: no cover - presidio/spacy unavailable, regex fallback in use
+    AnalyzerEngine = BatchAnalyzerEngine = None  # type: ignore[assignment,misc]
+
+
+def analyze_in_process(analyzer: Any, texts: Sequence[str], batch_size: int | None = None) -> list[list[Any]]:
+    """Analyze texts with the given analyzer on the calling thread.
+
+    Presidio engines are run through ``BatchAnalyzerEngine`` so spaCy processes
+    the texts with ``nlp.pipe``; other analyzers (e.g. the regex fallback) are
+    called per text.
+
+    Returns:
+        One list of analyzer results per input text, in order
+    """
+    if BatchAnalyzerEngine is not None and isinstance(analyzer, AnalyzerEngine):
+        batch_analyzer = BatchAnalyzerEngine(analyzer_engine=analyzer)
+        return [
+            list(results)
+            for results in batch_analyzer.analyze_iterator(
+                list(texts), language="en", batch_size=batch_size or settings.pii_batch_size
+            )
+        ]
+    return [analyzer.analyze(text=text, entities=[], language="en") for text in texts]
+
+
+def _analyze_chunk(texts: list[str], batch_size: int) -> list[list[Any]]:
+    """Worker entry point: analyze a chunk with the worker's own (cached) analyzer."""
+    from certus_integrity.services import get_analyzer
+
+    return analyze_in_process(get_analyzer(), texts, batch_size)
+
+
+def _spawn_process_pool(max_workers: int) -> Executor:
+    # Spawn so workers never inherit model threads from the API process.
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class PiiAnalysisPool:
+    """Spreads PII analysis of large document batches across worker processes."""
+
+    def __init__(self, max_workers: int, executor_factory: Any = None, min_texts: int | None = None):
+        """Initialize the pool (workers start on first use).
+
+        Args:
+            max_workers: Worker processes
+            executor_factory: Callable ``(max_workers) -> Executor`` (default: spawn process pool)
+            min_texts: Batches smaller than this are analyzed in-process
+                (default: settings.pii_parallel_min_documents)
+        """
+        self.max_workers = max(1, max_workers)
+        self.min_texts = min_texts if min_texts is not None else settings.pii_parallel_min_documents
+        self._executor_factory = executor_factory or _spawn_process_pool
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._executor_factory(self.max_workers)
+            return self._executor
+
+    def analyze(self, analyzer: Any, texts: Sequence[str], batch_size: int | None = None) -> list[list[Any]]:
+        """Analyze texts, fanning out to workers when the batch is large enough.
+
+        Args:
+            analyzer: In-process analyzer used for small batches
+            texts: Texts to analyze
+            batch_size: spaCy ``nlp.pipe`` batch size (default: settings.pii_batch_size)
+
+        Returns:
+            One list of analyzer results per input text, in order
+        """
+        batch_size = batch_size or settings.pii_batch_size
+        if len(texts) < max(self.min_texts, 2):
+            return analyze_in_process(analyzer, texts, batch_size)
+
+        chunk_size = -(-len(texts) // self.max_workers)
+        chunks = [list(texts[start : start + chunk_size]) for start in range(0, len(texts), chunk_size)]
+        executor = self._get_executor()
+        futures = [executor.submit(_analyze_chunk, chunk, batch_size) for chunk in chunks]
+        results: list[list[Any]] = []
+        for future in futures:
+            results.extend(future.result())
+        logger.debug("pii_analysis.parallel_batch", text_count=len(texts), chunks=len(chunks))
+        return results
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+@lru_cache(maxsize=1)
+def get_pii_analysis_pool() -> PiiAnalysisPool | None:
+    """Get the process-wide PII analysis pool, or None when settings.pii_workers is 0."""
+    if settings.pii_workers <= 0:
+        return None
+    return PiiAnalysisPool(settings.pii_workers)
+
+
+def split_windows(text: str, window_chars: int, overlap_chars: int) -> list[tuple[int, int]]:
+    """Return overlapping ``(start, end)`` windows covering ``text``.
+
+    Window ends are moved back to the nearest whitespace within the overlap so
+    words are not cut; a single window is returned for short texts.
+    """
+    if len(text) <= window_chars:
+        return [(0, len(text))]
+    overlap_chars = min(overlap_chars, window_chars // 2)
+    windows: list[tuple[int, int]] = []
+    start = 0
+    while True:
+        end = min(start + window_chars, len(text))
+        if end < len(text):
+            cut = text.rfind(" ", end - overlap_chars // 2, end)
+            end = cut if cut > start else end
+        windows.append((start, end))
+        if end >= len(text):
+            return windows
+        start = max(end - overlap_chars, start + 1)
+
+
+def _merge_window_results(windows: list[tuple[int, int]], window_results: list[list[Any]]) -> list[Any]:
+    """Shift window-relative spans to document offsets and merge duplicates from overlaps.
+
+    A span touching an interior window edge is dropped when the neighbouring
+    window fully contains it (that window saw the entity uncut); spans contained
+    in a same-type span from another window are dropped as partial detections.
+    """
+    spans: list[Any] = []
+    last = len(windows) - 1
+    for index, ((start, end), results) in enumerate(zip(windows, window_results)):
+        for result in results:
+            result.start += start
+            result.end += start
+            if index < last and result.end == end and result.start >= windows[index + 1][0]:
+                continue
+            if index > 0 and result.start == start and result.end <= windows[index - 1][1]:
+                continue
+            spans.append(result)
+
+    # Sorted by start, longest (then highest-scoring) first: every kept span of a type starts at or
+    # before the current one, so it is contained in one of them iff it ends before their furthest end.
+    spans.sort(key=lambda span: (span.start, -(span.end - span.start), -span.score))
+    merged: list[Any] = []
+    furthest_end: dict[str, int] = {}
+    for span in spans:
+        if furthest_end.get(span.entity_type, -1) >= span.end:
+            continue
+        furthest_end[span.entity_type] = span.end
+        merged.append(span)
+    return merged
+
+
+class PiiPrefilter:
+    """Cheap candidate check that decides whether a text needs full PII analysis.
+
+    Runs compiled email, phone, payment card (Luhn), SSN and IP patterns plus a
+    personal-name check that needs a name cue (an honorific such as "Dr." or a
+    lead-in such as "by", "Dear" or "Name:") before a capitalized pair. Texts
+    without any candidate skip the NLP analyzer entirely, so names and places
+    only the NER model would find without such a cue are not analyzed: that
+    recall is traded for skipping ordinary title-case prose and headings.
+    """
+
+    # (pattern, validator) pairs; patterns are searched separately so a failed
+    # checksum on one kind of match never hides another kind in the same text.
+    _CHECKS: ClassVar[tuple[tuple[re.Pattern[str], Callable[[str], bool] | None], ...]] = (
+        (re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}"), None),
+        (re.compile(r"(?:\+\d{1,3}[\s.-]?)?\(?\b\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b"), None),
+        (re.compile(r"\b(?:[0-9A-Fa-f]{1,4}:){3,7}[0-9A-Fa-f]{1,4}\b"), None),
+        (
+            re.compile(
+                r"\b(?:(?:Mr|Mrs|Ms|Miss|Dr|Prof)\.?\s+[A-Z][a-z]+"
+                r"|(?:[Bb]y|[Dd]ear|[Hh]i|[Hh]ello|[Ss]igned|[Cc]ontact|[Aa]ttn:?|[Nn]ame:|[Aa]uthor:|[Cc]c:)"
+                r"\s+[A-Z][a-z]+(?:\s+[A-Z]\.)?\s+[A-Z][a-z]+)\b"
+            ),
+            None,
+        ),
+        (SSN_PATTERN, valid_ssn),
+        (IPV4_PATTERN, valid_ipv4),
+        (CARD_NUMBER_PATTERN, valid_card_number),
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.scanned = 0
+        self.passed = 0
+
+    def has_candidates(self, text: str) -> bool:
+        """Return True if the text contains anything that may be PII."""
+        for pattern, validator in self._CHECKS:
+            if validator is None:
+                if pattern.search(text):
+                    return True
+            elif any(validator(match.group()) for match in pattern.finditer(text)):
+                return True
+        return False
+
+    def select(self, texts: Sequence[str]) -> list[int]:
+        """Return the indices of texts that need full analysis and update pass-through counters."""
+        selected = [index for index, text in enumerate(texts) if self.has_candidates(text)]
+        with self._lock:
+            self.scanned += len(texts)
+            self.passed += len(selected)
+        return selected
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "scanned": self.scanned,
+                "passed": self.passed,
+                "pass_rate": round(self.passed / self.scanned, 4) if self.scanned else 0.0,
+            }
+
+
+@lru_cache(maxsize=1)
+def get_pii_prefilter() -> PiiPrefilter | None:
+    """Get the process-wide PII prefilter, or None when settings.pii_prefilter_enabled is off."""
+    return PiiPrefilter() if settings.pii_prefilter_enabled else None
+
+
+def analyze_texts(analyzer: Any, texts: Sequence[str]) -> list[list[Any]]:
+    """Analyze a batch of texts for PII using the configured execution mode.
+
+    With the prefilter enabled, texts without PII candidates are skipped and get
+    no results. Texts already analyzed with the same recognizer configuration
+    are answered from the PII result cache. Texts longer than ``settings.pii_window_chars`` are analyzed as
+    overlapping windows (bounding spaCy memory and staying under its
+    ``max_length``); the windows join the same batch, so a large document is
+    spread across the pool like many small ones, and their spans are merged
+    back per text.
+
+    Args:
+        analyzer: Analyzer from ``get_analyzer()`` (used in-process)
+        texts: Texts to analyze
+
+    Returns:
+        One list of analyzer results per input text, in order
+    """
+    if not texts:
+        return []
+
+    prefilter = get_pii_prefilter()
+    if prefilter is not None:
+        selected = prefilter.select(texts)
+        if len(selected) < len(texts):
+            logger.debug("pii_analysis.prefiltered", text_count=len(texts), analyzed=len(selected))
+            results: list[list[Any]] = [[] for _ in texts]
+            for index, text_results in zip(selected, _analyze_with_cache(analyzer, [texts[i] for i in selected])):
+                results[index] = text_results
+            return results
+    return _analyze_with_cache(analyzer, texts)
+
+
+def _analyze_with_cache(analyzer: Any, texts: Sequence[str]) -> list[list[Any]]:
+    from certus_integrity.services.pii_cache import analyzer_config_version, get_pii_result_cache
+
+    cache = get_pii_result_cache()
+    version = analyzer_config_version(analyzer) if cache is not None and texts else None
+    if version is None:
+        return _analyze_selected(analyzer, texts)
+
+    keys = [cache.make_key(version, text) for text in texts]
+    results: list[list[Any] | None] = [cache.get(key) for key in keys]
+    # Analyze each distinct uncached text once, even if it repeats within the batch.
+    pending: dict[Any, list[int]] = {}
+    for index, cached in enumerate(results):
+        if cached is None:
+            pending.setdefault(keys[index], []).append(index)
+    if pending:
+        indices = list(pending.values())
+        for positions, text_results in zip(indices, _analyze_selected(analyzer, [texts[p[0]] for p in indices])):
+            cache.put(keys[positions[0]], text_results)
+            results[positions[0]] = text_results
+            for position in positions[1:]:
+                results[position] = cache.get(keys[position])
+        logger.debug("pii_analysis.cache", text_count=len(texts), analyzed=len(indices))
+    return results  # type: ignore[return-value]
+
+
+def _analyze_selected(analyzer: Any, texts: Sequence[str]) -> list[list[Any]]:
+    if not texts:
+        return []
+
+    layouts = [split_windows(text, settings.pii_window_chars, settings.pii_window_overlap) for text in texts]
+    segments = [text[start:end] for text, windows in zip(texts, layouts) for start, end in windows]
+    windowed = sum(1 for windows in layouts if len(windows) > 1)
+    if windowed:
+        logger.info("pii_analysis.windowed", windowed_texts=windowed, segments=len(segments))
+
+    pool = get_pii_analysis_pool()
+    segment_results = analyze_in_process(analyzer, segments) if pool is None else pool.analyze(analyzer, segments)
+
+    results: list[list[Any]] = []
+    position = 0
+    for windows in layouts:
+        window_results = segment_results[position : position + len(windows)]
+        position += len(windows)
+        results.append(window_results[0] if len(windows) == 1 else _merge_window_results(windows, window_results))
+    return results
+
+
+__all__ = [
+    "PiiAnalysisPool",
+    "PiiPrefilter",
+    "analyze_in_process",
+    "analyze_texts",
+    "get_pii_analysis_pool",
+    "get_pii_prefilter",
+    "split_windows",
+]
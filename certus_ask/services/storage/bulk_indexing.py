@@ -0,0 +1,350 @@
+"""Bulk-ingest mode for OpenSearch document stores.
+
+Haystack's ``DocumentWriter`` issues one synchronous bulk call per write with
+``refresh="wait_for"``, so large folder and S3 ingests spend most of their
+indexing time on small requests waiting for refreshes. Inside
+``bulk_ingest_mode`` writes go through ``opensearchpy.helpers.parallel_bulk``
+without refreshing, and the index's ``refresh_interval`` is set to ``-1`` (and
+replicas dropped) until the last concurrent job on that index finishes, when
+the original settings are restored and the index is refreshed once.
+
+The original settings are also saved in the index mapping's ``_meta`` while
+the index is tuned, so an index left tuned by a crashed or killed process is
+restored by ``restore_interrupted_bulk_mode`` when the app next starts. Each
+process using the index records a lease there (``host:pid`` and a heartbeat
+renewed in the background), and the settings are restored only once no other
+process holds a live lease, so one worker starting up or finishing does not
+re-enable refresh under another worker's running job.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import structlog
+
+from certus_ask.core.config import settings
+from certus_ask.services.document_counts import get_document_counts
+
+logger = structlog.get_logger(__name__)
+
+_TUNED_SETTINGS = ("index.refresh_interval", "index.number_of_replicas")
+# Mapping ``_meta`` key holding the settings to restore while an index is tuned.
+_META_KEY = "certus_bulk_ingest_original_settings"
+# Mapping ``_meta`` key holding ``host:pid`` -> last heartbeat (epoch seconds) of each process using the index.
+_LEASE_KEY = "certus_bulk_ingest_leases"
+
+_bulk_indices: contextvars.ContextVar[frozenset[str]] = contextvars.ContextVar("bulk_indices", default=frozenset())
+# Guards only the bookkeeping below; OpenSearch calls run under the per-index lock.
+_active_lock = threading.Lock()
+# index name -> active jobs
+_active: dict[str, int] = {}
+# index name -> settings to restore, while the index is tuned
+_tuned: dict[str, dict[str, Any]] = {}
+# index name -> lock serializing tuning and restoring of that index
+_index_locks: dict[str, threading.Lock] = {}
+# index name -> client used to renew this process's lease, while the index is tuned
+_lease_clients: dict[str, Any] = {}
+_heartbeat: threading.Thread | None = None
+
+
+def _store_client(document_store: Any) -> Any:
+    # The Haystack store creates its client (and the index) lazily.
+    ensure_initialized = getattr(document_store, "_ensure_initialized", None)
+    if ensure_initialized is not None:
+        ensure_initialized()
+    return getattr(document_store, "_client", None) or document_store.client
+
+
+def _store_index(document_store: Any) -> str:
+    return document_store._index
+
+
+def bulk_mode_active(document_store: Any) -> bool:
+    """Return True if the current context is inside ``bulk_ingest_mode`` for this store's index."""
+    index = getattr(document_store, "_index", None)
+    return index is not None and index in _bulk_indices.get()
+
+
+def _owner() -> str:
+    # Computed on each call so forked workers do not share their parent's lease.
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _lease_live(owner: str, heartbeat: float, now: float) -> bool:
+    if now - heartbeat > settings.opensearch_bulk_lease_seconds:
+        return False
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname() or os.name != "posix":
+        return True
+    if owner == _owner():
+        # Our own lease is never held by a job here (those are skipped), so it was left by an earlier process.
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except (ProcessLookupError, ValueError):
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _read_meta(client: Any, index: str) -> dict[str, Any]:
+    current = client.indices.get_mapping(index=index)
+    return dict(next(iter(current.values()), {}).get("mappings", {}).get("_meta") or {})
+
+
+def _write_meta(client: Any, index: str, meta: dict[str, Any]) -> None:
+    # A mapping update replaces the whole ``_meta`` object, so callers merge into what is there.
+    client.indices.put_mapping(index=index, body={"_meta": meta})
+
+
+def _tune_index(client: Any, index: str) -> dict[str, Any]:
+    tuned: dict[str, Any] = {"index.refresh_interval": "-1"}
+    if settings.opensearch_bulk_drop_replicas:
+        tuned["index.number_of_replicas"] = 0
+    meta = _read_meta(client, index)
+    # Another process may have tuned the index already; only its saved settings are the originals.
+    original = meta.get(_META_KEY)
+    if original is None:
+        current = client.indices.get_settings(index=index, flat_settings=True)
+        index_settings = next(iter(current.values()), {}).get("settings", {})
+        original = {name: index_settings.get(name) for name in tuned}
+    meta[_META_KEY] = original
+    meta[_LEASE_KEY] = {**(meta.get(_LEASE_KEY) or {}), _owner(): time.time()}
+    # Persist before tuning so a crash at any point after leaves a way back.
+    _write_meta(client, index, meta)
+    client.indices.put_settings(index=index, body=tuned)
+    logger.info("opensearch.bulk_mode_enabled", index=index, original=original)
+    return original
+
+
+def _restore_index(client: Any, index: str, original: dict[str, Any], owner: str | None) -> bool:
+    """Drop ``owner``'s lease and restore the settings unless another process holds a live lease."""
+    meta = _read_meta(client, index)
+    leases = dict(meta.get(_LEASE_KEY) or {})
+    if owner is not None:
+        leases.pop(owner, None)
+    now = time.time()
+    live = {name: heartbeat for name, heartbeat in leases.items() if _lease_live(name, heartbeat, now)}
+    if live:
+        # The last of those processes to finish restores the index.
+        meta[_LEASE_KEY] = live
+        _write_meta(client, index, meta)
+        logger.info("opensearch.bulk_mode_still_leased", index=index, owners=sorted(live))
+        return False
+    # None resets a setting that was not set explicitly to the cluster default.
+    client.indices.put_settings(index=index, body=original)
+    client.indices.refresh(index=index)
+    meta.pop(_META_KEY, None)
+    meta.pop(_LEASE_KEY, None)
+    _write_meta(client, index, meta)
+    logger.info("opensearch.bulk_mode_restored", index=index, restored=original)
+    return True
+
+
+def _renew_leases() -> None:
+    global _heartbeat
+    interval = max(1, settings.opensearch_bulk_lease_seconds) / 3
+    while True:
+        time.sleep(interval)
+        with _active_lock:
+            clients = dict(_lease_clients)
+            if not clients:
+                _heartbeat = None
+                return
+        for index, client in clients.items():
+            with _index_locks[index]:
+                if index not in _tuned:
+                    continue
+                try:
+                    meta = _read_meta(client, index)
+                    meta[_LEASE_KEY] = {**(meta.get(_LEASE_KEY) or {}), _owner(): time.time()}
+                    _write_meta(client, index, meta)
+                except Exception as exc:
+                    logger.warning("opensearch.bulk_mode_lease_renewal_failed", index=index, error=str(exc))
+
+
+def _ensure_heartbeat() -> None:
+    global _heartbeat
+    with _active_lock:
+        if _heartbeat is None:
+            _heartbeat = threading.Thread(target=_renew_leases, name="bulk-mode-heartbeat", daemon=True)
+            _heartbeat.start()
+
+
+def restore_interrupted_bulk_mode(document_store: Any) -> list[str]:
+    """Restore indices left in bulk-ingest mode by a process that did not exit cleanly.
+
+    Checks the store's index and every index sharing its name as a prefix (the
+    per-workspace indices) for settings saved by ``bulk_ingest_mode``, skipping
+    indices with a job running in this process or a live lease held by another
+    (a recent heartbeat, and on this host a pid that is still running).
+
+    Args:
+        document_store: Default OpenSearch document store
+
+    Returns:
+        Names of the indices that were restored
+    """
+    client = _store_client(document_store)
+    mappings = client.indices.get_mapping(index=f"{_store_index(document_store)}*")
+    restored = []
+    for index, body in mappings.items():
+        original = (body.get("mappings", {}).get("_meta") or {}).get(_META_KEY)
+        if original is None:
+            continue
+        with _active_lock:
+            lock = _index_locks.setdefault(index, threading.Lock())
+        with lock:
+            if _active.get(index) or index in _tuned:
+                continue
+            if not _restore_index(client, index, original, None):
+                continue
+        logger.warning("opensearch.bulk_mode_recovered", index=index, restored=original)
+        restored.append(index)
+    return restored
+
+
+@contextmanager
+def bulk_ingest_mode(document_store: Any) -> Iterator[None]:
+    """Run a large ingestion job with bulk writes and index refresh disabled.
+
+    Nested and concurrent jobs on the same index are reference counted so the
+    settings are restored only when the last one exits, and only if no other
+    process holds a live lease on the index. Failing to tune the index is
+    logged and ingestion proceeds with its current settings.
+
+    Args:
+        document_store: OpenSearch document store the job writes to
+    """
+    if not settings.opensearch_bulk_ingest:
+        yield
+        return
+
+    index = _store_index(document_store)
+    with _active_lock:
+        _active[index] = _active.get(index, 0) + 1
+        lock = _index_locks.setdefault(index, threading.Lock())
+
+    # Jobs on other indices never wait on these calls; jobs on this index wait only for its tuning.
+    with lock:
+        if index not in _tuned:
+            try:
+                client = _store_client(document_store)
+                _tuned[index] = _tune_index(client, index)
+                with _active_lock:
+                    _lease_clients[index] = client
+            except Exception as exc:
+                logger.warning("opensearch.bulk_mode_tuning_failed", index=index, error=str(exc))
+        if index in _tuned:
+            _ensure_heartbeat()
+
+    token = _bulk_indices.set(_bulk_indices.get() | {index})
+    try:
+        yield
+    finally:
+        _bulk_indices.reset(token)
+        with _active_lock:
+            _active[index] -= 1
+            if not _active[index]:
+                del _active[index]
+        with lock:
+            # Re-check under the index lock: a job may have entered since this one left.
+            with _active_lock:
+                last = index not in _active
+            if last and index in _tuned:
+                with _active_lock:
+                    client = _lease_clients.pop(index)
+                try:
+                    _restore_index(client, index, _tuned.pop(index), _owner())
+                except Exception as exc:
+                    logger.error("opensearch.bulk_mode_restore_failed", index=index, error=str(exc))
+        # Counts read while refresh was off missed unrefreshed writes.
+        get_document_counts().invalidate(document_store)
+
+
+def _document_actions(documents: list[Any], policy: Any) -> Iterator[dict[str, Any]]:
+    """Build bulk actions the same way ``OpenSearchDocumentStore.write_documents`` does."""
+    from haystack.document_stores.types import DuplicatePolicy
+
+    op_type = "index" if policy == DuplicatePolicy.OVERWRITE else "create"
+    for document in documents:
+        source = document.to_dict()
+        source.pop("sparse_embedding", None)
+        routing = source.pop("_routing", None)
+        action = {"_op_type": op_type, "_id": document.id, "_source": source}
+        if routing is not None:
+            action["_routing"] = routing
+        yield action
+
+
+def bulk_write_documents(
+    document_store: Any,
+    documents: list[Any],
+    policy: Any,
+    chunk_size: int | None = None,
+    thread_count: int | None = None,
+) -> int:
+    """Write documents with ``parallel_bulk`` without refreshing the index.
+
+    Args:
+        document_store: OpenSearch document store
+        documents: Haystack documents to write
+        policy: DuplicatePolicy; with SKIP, existing IDs are ignored
+        chunk_size: Documents per bulk request (default: settings.opensearch_bulk_chunk_size)
+        thread_count: Concurrent bulk requests (default: settings.opensearch_bulk_threads)
+
+    Returns:
+        Number of documents written
+
+    Raises:
+        DuplicateDocumentError: If an ID exists and the policy is FAIL/NONE
+        DocumentStoreError: If any other document fails to index
+    """
+    from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
+    from haystack.document_stores.types import DuplicatePolicy
+    from opensearchpy.helpers import parallel_bulk
+
+    if not documents:
+        return 0
+    client = _store_client(document_store)
+    written = 0
+    duplicates: list[str] = []
+    errors: list[dict[str, Any]] = []
+    for ok, item in parallel_bulk(
+        client,
+        _document_actions(documents, policy),
+        thread_count=max(1, thread_count or settings.opensearch_bulk_threads),
+        chunk_size=max(1, chunk_size or settings.opensearch_bulk_chunk_size),
+        raise_on_error=False,
+        raise_on_exception=False,
+        index=_store_index(document_store),
+    ):
+        if ok:
+            written += 1
+            continue
+        outcome = next(iter(item.values()), {})
+        if outcome.get("error", {}).get("type") == "version_conflict_engine_exception":
+            if policy == DuplicatePolicy.SKIP:
+                continue
+            if policy in (DuplicatePolicy.FAIL, DuplicatePolicy.NONE):
+                duplicates.append(outcome.get("_id", ""))
+                continue
+        errors.append(item)
+
+    if duplicates:
+        raise DuplicateDocumentError(f"IDs '{', '.join(duplicates)}' already exist in the document store.")
+    if errors:
+        raise DocumentStoreError(f"Failed to write {len(errors)} documents to OpenSearch. Errors:\n{errors[:10]}")
+    return written
+
+
+__all__ = ["bulk_ingest_mode", "bulk_mode_active", "bulk_write_documents", "restore_interrupted_bulk_mode"]
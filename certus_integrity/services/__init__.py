@@ -1,5 +1,6 @@
 """Shared services for certus_integrity."""
 
+from certus_integrity.services.pii_cache import analyze_cached, get_pii_result_cache
 from certus_integrity.services.presidio import get_analyzer, get_anonymizer
 
-__all__ = ["get_analyzer", "get_anonymizer"]
+__all__ = ["analyze_cached", "get_analyzer", "get_anonymizer", "get_pii_result_cache"]
@@ -0,0 +1,148 @@
+"""Bounded cache of PII analyzer results keyed by content hash.
+
+Boilerplate such as licence headers, repeated README sections and re-crawled
+pages is otherwise re-analyzed on every ingest and privacy scan. Results are
+cached in memory under ``(analyzer configuration version, language, entities,
+sha256(text))`` so a change to the recognizer set never serves stale results.
+Only analyzers whose configuration can be fingerprinted (Presidio engines and
+the regex fallback) are cached; anything else is analyzed directly.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from typing import Any
+
+from certus_integrity.services.presidio import AnalyzerEngine, RegexAnalyzer
+
+_Key = tuple[str, str, tuple[str, ...], str]
+
+
+def analyzer_config_version(analyzer: Any) -> str | None:
+    """Return a fingerprint of the analyzer's recognizer configuration, or None if it cannot be derived."""
+    if isinstance(analyzer, RegexAnalyzer):
+        parts = [f"{entity_type}:{pattern.pattern}" for entity_type, pattern in analyzer.patterns]
+    elif AnalyzerEngine is not Any and isinstance(analyzer, AnalyzerEngine):
+        parts = sorted(
+            f"{recognizer.name}:{getattr(recognizer, 'version', '')}:{recognizer.supported_language}:"
+            f"{','.join(sorted(recognizer.supported_entities))}"
+            for recognizer in analyzer.registry.recognizers
+        )
+        parts.append(f"threshold:{analyzer.default_score_threshold}")
+    else:
+        return None
+    parts.insert(0, type(analyzer).__qualname__)
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class PiiResultCache:
+    """Thread-safe in-memory LRU of analyzer results.
+
+    Results are stored and returned as copies, since callers (window merging,
+    anonymizers) may adjust span offsets in place.
+    """
+
+    def __init__(self, max_entries: int = 50_000):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Texts kept before the least recently used are evicted
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[_Key, tuple[Any, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(version: str, text: str, language: str = "en", entities: Iterable[str] | None = None) -> _Key:
+        return (version, language, tuple(sorted(entities or ())), hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+    def get(self, key: _Key) -> list[Any] | None:
+        """Return a copy of the cached results for a key, or None on a miss."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return [copy.copy(result) for result in cached]
+
+    def put(self, key: _Key, results: Iterable[Any]) -> None:
+        """Store a copy of the results for a key, evicting the oldest entries if the cache is full."""
+        snapshot = tuple(copy.copy(result) for result in results)
+        with self._lock:
+            self._entries[key] = snapshot
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry count and lookup hit rate since start."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+@lru_cache(maxsize=1)
+def get_pii_result_cache() -> PiiResultCache | None:
+    """Get the process-wide PII result cache, or None when PII_RESULT_CACHE_MAX_ENTRIES is 0."""
+    max_entries = int(os.getenv("PII_RESULT_CACHE_MAX_ENTRIES", "50000"))
+    if max_entries <= 0:
+        return None
+    return PiiResultCache(max_entries=max_entries)
+
+
+def analyze_cached(
+    analyzer: Any,
+    text: str,
+    language: str = "en",
+    entities: Sequence[str] | None = None,
+) -> list[Any]:
+    """Analyze a single text, serving repeated content from the result cache.
+
+    Args:
+        analyzer: Analyzer from ``get_analyzer()``
+        text: Text to analyze
+        language: Text language
+        entities: Entity types to detect (None or empty for all)
+
+    Returns:
+        Analyzer results for the text
+    """
+    kwargs: dict[str, Any] = {"text": text, "language": language}
+    if entities:
+        kwargs["entities"] = list(entities)
+
+    cache = get_pii_result_cache()
+    version = analyzer_config_version(analyzer) if cache is not None else None
+    if version is None:
+        return analyzer.analyze(**kwargs)
+
+    key = cache.make_key(version, text, language, entities)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    results = list(analyzer.analyze(**kwargs))
+    cache.put(key, results)
+    return results
+
+
+__all__ = ["PiiResultCache", "analyze_cached", "analyzer_config_version", "get_pii_result_cache"]
@@ -11,10 +11,10 @@ The module exports Protocol types for type-safe usage without circular imports.
 from __future__ import annotations
 
 import re
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from functools import lru_cache
 from types import SimpleNamespace
-from typing import Any, Protocol
+from typing import Any, ClassVar, Protocol
 
 import structlog
 
@@ -112,16 +112,76 @@ class AnonymizerProtocol(Protocol):
         ...
 
 
+def luhn_valid(digits: str) -> bool:
+    """Return True if a digit string passes the Luhn checksum (payment card numbers)."""
+    total = 0
+    for position, char in enumerate(reversed(digits)):
+        digit = int(char)
+        if position % 2:
+            digit = digit * 2 - 9 if digit > 4 else digit * 2
+        total += digit
+    return total % 10 == 0
+
+
+# Candidate patterns and validators shared with the ingestion PII prefilter
+# (certus_ask.services.pii_analysis), so both agree on what counts as a match.
+
+# Contiguous digits, or 4-4-4-4(-3) / 4-6-5 groups with one consistent separator,
+# so a card-like run never swallows a neighbouring number.
+CARD_NUMBER_PATTERN = re.compile(
+    r"\b(?:\d{13,19}"
+    r"|\d{4}(?:-\d{4}){3}(?:-\d{3})?|\d{4}(?: \d{4}){3}(?: \d{3})?"
+    r"|\d{4}-\d{6}-\d{5}|\d{4} \d{6} \d{5})\b"
+)
+IPV4_PATTERN = re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}\b")
+SSN_PATTERN = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
+
+
+def valid_card_number(match: str) -> bool:
+    """Return True if a card candidate has 13-19 digits and passes the Luhn checksum."""
+    digits = re.sub(r"\D", "", match)
+    return 13 <= len(digits) <= 19 and luhn_valid(digits)
+
+
+def valid_ssn(match: str) -> bool:
+    """Return True if an SSN candidate has an assignable area, group and serial."""
+    area, group, serial = match.split("-")
+    return area not in {"000", "666"} and not area.startswith("9") and group != "00" and serial != "0000"
+
+
+def valid_ipv4(match: str) -> bool:
+    """Return True if every octet of an IPv4 candidate is at most 255."""
+    return all(int(octet) <= 255 for octet in match.split("."))
+
+
 class RegexAnalyzer:
-    """Fallback analyzer that finds common PII patterns with regex."""
+    """Fallback analyzer that finds common PII patterns with regex.
+
+    The patterns are combined into one alternation so the text is scanned in a
+    single pass, earlier patterns winning where several match at the same
+    position. Quantifiers are bounded so long digit runs cannot cause
+    catastrophic backtracking, and payment card and IP candidates are
+    validated (Luhn checksum, octet range) before being reported; the scan
+    resumes one character after a rejected candidate.
+    """
 
     patterns: tuple[tuple[str, re.Pattern[str]], ...] = (
-        ("EMAIL_ADDRESS", re.compile(r"[A-Za-z0-9_.+-]+@[A-Za-z0-9-]+\.[A-Za-z0-9-.]+")),
-        ("IP_ADDRESS", re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}\b")),
+        ("EMAIL_ADDRESS", re.compile(r"(?<![A-Za-z0-9_.+-])[A-Za-z0-9_.+-]{1,64}@[A-Za-z0-9-]+\.[A-Za-z0-9-.]+")),
+        ("IP_ADDRESS", IPV4_PATTERN),
+        ("SSN", SSN_PATTERN),
+        ("CREDIT_CARD", CARD_NUMBER_PATTERN),
         ("PHONE_NUMBER", re.compile(r"\b(?:\+?\d{1,2}\s?)?(?:\(?\d{3}\)?[\s.-]?)?\d{3}[\s.-]?\d{4}\b")),
-        ("CREDIT_CARD", re.compile(r"\b(?:\d[ -]*?){13,16}\b")),
-        ("SSN", re.compile(r"\b\d{3}-\d{2}-\d{4}\b")),
     )
+    validators: ClassVar[dict[str, Callable[[str], bool]]] = {
+        "CREDIT_CARD": valid_card_number,
+        "IP_ADDRESS": valid_ipv4,
+    }
+
+    def __init__(self) -> None:
+        # Group ``_<index>`` identifies which pattern matched.
+        self._combined = re.compile(
+            "|".join(f"(?P<_{index}>{pattern.pattern})" for index, (_, pattern) in enumerate(self.patterns))
+        )
 
     def analyze(
         self,
@@ -130,18 +190,31 @@ class RegexAnalyzer:
         language: str = "en",
     ) -> list[_RegexResult]:
         results: list[_RegexResult] = []
-        for entity_type, pattern in self.patterns:
-            for match in pattern.finditer(text):
-                results.append(
-                    _RegexResult(
-                        entity_type=entity_type,
-                        start=match.start(),
-                        end=match.end(),
-                        score=0.8,
-                    )
-                )
+        position = 0
+        while (match := self._combined.search(text, position)) is not None:
+            resolved = self._resolve(text, match)
+            if resolved is None:
+                # Rejected by validation; a valid candidate may still start inside it.
+                position = match.start() + 1
+                continue
+            entity_type, start, end = resolved
+            results.append(_RegexResult(entity_type=entity_type, start=start, end=end, score=0.8))
+            position = end
         return results
 
+    def _resolve(self, text: str, match: re.Match[str]) -> tuple[str, int, int] | None:
+        """Validate a combined match, falling back to lower-priority patterns at the same position."""
+        first = int(match.lastgroup[1:])  # type: ignore[index]
+        for index in range(first, len(self.patterns)):
+            entity_type, pattern = self.patterns[index]
+            candidate = match if index == first else pattern.match(text, match.start())
+            if candidate is None:
+                continue
+            validator = self.validators.get(entity_type)
+            if validator is None or validator(candidate.group()):
+                return entity_type, candidate.start(), candidate.end()
+        return None
+
 
 class RegexAnonymizer:
     """Fallback anonymizer that replaces spans with redaction tokens."""
@@ -233,4 +306,16 @@ def get_anonymizer() -> AnonymizerProtocol:
     return RegexAnonymizer()
 
 
-__all__ = ["get_analyzer", "get_anonymizer"]
+__all__ = [
+    "CARD_NUMBER_PATTERN",
+    "IPV4_PATTERN",
+    "SSN_PATTERN",
+    "RegexAnalyzer",
+    "RegexAnonymizer",
+    "get_analyzer",
+    "get_anonymizer",
+    "luhn_valid",
+    "valid_card_number",
+    "valid_ipv4",
+    "valid_ssn",
+]
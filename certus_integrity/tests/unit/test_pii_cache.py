@@ -0,0 +1,58 @@
+"""Tests for the shared PII analyzer result cache."""
+
+import re
+from unittest.mock import MagicMock, patch
+
+from certus_integrity.services import pii_cache
+from certus_integrity.services.pii_cache import PiiResultCache, analyze_cached, analyzer_config_version
+from certus_integrity.services.presidio import RegexAnalyzer
+
+
+class TestAnalyzerConfigVersion:
+    def test_version_changes_with_recognizer_patterns(self):
+        class NarrowAnalyzer(RegexAnalyzer):
+            patterns = (("EMAIL_ADDRESS", re.compile(r"\S+@\S+")),)
+
+        assert analyzer_config_version(RegexAnalyzer()) == analyzer_config_version(RegexAnalyzer())
+        assert analyzer_config_version(NarrowAnalyzer()) != analyzer_config_version(RegexAnalyzer())
+
+    def test_unknown_analyzers_have_no_version(self):
+        assert analyzer_config_version(MagicMock()) is None
+
+
+class TestPiiResultCache:
+    def test_evicts_least_recently_used(self):
+        cache = PiiResultCache(max_entries=2)
+        keys = [cache.make_key("v1", text) for text in ("a", "b", "c")]
+        cache.put(keys[0], [])
+        cache.put(keys[1], [])
+        cache.get(keys[0])
+        cache.put(keys[2], [])
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == []
+        assert cache.stats()["entries"] == 2
+
+    def test_analyze_cached_returns_independent_copies(self):
+        cache = PiiResultCache()
+        analyzer = RegexAnalyzer()
+        text = "mail ops@example.com"
+
+        with patch.object(pii_cache, "get_pii_result_cache", return_value=cache):
+            first = analyze_cached(analyzer, text)
+            first[0].start += 100
+            second = analyze_cached(analyzer, text)
+
+        assert second[0].start == text.index("ops@")
+        assert cache.stats()["hits"] == 1
+
+    def test_unversioned_analyzer_is_called_directly(self):
+        analyzer = MagicMock()
+        analyzer.analyze.return_value = ["finding"]
+
+        with patch.object(pii_cache, "get_pii_result_cache", return_value=PiiResultCache()):
+            assert analyze_cached(analyzer, "text") == ["finding"]
+            assert analyze_cached(analyzer, "text") == ["finding"]
+
+        assert analyzer.analyze.call_count == 2
+        analyzer.analyze.assert_called_with(text="text", language="en")
@@ -99,6 +99,56 @@ class TestRegexAnalyzer:
         assert "EMAIL_ADDRESS" in entity_types
         assert "IP_ADDRESS" in entity_types
 
+    def test_credit_card_requires_luhn_checksum(self):
+        """Digit runs that fail the Luhn check are not reported as cards."""
+        analyzer = RegexAnalyzer()
+
+        results = analyzer.analyze("order 4111 1111 1111 1112 shipped")
+
+        assert not [r for r in results if r.entity_type == "CREDIT_CARD"]
+
+    def test_single_pass_reports_non_overlapping_spans(self):
+        """Each span is reported once, by the highest-priority matching pattern."""
+        analyzer = RegexAnalyzer()
+
+        text = "SSN 123-45-6789, card 4111-1111-1111-1111, host 999.1.1.1"
+        results = analyzer.analyze(text)
+
+        spans = sorted((r.start, r.end) for r in results)
+        assert all(end <= next_start for (_, end), (next_start, _) in zip(spans, spans[1:]))
+        assert {r.entity_type for r in results} == {"SSN", "CREDIT_CARD"}
+
+    def test_card_pattern_does_not_join_neighbouring_numbers(self):
+        """A card candidate must not swallow the phone number that follows it."""
+        analyzer = RegexAnalyzer()
+
+        text = "order 1234567890123 555-123-4567"
+        results = analyzer.analyze(text)
+
+        assert ("PHONE_NUMBER", "555-123-4567") in [(r.entity_type, text[r.start : r.end]) for r in results]
+        assert all(r.end <= text.index("555") for r in results if r.entity_type == "CREDIT_CARD")
+
+    def test_rejected_candidate_does_not_hide_overlapping_match(self):
+        """After a failed validation the scan resumes inside the rejected span."""
+        analyzer = RegexAnalyzer()
+
+        text = "1.2.300.555.1234"
+        results = analyzer.analyze(text)
+
+        assert [(r.entity_type, text[r.start : r.end]) for r in results] == [("PHONE_NUMBER", "300.555.1234")]
+
+    def test_long_digit_runs_do_not_backtrack(self):
+        """Numeric-heavy logs should scan in linear time."""
+        import time
+
+        analyzer = RegexAnalyzer()
+        text = " ".join(["1" * 5000, "2-" * 5000, "9" * 40]) * 20
+
+        started = time.perf_counter()
+        analyzer.analyze(text)
+
+        assert time.perf_counter() - started < 2
+
     def test_no_pii_returns_empty(self):
         """Test text with no PII returns empty results."""
         analyzer = RegexAnalyzer()
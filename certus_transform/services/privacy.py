@@ -5,7 +5,7 @@ from pathlib import Path
 
 from pydantic import BaseModel
 
-from certus_integrity.services import get_analyzer
+from certus_integrity.services import analyze_cached, get_analyzer
 from certus_transform.core.config import settings
 from certus_transform.services import get_s3_client
 
@@ -78,7 +78,7 @@ def scan_prefix(
             file_obj = s3_client.get_object(Bucket=bucket, Key=key)
             body: bytes = file_obj["Body"].read()
             text = body.decode("utf-8", errors="ignore")
-            findings = analyzer.analyze(text=text, language="en")
+            findings = analyze_cached(analyzer, text, language="en")
             if findings:
                 quarantine_key = f"{normalized_quarantine}{filename}"
                 if not dry_run:
@@ -2,16 +2,62 @@
 """Upload corpus_data to S3 bucket.
 
 This script uploads all documents from the local corpus_data folder to S3,
-preserving the directory structure.
+preserving the directory structure. Files are uploaded in parallel with
+multipart transfers, and files whose object already exists with a matching
+ETag or size are skipped, so an interrupted upload can simply be re-run.
+
+The script only needs boto3: it does not import the app, so it runs without
+the app's ``.env``. Transfer defaults come from the same ``DATALAKE_*``
+environment variables the app uses.
 """
 
 import argparse
+import hashlib
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 
+MB = 1024 * 1024
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name, default))
+
+
+def _local_etag(file_path: Path, file_size: int, config: TransferConfig) -> tuple[str, int]:
+    """Return the ETag S3 would assign to this file uploaded with ``config``, and its part count."""
+    if file_size < config.multipart_threshold:
+        digest = hashlib.md5(usedforsecurity=False)
+        with file_path.open("rb") as handle:
+            for block in iter(lambda: handle.read(MB), b""):
+                digest.update(block)
+        return digest.hexdigest(), 1
+
+    part_digests = []
+    with file_path.open("rb") as handle:
+        for part in iter(lambda: handle.read(config.multipart_chunksize), b""):
+            part_digests.append(hashlib.md5(part, usedforsecurity=False).digest())
+    combined = hashlib.md5(b"".join(part_digests), usedforsecurity=False).hexdigest()
+    return f"{combined}-{len(part_digests)}", len(part_digests)
+
+
+def _already_uploaded(file_path: Path, file_size: int, existing: dict | None, config: TransferConfig) -> bool:
+    """True when the stored object matches the local file by ETag, or by size when the ETag is not comparable."""
+    if existing is None or existing.get("Size") != file_size:
+        return False
+    remote_etag = str(existing.get("ETag", "")).strip('"')
+    remote_parts = int(remote_etag.rsplit("-", 1)[1]) if "-" in remote_etag else 1
+    local_etag, local_parts = _local_etag(file_path, file_size, config)
+    if remote_parts != local_parts:
+        # Uploaded with a different part size: the ETag cannot be recomputed, so the size match decides.
+        return True
+    return remote_etag == local_etag
+
 
 def upload_corpus_to_s3(
     corpus_path: str,
@@ -22,6 +68,11 @@ def upload_corpus_to_s3(
     s3_endpoint_url: str | None = None,
     aws_region: str = "us-east-1",
     verbose: bool = False,
+    workers: int | None = None,
+    multipart_threshold_mb: int | None = None,
+    multipart_chunk_mb: int | None = None,
+    multipart_concurrency: int | None = None,
+    skip_existing: bool = True,
 ) -> bool:
     """Upload corpus documents to S3.
 
@@ -34,6 +85,11 @@ def upload_corpus_to_s3(
         s3_endpoint_url: Custom S3 endpoint URL (for MinIO, etc.)
         aws_region: AWS region
         verbose: Print detailed output
+        workers: Files uploaded in parallel (default: DATALAKE_TRANSFER_WORKERS)
+        multipart_threshold_mb: Size above which files use multipart upload (default: DATALAKE_MULTIPART_THRESHOLD_MB)
+        multipart_chunk_mb: Multipart part size (default: DATALAKE_MULTIPART_CHUNK_MB)
+        multipart_concurrency: Parts uploaded in parallel per file (default: DATALAKE_MULTIPART_CONCURRENCY)
+        skip_existing: Skip files already uploaded with a matching ETag or size
 
     Returns:
         True if successful, False otherwise
@@ -73,40 +129,74 @@ def upload_corpus_to_s3(
                 return False
             raise
 
-        # Upload files
-        uploaded_count = 0
-        failed_count = 0
-        total_size = 0
-
         print(f"\nUploading files from {corpus_path}...")
 
-        for file_path in corpus_path.rglob("*"):
-            if not file_path.is_file():
-                continue
+        if multipart_threshold_mb is None:
+            multipart_threshold_mb = _env_int("DATALAKE_MULTIPART_THRESHOLD_MB", 64)
+        if multipart_chunk_mb is None:
+            multipart_chunk_mb = _env_int("DATALAKE_MULTIPART_CHUNK_MB", 16)
+        if multipart_concurrency is None:
+            multipart_concurrency = _env_int("DATALAKE_MULTIPART_CONCURRENCY", 4)
+        if workers is None:
+            workers = _env_int("DATALAKE_TRANSFER_WORKERS", 8)
+        config = TransferConfig(
+            multipart_threshold=multipart_threshold_mb * MB,
+            multipart_chunksize=multipart_chunk_mb * MB,
+            max_concurrency=max(1, multipart_concurrency),
+        )
 
-            # Calculate relative path for S3 key
-            relative_path = file_path.relative_to(corpus_path)
-            s3_key = f"{s3_prefix}/{relative_path}".replace("\\", "/")
+        existing: dict[str, dict] = {}
+        if skip_existing:
+            paginator = s3_client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket, Prefix=f"{s3_prefix.strip('/')}/"):
+                existing.update((item["Key"], item) for item in page.get("Contents", []))
 
-            try:
-                file_size = file_path.stat().st_size
-                if verbose:
-                    print(f"  Uploading: {relative_path} ({file_size} bytes)")
+        def upload_one(file_path: Path, s3_key: str, file_size: int) -> bool:
+            if skip_existing and _already_uploaded(file_path, file_size, existing.get(s3_key), config):
+                return False
+            s3_client.upload_file(str(file_path), bucket, s3_key, Config=config)
+            return True
+
+        uploaded_count = 0
+        skipped_count = 0
+        failed_count = 0
+        total_size = 0
 
-                s3_client.upload_file(str(file_path), bucket, s3_key)
-                uploaded_count += 1
-                total_size += file_size
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {}
+            for file_path in corpus_path.rglob("*"):
+                if not file_path.is_file():
+                    continue
+                relative_path = file_path.relative_to(corpus_path)
+                s3_key = f"{s3_prefix}/{relative_path}".replace("\\", "/")
+                file_size = file_path.stat().st_size
+                futures[executor.submit(upload_one, file_path, s3_key, file_size)] = (relative_path, file_size)
 
-            except Exception as e:
-                print(f"  Error uploading {relative_path}: {e}")
-                failed_count += 1
-                continue
+            for future in as_completed(futures):
+                relative_path, file_size = futures[future]
+                try:
+                    uploaded = future.result()
+                except Exception as e:
+                    print(f"  Error uploading {relative_path}: {e}")
+                    failed_count += 1
+                    continue
+                if uploaded:
+                    uploaded_count += 1
+                    total_size += file_size
+                    if verbose:
+                        print(f"  Uploaded: {relative_path} ({file_size} bytes)")
+                else:
+                    skipped_count += 1
+                    if verbose:
+                        print(f"  Skipped (already uploaded): {relative_path}")
 
         # Print summary
         print("\n" + "=" * 60)
         print("UPLOAD COMPLETE")
         print("=" * 60)
         print(f"Uploaded: {uploaded_count} files")
+        if skipped_count:
+            print(f"Skipped (already uploaded): {skipped_count} files")
         if failed_count:
             print(f"Failed: {failed_count} files")
         print(f"Total size: {total_size / (1024 * 1024):.2f} MB")
@@ -157,6 +247,32 @@ def main():
         default="us-east-1",
         help="AWS region (default: us-east-1)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Files uploaded in parallel (default: DATALAKE_TRANSFER_WORKERS)",
+    )
+    parser.add_argument(
+        "--multipart-threshold-mb",
+        type=int,
+        help="Use multipart upload above this size in MB (default: DATALAKE_MULTIPART_THRESHOLD_MB)",
+    )
+    parser.add_argument(
+        "--multipart-chunk-mb",
+        type=int,
+        help="Multipart part size in MB (default: DATALAKE_MULTIPART_CHUNK_MB)",
+    )
+    parser.add_argument(
+        "--multipart-concurrency",
+        type=int,
+        help="Parts uploaded in parallel per file (default: DATALAKE_MULTIPART_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--no-skip-existing",
+        dest="skip_existing",
+        action="store_false",
+        help="Re-upload files even when the object already exists with a matching ETag or size",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -175,6 +291,11 @@ def main():
         s3_endpoint_url=args.endpoint_url,
         aws_region=args.region,
         verbose=args.verbose,
+        workers=args.workers,
+        multipart_threshold_mb=args.multipart_threshold_mb,
+        multipart_chunk_mb=args.multipart_chunk_mb,
+        multipart_concurrency=args.multipart_concurrency,
+        skip_existing=args.skip_existing,
     )
 
     sys.exit(0 if success else 1)
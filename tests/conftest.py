@@ -341,7 +341,7 @@ def test_client(test_app) -> TestClient:
 
 
 @pytest.fixture
-def fake_preprocessing_pipeline(monkeypatch):
+def fake_preprocessing_pipeline(monkeypatch, tmp_path):
     """Deterministic preprocessing pipeline used for router tests."""
 
     class _FakePipeline:
@@ -359,15 +359,22 @@ def fake_preprocessing_pipeline(monkeypatch):
             return self.result
 
     pipeline = _FakePipeline()
-    # Mock the create_preprocessing_pipeline at the source module and at the router import
+    # Mock the create_preprocessing_pipeline at the source module; the shared pipeline pool resolves it there
     monkeypatch.setattr(
         "certus_ask.pipelines.preprocessing.create_preprocessing_pipeline",
         lambda document_store: pipeline,
     )
-    monkeypatch.setattr(
-        "certus_ask.routers.ingestion.create_preprocessing_pipeline",
-        lambda document_store: pipeline,
-    )
+    from certus_ask.pipelines.pipeline_pool import get_pipeline_pool
+
+    get_pipeline_pool().clear()
+
+    # Keep the incremental-ingestion ledger out of the working tree and fresh per test.
+    # Patch the settings object the ledger reads; test_app rebinds certus_ask.core.config.settings.
+    from certus_ask.services.ingestion import ledger
+    from certus_ask.services.ingestion.ledger import get_ingestion_ledger
+
+    monkeypatch.setattr(ledger.settings, "ingestion_ledger_path", str(tmp_path / "ingestion_ledger.db"))
+    get_ingestion_ledger.cache_clear()
     return pipeline
 
 
@@ -569,6 +576,17 @@ def reset_structlog_cache():
     structlog.reset_defaults()
 
 
+@pytest.fixture(autouse=True)
+def isolate_embedding_cache(monkeypatch, tmp_path):
+    """Keep the on-disk embedding cache out of the working tree and empty per test."""
+    from certus_ask.services import embedding_cache
+
+    monkeypatch.setattr(embedding_cache.settings, "embedding_cache_path", str(tmp_path / "embedding_cache.db"))
+    embedding_cache.get_embedding_cache.cache_clear()
+    yield
+    embedding_cache.get_embedding_cache.cache_clear()
+
+
 @pytest.fixture(autouse=True)
 def isolate_settings(monkeypatch):
     """Isolate settings changes per test."""
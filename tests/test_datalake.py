@@ -1,3 +1,5 @@
+import json
+
 import boto3
 import pytest
 from moto import mock_aws
@@ -5,7 +7,7 @@ from moto import mock_aws
 from certus_ask.core.config import settings
 from certus_ask.core.exceptions import StorageError
 from certus_ask.routers import datalake
-from certus_ask.schemas.datalake import BatchPreprocessRequest, PreprocessRequest
+from certus_ask.schemas.datalake import BatchPreprocessRequest, PreprocessRequest, UploadRequest
 
 pytestmark = pytest.mark.integration
 
@@ -77,6 +79,18 @@ async def test_promote_batch_preserves_all_filenames(moto_s3):
         assert head["ResponseMetadata"]["HTTPStatusCode"] == 200
 
 
+@pytest.mark.asyncio
+async def test_promote_batch_pages_past_list_limit(moto_s3):
+    keys = [f"bulk/incoming/doc-{index:04d}.txt" for index in range(1005)]
+    for key in keys:
+        moto_s3.put_object(Bucket="raw-bucket", Key=key, Body=b"x")
+
+    response = await datalake.promote_prefix(BatchPreprocessRequest(source_prefix="bulk/incoming"))
+
+    assert len(response.promoted) == 1005
+    assert moto_s3.head_object(Bucket="golden-bucket", Key="bulk/incoming/doc-1004.txt")["ContentLength"] == 1
+
+
 @pytest.mark.asyncio
 async def test_promote_requires_verification_proof(moto_s3):
     moto_s3.put_object(
@@ -114,3 +128,67 @@ async def test_promote_allows_verified_scans(moto_s3):
 
     response = await datalake.promote_object(request)
     assert "Promoted security-scans/scan456/scan456/reports/sarif.json" in response["message"]
+
+
+@pytest.mark.asyncio
+async def test_list_pages_with_cursor_and_delimiter(moto_s3):
+    keys = ["docs/a.txt", "docs/b.txt", "docs/c.txt", "docs/2024/d.txt", "other/e.txt"]
+    for key in keys:
+        moto_s3.put_object(Bucket="raw-bucket", Key=key, Body=b"x")
+
+    files: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        page = await datalake.list_objects(
+            "raw-bucket", prefix="docs/", delimiter=None, page_size=2, cursor=cursor, format="json"
+        )
+        files.extend(page.files)
+        pages += 1
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == 2
+    assert sorted(files) == sorted(key for key in keys if key.startswith("docs/"))
+
+    grouped = await datalake.list_objects(
+        "raw-bucket", prefix="docs/", delimiter="/", page_size=1000, cursor=None, format="json"
+    )
+    assert grouped.files == ["docs/a.txt", "docs/b.txt", "docs/c.txt"]
+    assert grouped.prefixes == ["docs/2024/"]
+    assert grouped.next_cursor is None
+
+
+def test_ndjson_listing_streams_every_page(moto_s3):
+    for index in range(5):
+        moto_s3.put_object(Bucket="raw-bucket", Key=f"bulk/{index}.txt", Body=b"xy")
+
+    lines = list(datalake._stream_listing(moto_s3, "raw-bucket", "bulk/", None, 2, None))
+
+    entries = [json.loads(line) for line in lines]
+    assert [entry["key"] for entry in entries] == [f"bulk/{index}.txt" for index in range(5)]
+    assert all(entry["size"] == 2 and entry["etag"] for entry in entries)
+
+
+@pytest.mark.asyncio
+async def test_directory_upload_resumes_by_skipping_matching_objects(moto_s3, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "datalake_multipart_threshold_mb", 5)
+    monkeypatch.setattr(settings, "datalake_multipart_chunk_mb", 5)
+    corpus = tmp_path / "corpus"
+    (corpus / "nested").mkdir(parents=True)
+    (corpus / "a.txt").write_text("alpha")
+    (corpus / "nested" / "b.txt").write_text("beta")
+    (corpus / "large.bin").write_bytes(b"z" * (11 * 1024 * 1024))
+
+    first = await datalake.upload(UploadRequest(source_path=str(corpus), target_folder="corpus"))
+
+    assert (first.uploaded, first.skipped) == (3, 0)
+    assert moto_s3.head_object(Bucket="raw-bucket", Key="corpus/large.bin")["ETag"].endswith('-3"')
+
+    (corpus / "a.txt").write_text("ALPHA")
+    second = await datalake.upload(UploadRequest(source_path=str(corpus), target_folder="corpus"))
+
+    assert (second.uploaded, second.skipped) == (1, 2)
+    body = moto_s3.get_object(Bucket="raw-bucket", Key="corpus/a.txt")["Body"].read()
+    assert body == b"ALPHA"
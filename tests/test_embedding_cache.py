@@ -0,0 +1,58 @@
+"""Unit tests for the persistent embedding cache."""
+
+import pytest
+
+from certus_ask.services.embedding_cache import EmbeddingCache, hash_text
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.db", max_entries=3)
+    yield cache
+    cache.close()
+
+
+def test_round_trip_is_keyed_by_model_and_text(cache):
+    key = hash_text("rule text")
+    cache.put_many("model-a", {key: [0.25, -1.5, 3.0]})
+
+    assert cache.get_many("model-a", [key, hash_text("other")]) == {key: [0.25, -1.5, 3.0]}
+    assert cache.get_many("model-b", [key]) == {}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    cache.put_many("m", {"a": [1.0], "b": [2.0], "c": [3.0]})
+    cache.get_many("m", ["a"])
+    cache.put_many("m", {"d": [4.0]})
+
+    assert set(cache.get_many("m", ["a", "b", "c", "d"])) == {"a", "c", "d"}
+    assert cache.stats()["entries"] == 3
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "embeddings.db"
+    first = EmbeddingCache(path)
+    first.put_many("m", {"a": [1.0, 2.0]})
+    first.close()
+
+    second = EmbeddingCache(path)
+    assert second.get_many("m", ["a"]) == {"a": [1.0, 2.0]}
+    assert second.stats()["entries"] == 1
+    second.close()
+
+
+def test_size_limit_holds_across_processes_sharing_the_file(tmp_path):
+    """Eviction counts entries written by other cache instances on the same database."""
+    path = tmp_path / "embeddings.db"
+    first = EmbeddingCache(path, max_entries=3)
+    second = EmbeddingCache(path, max_entries=3)
+
+    first.put_many("m", {"a": [1.0], "b": [2.0]})
+    second.put_many("m", {"c": [3.0], "d": [4.0]})
+
+    assert second.stats()["entries"] == 3
+    assert len(first.get_many("m", ["a", "b", "c", "d"])) == 3
+    first.close()
+    second.close()
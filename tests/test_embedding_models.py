@@ -0,0 +1,133 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from certus_ask.services.embedding_models import EmbeddingModelRegistry, measure_embedding_drift
+
+
+def test_registry_loads_each_model_once():
+    """Repeated lookups should share a single loaded instance and count hits."""
+    loader = MagicMock(side_effect=lambda name, device: MagicMock(name=name))
+    registry = EmbeddingModelRegistry(loader=loader)
+
+    first = registry.get("model-a")
+    second = registry.get("model-a")
+    other = registry.get("model-b")
+
+    assert first is second
+    assert other is not first
+    assert loader.call_count == 2
+    stats = registry.stats()
+    assert stats["model-a"]["hits"] == 2
+    assert stats["model-b"]["hits"] == 1
+
+
+def test_registry_concurrent_first_use_loads_once():
+    """Concurrent callers racing on a cold model should trigger one load."""
+    started = threading.Event()
+
+    def slow_loader(name, device):
+        started.wait(timeout=1)
+        return object()
+
+    loader = MagicMock(side_effect=slow_loader)
+    registry = EmbeddingModelRegistry(loader=loader)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(registry.get("model"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    started.set()
+    for thread in threads:
+        thread.join()
+
+    assert loader.call_count == 1
+    assert len({id(model) for model in results}) == 1
+    assert registry.stats()["model"]["hits"] == 4
+
+
+def test_registry_propagates_load_errors():
+    """Failed loads should raise and leave the model unregistered."""
+    registry = EmbeddingModelRegistry(loader=MagicMock(side_effect=OSError("missing weights")))
+
+    with pytest.raises(OSError):
+        registry.get("broken")
+
+    assert not registry.is_loaded("broken")
+    assert registry.stats() == {}
+
+
+def test_registry_reports_memory_footprint():
+    """Torch-like models should report parameter and buffer bytes."""
+    tensor = MagicMock()
+    tensor.numel.return_value = 10
+    tensor.element_size.return_value = 4
+    model = MagicMock()
+    model.parameters.return_value = [tensor, tensor]
+    model.buffers.return_value = [tensor]
+
+    registry = EmbeddingModelRegistry(loader=lambda name, device: model)
+    registry.get("torch-model", device="cpu")
+
+    assert registry.stats()["torch-model@cpu"]["memory_bytes"] == 120
+
+
+class _FakeModel:
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def encode(self, texts, **_):
+        import numpy as np
+
+        return np.array(self.vectors[: len(texts)], dtype=np.float32)
+
+
+def test_measure_embedding_drift_reports_cosine_and_dimension():
+    baseline = _FakeModel([[1.0, 0.0], [0.0, 1.0]])
+    candidate = _FakeModel([[1.0, 0.0], [0.1, 1.0]])
+
+    drift = measure_embedding_drift(candidate, baseline, texts=["a", "b"])
+
+    assert drift["dimension"] == drift["baseline_dimension"] == 2
+    assert drift["min_cosine"] == pytest.approx(0.995, abs=1e-3)
+    assert measure_embedding_drift(_FakeModel([[1.0, 0.0, 0.0]]), baseline, texts=["a"])["min_cosine"] == 0.0
+
+
+def test_quantized_backend_falls_back_to_fp32_when_drift_is_too_high(monkeypatch):
+    """A backend whose vectors diverge from the fp32 model must not be used."""
+    from certus_ask.services import embedding_models
+
+    baseline = _FakeModel([[1.0, 0.0]] * 8)
+    models = {"torch": baseline, "onnx-int8": _FakeModel([[0.0, 1.0]] * 8)}
+    monkeypatch.setattr(embedding_models, "_load_sentence_transformer", lambda name, device, backend: models[backend])
+    monkeypatch.setattr(embedding_models.settings, "embedding_backend_drift_check", True)
+    monkeypatch.setattr(embedding_models.settings, "embedding_backend_min_cosine", 0.98)
+
+    registry = EmbeddingModelRegistry(backend="onnx-int8")
+
+    assert registry.get("model") is baseline
+    assert registry.stats()["model"]["backend"] == "torch"
+    assert registry.loaded_backend("model") == "torch"
+
+    models["onnx-int8"] = _FakeModel([[1.0, 0.01]] * 8)
+    quantized = EmbeddingModelRegistry(backend="onnx-int8")
+    assert quantized.get("model") is models["onnx-int8"]
+    assert quantized.loaded_backend("model") == "onnx-int8"
+
+
+def test_cache_key_follows_the_backend_actually_loaded(monkeypatch):
+    """fp32 fallback vectors must not be cached under the quantized backend's key."""
+    from certus_ask.services import embedding_models
+
+    models = {"torch": _FakeModel([[1.0, 0.0]] * 8), "onnx-int8": _FakeModel([[0.0, 1.0]] * 8)}
+    monkeypatch.setattr(embedding_models, "_load_sentence_transformer", lambda name, device, backend: models[backend])
+    monkeypatch.setattr(embedding_models.settings, "embedding_backend", "onnx-int8")
+    monkeypatch.setattr(embedding_models.settings, "embedding_backend_drift_check", True)
+    monkeypatch.setattr(embedding_models.settings, "embedding_backend_min_cosine", 0.98)
+    registry = EmbeddingModelRegistry()
+    monkeypatch.setattr(embedding_models, "get_embedding_model_registry", lambda: registry)
+
+    assert embedding_models.embedding_cache_key("model") == "model@onnx-int8"
+    registry.get("model")
+    assert embedding_models.embedding_cache_key("model") == "model"
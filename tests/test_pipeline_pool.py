@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from certus_ask.pipelines.pipeline_pool import PreprocessingPipelinePool, pool_key
+
+
+def test_pool_reuses_pipelines_per_index():
+    """Pipelines should be built once per index and reused across checkouts."""
+    factory = MagicMock(side_effect=lambda store: MagicMock(name=f"pipeline-{store._index}"))
+    pool = PreprocessingPipelinePool(size=2, factory=factory)
+
+    store_a = SimpleNamespace(_index="ask_certus_a")
+    store_a_again = SimpleNamespace(_index="ask_certus_a")
+
+    with pool.acquire(store_a) as first:
+        pass
+    with pool.acquire(store_a_again) as second:
+        pass
+
+    assert first is second
+    assert factory.call_count == 1
+    stats = pool.health()["pools"]["ask_certus_a"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["idle"] == 1
+
+
+def test_pool_builds_extra_pipeline_when_all_checked_out():
+    """Concurrent checkouts should never block; surplus pipelines are dropped on release."""
+    factory = MagicMock(side_effect=lambda store: MagicMock())
+    pool = PreprocessingPipelinePool(size=1, factory=factory)
+    store = SimpleNamespace(_index="ask_certus_b")
+
+    with pool.acquire(store) as first, pool.acquire(store) as second:
+        assert first is not second
+        assert pool.health()["pools"]["ask_certus_b"]["in_use"] == 2
+
+    stats = pool.health()["pools"]["ask_certus_b"]
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+    assert factory.call_count == 2
+
+
+def test_warm_up_fills_pool_and_warms_components():
+    """Warm-up should pre-build pipelines up to the pool size and call warm_up on each."""
+    pipelines = [MagicMock(), MagicMock()]
+    pool = PreprocessingPipelinePool(size=2, factory=MagicMock(side_effect=pipelines))
+    store = SimpleNamespace(_index="ask_certus")
+
+    assert pool.warm_up(store) == 2
+    assert pool.warm_up(store) == 0
+
+    for pipeline in pipelines:
+        pipeline.warm_up.assert_called_once()
+    stats = pool.health()["pools"]["ask_certus"]
+    assert stats["warmed"] is True
+    assert stats["idle"] == 2
+
+
+def test_build_failure_is_reported_in_health():
+    """Factory errors should propagate and be visible in health output."""
+    pool = PreprocessingPipelinePool(size=1, factory=MagicMock(side_effect=RuntimeError("boom")))
+    store = SimpleNamespace(_index="ask_certus_c")
+
+    with pytest.raises(RuntimeError), pool.acquire(store):
+        pass
+
+    stats = pool.health()["pools"]["ask_certus_c"]
+    assert stats["last_error"] == "boom"
+    assert stats["in_use"] == 0
+
+
+def test_stores_without_index_are_not_pooled():
+    """Stores without an index name get a fresh pipeline per checkout and leave no pool entry."""
+    factory = MagicMock(side_effect=lambda store: MagicMock())
+    pool = PreprocessingPipelinePool(size=2, factory=factory)
+    store = object()
+
+    assert pool_key(store) is None
+    with pool.acquire(store) as first:
+        pass
+    with pool.acquire(store) as second:
+        pass
+
+    assert first is not second
+    assert factory.call_count == 2
+    assert pool.warm_up(store) == 0
+    assert pool.health()["pools"] == {}
+
+
+def test_least_recently_used_idle_indexes_are_evicted():
+    """The pool should keep at most max_indexes keys, never evicting one with pipelines checked out."""
+    pool = PreprocessingPipelinePool(size=1, factory=MagicMock(side_effect=lambda store: MagicMock()), max_indexes=2)
+    store_a, store_b, store_c = (SimpleNamespace(_index=name) for name in ("idx_a", "idx_b", "idx_c"))
+
+    with pool.acquire(store_a):
+        with pool.acquire(store_b):
+            pass
+        with pool.acquire(store_c):
+            pass
+        assert set(pool.health()["pools"]) == {"idx_a", "idx_c"}
+
+    # idx_a was released last, so idx_c is now the least recently used.
+    with pool.acquire(store_b):
+        pass
+    assert set(pool.health()["pools"]) == {"idx_a", "idx_b"}
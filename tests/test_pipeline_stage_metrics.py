@@ -0,0 +1,55 @@
+"""Tests for per-stage preprocessing pipeline metrics."""
+
+from haystack import Document, Pipeline
+
+from certus_ask.core import metrics
+from certus_ask.core.metrics import PipelineStageMetrics, stage_attributes
+from certus_ask.pipelines import preprocessing
+
+
+def test_record_stage_aggregates_by_stage_and_source():
+    stage_metrics = PipelineStageMetrics()
+
+    with stage_attributes(workspace_id="ws-1", source="folder"):
+        stage_metrics.record_stage("embedding", 0.5, document_count=10, size_bytes=4000)
+        stage_metrics.record_stage("embedding", 1.5, document_count=5, size_bytes=1000)
+    stage_metrics.record_stage("cleaning", 0.1, document_count=1, size_bytes=10, success=False)
+
+    summary = stage_metrics.to_dict()
+
+    assert list(summary) == ["embedding", "cleaning"]
+    assert summary["embedding"]["runs"] == 2
+    assert summary["embedding"]["documents"] == 15
+    assert summary["embedding"]["bytes"] == 5000
+    assert summary["embedding"]["avg_ms"] == 1000.0
+    assert summary["embedding"]["max_ms"] == 1500.0
+    assert summary["embedding"]["seconds_by_source"] == {"folder": 2.0}
+    assert summary["cleaning"]["failures"] == 1
+    assert summary["cleaning"]["seconds_by_source"] == {"unknown": 0.1}
+
+
+def test_routing_and_conversion_stages_are_recorded(tmp_path, monkeypatch):
+    stage_metrics = PipelineStageMetrics()
+    monkeypatch.setattr(metrics, "_pipeline_stage_metrics", stage_metrics)
+
+    class FakeConverter:
+        def run(self, sources, meta=None):
+            return {"documents": [Document(content="x" * 12) for _ in sources]}
+
+    path = tmp_path / "notes.txt"
+    path.write_text("hello world", encoding="utf-8")
+
+    pipeline = Pipeline()
+    pipeline.add_component("file_type_router", preprocessing.LoggingFileTypeRouter(mime_types=["text/plain"]))
+    pipeline.add_component("text_file_converter", preprocessing.LoggingConverter(FakeConverter()))
+    pipeline.connect("file_type_router.text/plain", "text_file_converter.sources")
+
+    with stage_attributes(workspace_id="ws-1", source="upload"):
+        result = pipeline.run({"file_type_router": {"sources": [path]}})
+
+    assert len(result["text_file_converter"]["documents"]) == 1
+    summary = stage_metrics.to_dict()
+    assert summary["routing"]["documents"] == 1
+    assert summary["routing"]["bytes"] == len("hello world")
+    assert summary["conversion"]["bytes"] == 12
+    assert set(summary["conversion"]["seconds_by_source"]) == {"upload"}
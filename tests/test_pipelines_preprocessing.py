@@ -81,3 +81,75 @@ def test_logging_document_writer_builds_metadata_preview(monkeypatch):
 
     assert result["documents_written"] == 1
     assert result["metadata_preview"] == [{"doc_id": "chunk-1", "workspace_id": "ws-123"}]
+
+
+def test_document_embedder_reuses_cached_and_duplicate_chunks(monkeypatch, tmp_path):
+    """Only distinct, uncached chunk texts should reach the embedding model."""
+    import numpy as np
+
+    from certus_ask.services.embedding_cache import EmbeddingCache, hash_text
+
+    cache = EmbeddingCache(tmp_path / "embeddings.db")
+    cache.put_many("model", {hash_text("cached"): [1.0, 1.0]})
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **_: np.array([[float(len(text)), 0.0] for text in texts])
+    monkeypatch.setattr(preprocessing, "get_embedding_cache", lambda: cache)
+
+    embedder = preprocessing.LoggingDocumentEmbedder(model="model")
+    embedder._embedding_model = model
+    docs = [Document(content="cached"), Document(content="rule"), Document(content="rule")]
+    result = embedder.run(documents=docs)
+
+    model.encode.assert_called_once()
+    assert model.encode.call_args.args[0] == ["rule"]
+    assert [doc.embedding for doc in result["documents"]] == [[1.0, 1.0], [4.0, 0.0], [4.0, 0.0]]
+    assert cache.get_many("model", [hash_text("rule")]) == {hash_text("rule"): [4.0, 0.0]}
+
+
+def test_document_embedder_falls_back_when_cache_is_locked(monkeypatch):
+    """A locked shared cache must not fail ingestion; embeddings are computed instead."""
+    import sqlite3
+
+    cache = MagicMock()
+    cache.get_many.side_effect = sqlite3.OperationalError("database is locked")
+    cache.put_many.side_effect = sqlite3.OperationalError("database is locked")
+    model = MagicMock()
+    model.max_seq_length = 256
+    model.encode.side_effect = lambda texts, **_: [MagicMock(tolist=lambda t=t: [float(len(t))]) for t in texts]
+    monkeypatch.setattr(preprocessing, "get_embedding_cache", lambda: cache)
+
+    embedder = preprocessing.LoggingDocumentEmbedder(model="model")
+    embedder._embedding_model = model
+    result = embedder.run(documents=[Document(content="rule")])
+
+    assert result["documents"][0].embedding == [4.0]
+    cache.put_many.assert_called_once()
+
+
+def test_length_bucketed_batches_respect_token_budget():
+    """Short and long chunks should land in separate batches sized by the padded-token budget."""
+    token_counts = [200, 10, 10, 200, 12, 11, 256, 9]
+
+    batches = preprocessing._length_bucketed_batches(
+        token_counts, token_budget=1024, min_batch_size=2, max_batch_size=4
+    )
+
+    assert sorted(index for batch in batches for index in batch) == list(range(len(token_counts)))
+    assert [sorted(batch) for batch in batches] == [[1, 2, 5, 7], [0, 3, 4, 6]]
+    assert all(len(batch) * max(token_counts[i] for i in batch) <= 1024 for batch in batches)
+
+
+def test_document_embedder_restores_input_order_across_buckets(monkeypatch):
+    """Vectors must line up with their documents after length-sorted batching."""
+    model = MagicMock()
+    model.max_seq_length = 256
+    model.encode.side_effect = lambda texts, **_: [MagicMock(tolist=lambda t=t: [float(len(t))]) for t in texts]
+    monkeypatch.setattr(preprocessing, "get_embedding_cache", lambda: None)
+
+    embedder = preprocessing.LoggingDocumentEmbedder(model="model", batch_size=1, token_budget=64, max_batch_size=8)
+    embedder._embedding_model = model
+    texts = ["x" * 400, "short", "y" * 120, "tiny"]
+    result = embedder.run(documents=[Document(content=text) for text in texts])
+
+    assert [doc.embedding for doc in result["documents"]] == [[float(len(text))] for text in texts]
+    assert model.encode.call_count > 1
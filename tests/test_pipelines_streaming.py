@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from haystack import Document
+
+from certus_ask.pipelines import streaming
+from certus_ask.pipelines.streaming import (
+    iter_csv_documents,
+    iter_text_documents,
+    quarantined_count,
+    run_file_pipeline,
+)
+
+
+def test_iter_csv_documents_repeats_header_per_part(tmp_path):
+    path = tmp_path / "export.csv"
+    path.write_text('id,note\n1,"multi\nline"\n2,b\n3,c\n', encoding="utf-8")
+
+    parts = list(iter_csv_documents(path, rows_per_document=2, max_bytes=1024))
+
+    assert [doc.content for doc in parts] == ['id,note\n1,"multi\nline"\n2,b\n', "id,note\n3,c\n"]
+    assert [(doc.meta["row_start"], doc.meta["row_end"]) for doc in parts] == [(1, 2), (3, 3)]
+    assert parts[0].id != parts[1].id
+
+
+def test_iter_text_documents_splits_at_line_boundaries(tmp_path):
+    path = tmp_path / "big.txt"
+    lines = [f"line {index} of the log" for index in range(200)]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    parts = list(iter_text_documents(path, max_bytes=512))
+
+    assert len(parts) > 5
+    assert all(len(doc.content) <= 1024 for doc in parts)
+    assert "".join(doc.content for doc in parts) == path.read_text(encoding="utf-8")
+    assert all(doc.content.endswith("\n") for doc in parts[:-1])
+
+
+def test_run_file_pipeline_streams_large_files_part_by_part(tmp_path, monkeypatch):
+    """Each part should pass through the downstream components before the next one is read."""
+    monkeypatch.setattr(
+        streaming,
+        "settings",
+        SimpleNamespace(streaming_ingest_min_bytes=1, streaming_csv_rows_per_document=1, streaming_text_chunk_kb=1),
+    )
+    path = tmp_path / "rows.csv"
+    path.write_text("a,b\n1,2\n3,4\n5,6\n", encoding="utf-8")
+
+    calls = []
+
+    def stage(name):
+        component = MagicMock()
+
+        def run(documents):
+            calls.append((name, len(documents)))
+            return {"documents": documents}
+
+        component.run.side_effect = run
+        return component
+
+    writer = MagicMock()
+    writer.run.side_effect = lambda documents, metadata_context: {
+        "documents_written": len(documents),
+        "documents": documents,
+        "metadata_preview": [{"workspace_id": metadata_context["workspace_id"]}] * len(documents),
+    }
+    pipeline = MagicMock()
+    pipeline.walk.return_value = [
+        ("file_type_router", MagicMock()),
+        ("document_cleaner", stage("clean")),
+        ("document_splitter", stage("split")),
+        ("document_embedder", stage("embed")),
+        ("document_writer", writer),
+    ]
+
+    result = run_file_pipeline(pipeline, path, {"workspace_id": "ws"})
+
+    pipeline.run.assert_not_called()
+    assert calls == [("clean", 1), ("split", 1), ("embed", 1)] * 3
+    writer_result = result["document_writer"]
+    assert writer_result["documents_written"] == 3
+    assert len(writer_result["document_ids"]) == 3
+    assert writer_result["metadata_preview"] == [{"workspace_id": "ws"}] * 3
+    assert "presidio_anonymizer" not in result
+
+
+def test_run_file_pipeline_runs_small_files_through_the_pipeline(tmp_path):
+    path = tmp_path / "small.txt"
+    path.write_text("hello", encoding="utf-8")
+    pipeline = MagicMock()
+    pipeline.run.return_value = {"document_writer": {"documents": [Document(content="hello")]}}
+
+    run_file_pipeline(pipeline, path, {"workspace_id": "ws"})
+
+    pipeline.run.assert_called_once_with({
+        "file_type_router": {"sources": [path]},
+        "document_writer": {"metadata_context": {"workspace_id": "ws"}},
+    })
+
+
+def test_streamed_quarantine_keeps_a_count_and_a_bounded_sample(tmp_path, monkeypatch):
+    """Quarantined parts are counted, but only a few are held in memory."""
+    monkeypatch.setattr(
+        streaming,
+        "settings",
+        SimpleNamespace(streaming_ingest_min_bytes=1, streaming_csv_rows_per_document=1, streaming_text_chunk_kb=1),
+    )
+    path = tmp_path / "rows.csv"
+    path.write_text("a\n" + "".join(f"{index}\n" for index in range(10)), encoding="utf-8")
+
+    anonymizer = MagicMock()
+    anonymizer.run.side_effect = lambda documents: {"documents": [], "quarantined": documents}
+    writer = MagicMock()
+    writer.run.return_value = {"documents_written": 0, "documents": []}
+    pipeline = MagicMock()
+    pipeline.walk.return_value = [("presidio_anonymizer", anonymizer), ("document_writer", writer)]
+
+    result = run_file_pipeline(pipeline, path)
+
+    assert result["presidio_anonymizer"]["quarantined_count"] == 10
+    assert len(result["presidio_anonymizer"]["quarantined"]) == 3
+    assert quarantined_count(result) == 10
+    assert quarantined_count({"presidio_anonymizer": {"quarantined": [Document(content="x")]}}) == 1
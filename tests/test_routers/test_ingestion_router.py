@@ -1,3 +1,5 @@
+import threading
+import time
 from types import SimpleNamespace
 
 import pytest
@@ -28,6 +30,65 @@ def test_index_document_runs_pipeline(test_client, fake_preprocessing_pipeline,
     assert pipeline_payload["file_type_router"]["sources"][0].name == "doc.txt"
 
 
+def test_index_document_runs_the_pipeline_off_the_event_loop(
+    test_client, fake_preprocessing_pipeline, mock_opensearch_client, monkeypatch, tmp_path
+):
+    """Uploads are converted and embedded on an ingestion job worker, not in the request handler."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        "certus_ask.routers.ingestion.get_document_store_for_workspace", lambda workspace_id: mock_opensearch_client
+    )
+    threads: list[str] = []
+    run = fake_preprocessing_pipeline.run
+
+    def recording_run(payload):
+        threads.append(threading.current_thread().name)
+        return run(payload)
+
+    monkeypatch.setattr(fake_preprocessing_pipeline, "run", recording_run)
+
+    response = test_client.post(
+        "/v1/demo/index/",
+        files={"uploaded_file": ("doc.txt", b"hello tap", "text/plain")},
+    )
+
+    assert response.status_code == 200
+    assert threads and threads[0].startswith("ingestion-job")
+
+
+def test_background_job_holds_its_admission_slot_until_it_finishes(test_client, monkeypatch, tmp_path):
+    """A 202 response must not free the admission slot while the queued job is still running."""
+    from certus_ask.services.ingestion.admission import AdmissionController
+    from certus_ask.services.ingestion.jobs import IngestionJobManager
+
+    controller = AdmissionController(max_concurrent=1, max_queued=0, max_wait_seconds=1, retry_after_seconds=5)
+    manager = IngestionJobManager(max_workers=1, max_queued=1)
+    monkeypatch.setattr("certus_ask.services.ingestion.admission.get_admission_controller", lambda: controller)
+    monkeypatch.setattr("certus_ask.routers.ingestion.get_ingestion_job_manager", lambda: manager)
+    finish = threading.Event()
+
+    async def slow_index_folder(workspace_id, request):
+        finish.wait(5)
+        return {"ok": True}
+
+    monkeypatch.setattr("certus_ask.routers.ingestion._index_folder", slow_index_folder)
+    payload = {"local_directory": str(tmp_path)}
+
+    accepted = test_client.post("/v1/demo/index_folder/?background=true", json=payload)
+
+    assert accepted.status_code == 202
+    assert controller.stats()["active"] == 1
+    assert test_client.post("/v1/demo/index_folder/?background=true", json=payload).status_code == 429
+
+    finish.set()
+    deadline = time.monotonic() + 5
+    while controller.stats()["active"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert controller.stats()["active"] == 0
+    assert manager.get(accepted.json()["job_id"]).result == {"ok": True}
+    manager.shutdown()
+
+
 def test_index_document_rejects_large_files(test_client, fake_preprocessing_pipeline, monkeypatch):
     """Files larger than MAX_UPLOAD_SIZE_BYTES should be rejected with HTTP 400."""
     monkeypatch.setattr("certus_ask.routers.ingestion.MAX_UPLOAD_SIZE_BYTES", 1)
@@ -170,3 +231,19 @@ def test_enforce_verified_digest_raises_on_mismatch():
 
     with pytest.raises(ValidationError):
         enforce_verified_digest(b"not matching", artifact_locations, "raw-bucket", "reports/file")
+
+
+def test_full_job_queue_is_rejected_like_admission(test_client, monkeypatch, tmp_path):
+    """A full job queue answers 429 with Retry-After, the same contract as admission control."""
+    from certus_ask.services.ingestion.jobs import JobQueueFullError
+
+    class _FullManager:
+        def submit(self, *args, **kwargs):
+            raise JobQueueFullError("2 ingestion jobs already queued")
+
+    monkeypatch.setattr("certus_ask.routers.ingestion.get_ingestion_job_manager", lambda: _FullManager())
+
+    response = test_client.post("/v1/demo/index_folder/", json={"local_directory": str(tmp_path)})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"]
@@ -35,28 +35,36 @@ def _stub_s3_client(tmp_contents: bytes = b"stub data") -> Any:
     """Create a minimal fake S3 client for datalake router tests."""
 
     class _StubS3:
+        def __init__(self) -> None:
+            self.copies: list[tuple[str, str]] = []
+
         def download_file(self, bucket: str, key: str, filename: str) -> None:
             Path(filename).write_bytes(tmp_contents)
 
         def list_objects_v2(self, *args, **kwargs):
             return {"Contents": []}
 
+        def head_object(self, Bucket: str, Key: str) -> dict[str, Any]:
+            return {"ContentLength": len(tmp_contents)}
+
+        def copy_object(self, CopySource: dict[str, str], Bucket: str, Key: str) -> None:
+            self.copies.append((CopySource["Key"], Key))
+
+        def copy(self, CopySource: dict[str, str], Bucket: str, Key: str, **kwargs: Any) -> None:
+            self.copies.append((CopySource["Key"], Key))
+
     return _StubS3()
 
 
 def test_datalake_preprocess_promotes_file(test_client, monkeypatch):
     """Happy-path API call to preprocess a single object."""
-    upload_mock = MagicMock()
+    client = _stub_s3_client()
 
-    monkeypatch.setattr("certus_ask.routers.datalake.get_s3_client", _stub_s3_client)
+    monkeypatch.setattr("certus_ask.routers.datalake.get_s3_client", lambda: client)
     monkeypatch.setattr(
         "certus_ask.routers.datalake.datalake_service.initialize_datalake_structure",
         lambda client: None,
     )
-    monkeypatch.setattr(
-        "certus_ask.routers.datalake.datalake_service.upload_file",
-        upload_mock,
-    )
     monkeypatch.setattr(
         "certus_ask.routers.datalake._extract_scan_id",
         lambda path: None,
@@ -75,19 +83,21 @@ def test_datalake_preprocess_promotes_file(test_client, monkeypatch):
 
     assert response.status_code == 200
     assert "privacy-pack/golden" in response.json()["message"]
-    upload_mock.assert_called_once()
+    assert client.copies == [
+        ("privacy-pack/incoming/privacy-quickstart.md", "privacy-pack/golden/privacy-quickstart.md")
+    ]
 
 
 def test_datalake_preprocess_failure_returns_500(test_client, monkeypatch):
-    """If upload fails the API should respond with a 500."""
+    """If the copy fails the API should respond with a 500."""
     monkeypatch.setattr("certus_ask.routers.datalake.get_s3_client", _stub_s3_client)
     monkeypatch.setattr(
         "certus_ask.routers.datalake.datalake_service.initialize_datalake_structure",
         lambda client: None,
     )
     monkeypatch.setattr(
-        "certus_ask.routers.datalake.datalake_service.upload_file",
-        MagicMock(side_effect=RuntimeError("upload failed")),
+        "certus_ask.routers.datalake.datalake_service.copy_object",
+        MagicMock(side_effect=RuntimeError("copy failed")),
     )
     monkeypatch.setattr(
         "certus_ask.routers.datalake._extract_scan_id",
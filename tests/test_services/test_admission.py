@@ -0,0 +1,89 @@
+"""Unit tests for ingestion admission control."""
+
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from certus_ask.services.ingestion import admission
+from certus_ask.services.ingestion.admission import AdmissionController, AdmissionRejectedError, admit_ingestion
+
+
+def test_concurrency_cap_admits_waiters_in_order():
+    """Requests beyond the cap should wait, then run in arrival order as slots free up."""
+    controller = AdmissionController(max_concurrent=2, max_queued=4, max_wait_seconds=5, retry_after_seconds=1)
+    running = 0
+    peak = 0
+    order = []
+
+    async def request(index: int) -> None:
+        nonlocal running, peak
+        async with controller.admit("test"):
+            running += 1
+            peak = max(peak, running)
+            order.append(index)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    async def main() -> None:
+        await asyncio.gather(*(request(index) for index in range(6)))
+
+    asyncio.run(main())
+
+    assert peak == 2
+    assert order == list(range(6))
+    stats = controller.stats()
+    assert stats["admitted"] == 6
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+    assert stats["rejected"] == 0
+
+
+def test_rejects_when_queue_full_or_wait_times_out():
+    controller = AdmissionController(max_concurrent=1, max_queued=1, max_wait_seconds=0.05, retry_after_seconds=7)
+
+    async def main() -> None:
+        await controller.acquire("test")
+        waiter = asyncio.create_task(controller.acquire("test"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError, match="queue_full") as exc_info:
+            await controller.acquire("test")
+        assert exc_info.value.retry_after_seconds == 7
+
+        with pytest.raises(AdmissionRejectedError, match="wait_timeout"):
+            await waiter
+
+        controller.release()
+        await controller.acquire("test")
+        controller.release()
+
+    asyncio.run(main())
+
+    stats = controller.stats()
+    assert stats["rejected"] == 2
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+
+
+def test_dependency_returns_429_with_retry_after(monkeypatch):
+    controller = AdmissionController(max_concurrent=1, max_queued=0, max_wait_seconds=1, retry_after_seconds=12)
+    monkeypatch.setattr(admission, "get_admission_controller", lambda: controller)
+
+    app = FastAPI()
+
+    @app.post("/ingest", dependencies=[Depends(admit_ingestion)])
+    async def ingest() -> dict:
+        return {"active": controller.stats()["active"]}
+
+    client = TestClient(app)
+    assert client.post("/ingest").json() == {"active": 1}
+    assert controller.stats()["active"] == 0
+
+    asyncio.run(controller.acquire("held"))
+    response = client.post("/ingest")
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "12"
+    assert controller.stats()["rejected"] == 1
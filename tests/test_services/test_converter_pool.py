@@ -0,0 +1,124 @@
+"""Unit tests for the isolated converter pool."""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from haystack import Document
+
+from certus_ask.core.exceptions import DocumentParseError
+from certus_ask.pipelines.preprocessing import IsolatedConverter
+from certus_ask.services.ingestion.converter_pool import ConverterPool
+
+
+def _fake_convert(converter_name: str, source: str, meta: dict, cpu_seconds: int) -> dict:
+    if source.startswith("broken"):
+        return {"error": "ConversionLimitExceeded: CPU time limit exceeded"}
+    return {"documents": [f"{source}:{meta['page']}"]}
+
+
+def _sleepy_convert(converter_name: str, source: str, meta: dict, cpu_seconds: int) -> dict:
+    time.sleep(meta["seconds"])
+    return {"documents": [source]}
+
+
+def test_convert_keeps_source_order_and_reports_failures():
+    pool = ConverterPool(
+        max_workers=2,
+        timeout_seconds=5,
+        executor_factory=lambda workers: ThreadPoolExecutor(max_workers=workers),
+        convert=_fake_convert,
+    )
+
+    documents, failed = pool.convert("pdf_converter", ["a.pdf", "broken.pdf", "c.pdf"], [{"page": i} for i in range(3)])
+
+    assert documents == ["a.pdf:0", "c.pdf:2"]
+    assert failed == [{"source": "broken.pdf", "error": "ConversionLimitExceeded: CPU time limit exceeded"}]
+    pool.shutdown()
+
+
+def test_timeout_fails_the_file_and_retries_the_rest_on_a_fresh_executor():
+    """A hung file must not take the files queued behind it down with the pool."""
+    release = threading.Event()
+    executors = []
+
+    def factory(workers: int) -> ThreadPoolExecutor:
+        executors.append(ThreadPoolExecutor(max_workers=1))
+        return executors[-1]
+
+    def convert(converter_name, source, meta, cpu_seconds):
+        if source == "hang.pdf":
+            release.wait(5)
+        return {"documents": [source]}
+
+    pool = ConverterPool(max_workers=1, timeout_seconds=0.2, executor_factory=factory, convert=convert)
+    try:
+        documents, failed = pool.convert("pdf_converter", ["hang.pdf", "b.pdf", "c.pdf"], [{}, {}, {}])
+    finally:
+        release.set()
+
+    assert documents == ["b.pdf", "c.pdf"]
+    assert [item["source"] for item in failed] == ["hang.pdf"]
+    assert "timed out" in failed[0]["error"]
+    assert len(executors) == 2
+    pool.shutdown()
+
+
+def test_time_queued_behind_other_files_does_not_count_against_the_limit():
+    """Each file gets the full limit once a worker starts it, however long it waited."""
+    pool = ConverterPool(
+        max_workers=1,
+        timeout_seconds=0.5,
+        executor_factory=lambda workers: ThreadPoolExecutor(max_workers=workers),
+        convert=_sleepy_convert,
+    )
+
+    documents, failed = pool.convert("pdf_converter", ["a.pdf", "b.pdf", "c.pdf"], [{"seconds": 0.3}] * 3)
+
+    assert documents == ["a.pdf", "b.pdf", "c.pdf"]
+    assert failed == []
+    pool.shutdown()
+
+
+def test_hung_file_requeues_other_callers_work_instead_of_failing_it():
+    """Recycling a pool for one caller's hung file must not fail another caller's running file."""
+    executors = []
+
+    def factory(workers: int) -> ProcessPoolExecutor:
+        executors.append(ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")))
+        return executors[-1]
+
+    pool = ConverterPool(max_workers=2, timeout_seconds=2.0, executor_factory=factory, convert=_sleepy_convert)
+    hung = {}
+    caller = threading.Thread(
+        target=lambda: hung.update(result=pool.convert("pdf_converter", ["hang.pdf"], [{"seconds": 30}]))
+    )
+    caller.start()
+    try:
+        time.sleep(1.2)  # still running when hang.pdf times out and its pool is terminated
+        documents, failed = pool.convert("pdf_converter", ["ok.pdf"], [{"seconds": 1.5}])
+    finally:
+        caller.join()
+        pool.shutdown()
+
+    assert documents == ["ok.pdf"]
+    assert failed == []
+    assert [item["source"] for item in hung["result"][1]] == ["hang.pdf"]
+    assert len(executors) == 2
+
+
+def test_isolated_converter_raises_when_no_source_converts():
+    pool = MagicMock()
+    pool.convert.return_value = ([], [{"source": "poison.pdf", "error": "conversion timed out after 300s"}])
+    converter = IsolatedConverter("pdf_converter", pool=pool)
+
+    with pytest.raises(DocumentParseError, match="timed out"):
+        converter.run(sources=["poison.pdf"])
+
+    pool.convert.assert_called_once_with("pdf_converter", ["poison.pdf"], [{}])
+
+    pool.convert.return_value = ([Document(content="ok")], [{"source": "poison.pdf", "error": "MemoryError: "}])
+    assert converter.run(sources=["ok.pdf", "poison.pdf"])["failed"][0]["source"] == "poison.pdf"
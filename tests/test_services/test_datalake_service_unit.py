@@ -1,3 +1,4 @@
+import hashlib
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -41,7 +42,7 @@ def test_upload_directory_dispatches_through_upload_file(monkeypatch, tmp_path):
 
     uploaded = []
 
-    def fake_upload(client, file_path, bucket_name, target_key):
+    def fake_upload(client, file_path, bucket_name, target_key, config=None):
         uploaded.append((bucket_name, target_key))
 
     monkeypatch.setattr(datalake, "upload_file", fake_upload)
@@ -83,3 +84,116 @@ def test_initialize_datalake_structure_invokes_helpers(monkeypatch):
 
     assert ensure_bucket.call_count == 2
     ensure_folders.assert_called_once()
+
+
+def test_iter_objects_follows_every_page():
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {"Contents": [{"Key": "a"}, {"Key": "b"}]},
+        {},
+        {"Contents": [{"Key": "c"}]},
+    ]
+
+    keys = [item["Key"] for item in datalake.iter_objects(client, "raw", "docs/")]
+
+    assert keys == ["a", "b", "c"]
+    client.get_paginator.assert_called_once_with("list_objects_v2")
+    client.get_paginator.return_value.paginate.assert_called_once_with(Bucket="raw", Prefix="docs/")
+
+
+def test_copy_objects_copies_server_side_and_reports_failures(monkeypatch):
+    monkeypatch.setattr(datalake.settings, "datalake_multipart_threshold_mb", 1)
+    client = MagicMock()
+
+    def check(key):
+        if key.startswith("unverified/"):
+            raise RuntimeError("Verification proof missing for scan")
+
+    objects = [
+        {"Key": "docs/small.txt", "Size": 10},
+        {"Key": "unverified/scan.json", "Size": 10},
+        {"Key": "docs/large.bin", "Size": 5 * 1024 * 1024},
+    ]
+    copied, failed = datalake.copy_objects(
+        client, "raw", iter(objects), "golden", lambda key: f"promoted/{key}", check=check, max_workers=2
+    )
+
+    assert copied == ["docs/small.txt", "docs/large.bin"]
+    assert failed == [{"key": "unverified/scan.json", "error": "Verification proof missing for scan"}]
+    client.copy_object.assert_called_once_with(
+        CopySource={"Bucket": "raw", "Key": "docs/small.txt"}, Bucket="golden", Key="promoted/docs/small.txt"
+    )
+    args, kwargs = client.copy.call_args
+    assert args == ({"Bucket": "raw", "Key": "docs/large.bin"}, "golden", "promoted/docs/large.bin")
+    assert kwargs["Config"].multipart_threshold == 1024 * 1024
+    client.download_file.assert_not_called()
+
+
+def test_upload_directory_skips_matching_objects_and_collects_failures(tmp_path):
+    root = tmp_path / "corpus"
+    (root / "nested").mkdir(parents=True)
+    files = {
+        "same.txt": "unchanged",
+        "edited.txt": "new text!",
+        "nested/big.bin": "x" * 4096,
+        "new.txt": "fresh",
+        "broken.txt": "fails",
+    }
+    for name, content in files.items():
+        (root / name).write_text(content)
+
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Contents": [
+                {
+                    "Key": "corpus/same.txt",
+                    "Size": 9,
+                    "ETag": f'"{hashlib.md5(b"unchanged", usedforsecurity=False).hexdigest()}"',
+                },
+                {
+                    "Key": "corpus/edited.txt",
+                    "Size": 9,
+                    "ETag": f'"{hashlib.md5(b"old text!", usedforsecurity=False).hexdigest()}"',
+                },
+                # Uploaded earlier with another part size: the size match decides.
+                {"Key": "corpus/nested/big.bin", "Size": 4096, "ETag": '"0123456789abcdef-3"'},
+            ]
+        }
+    ]
+
+    def upload(filename, bucket_name, key, Config):
+        assert Config.multipart_chunksize == 8 * 1024 * 1024
+        if key.endswith("broken.txt"):
+            raise RuntimeError("SlowDown")
+
+    client.upload_file.side_effect = upload
+
+    result = datalake.upload_directory(
+        client,
+        root,
+        "raw",
+        target_prefix="corpus",
+        max_workers=2,
+        config=datalake.transfer_config(multipart_chunk_mb=8),
+    )
+
+    uploaded_keys = sorted(call.args[2] for call in client.upload_file.call_args_list)
+    assert uploaded_keys == ["corpus/broken.txt", "corpus/edited.txt", "corpus/new.txt"]
+    assert result.uploaded == 2
+    assert result.skipped == 2
+    assert result.uploaded_bytes == 14
+    assert result.failed == [{"key": "corpus/broken.txt", "error": "SlowDown"}]
+    client.get_paginator.return_value.paginate.assert_called_once_with(Bucket="raw", Prefix="corpus/")
+
+
+def test_local_etag_matches_s3_multipart_format(tmp_path):
+    path = tmp_path / "large.bin"
+    path.write_bytes(b"a" * 5 + b"b" * 5 + b"c" * 2)
+    config = SimpleNamespace(multipart_threshold=8, multipart_chunksize=5)
+
+    etag, parts = datalake._local_etag(path, 12, config)
+
+    part_digests = (hashlib.md5(part, usedforsecurity=False).digest() for part in (b"aaaaa", b"bbbbb", b"cc"))
+    expected = hashlib.md5(b"".join(part_digests), usedforsecurity=False).hexdigest()
+    assert (etag, parts) == (f"{expected}-3", 3)
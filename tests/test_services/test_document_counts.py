@@ -0,0 +1,46 @@
+"""Unit tests for cached document counts."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from certus_ask.services.document_counts import DocumentCountCache
+
+
+def _store(count=10):
+    return SimpleNamespace(_index="ask_certus_ws", count_documents=MagicMock(return_value=count))
+
+
+def test_counts_are_cached_and_advanced_by_writes():
+    cache = DocumentCountCache(max_age_seconds=60)
+    store = _store()
+
+    assert cache.count(store) == 10
+    cache.add(store, 5)
+
+    assert cache.count(store) == 15
+    store.count_documents.assert_called_once()
+
+
+def test_stale_or_invalidated_counts_are_reconciled():
+    cache = DocumentCountCache(max_age_seconds=60)
+    store = _store()
+    cache.count(store)
+
+    store.count_documents.return_value = 7
+    cache.invalidate(store)
+    assert cache.count(store) == 7
+
+    uncached = DocumentCountCache(max_age_seconds=0)
+    uncached.count(store)
+    uncached.count(store)
+    assert store.count_documents.call_count == 4
+
+
+def test_stores_without_index_name_are_counted_directly():
+    cache = DocumentCountCache(max_age_seconds=60)
+    store = MagicMock()
+    store.count_documents.return_value = 3
+
+    assert cache.count(store) == 3
+    assert cache.count(store) == 3
+    assert store.count_documents.call_count == 2
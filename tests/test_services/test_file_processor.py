@@ -609,6 +609,58 @@ class TestProcessGithub:
 
             assert "No files matched" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_process_github_incremental_ingests_only_diff(
+        self, file_processor_with_services, mock_document_store, tmp_path, monkeypatch
+    ):
+        """Incremental runs should ingest changed files and drop deleted ones since the last commit."""
+        from certus_ask.services.github import RepositoryChanges
+        from certus_ask.services.ingestion import ledger
+        from certus_ask.services.ingestion.ledger import IncrementalSync, get_ingestion_ledger
+
+        monkeypatch.setattr(ledger.settings, "ingestion_ledger_path", str(tmp_path / "ledger.db"))
+        get_ingestion_ledger.cache_clear()
+        repo_url = "https://github.com/test/repo.git"
+        seed = IncrementalSync(get_ingestion_ledger(), mock_document_store, "ws-1", f"{repo_url}@main")
+        seed.commit("docs/old.md", "hash-old", ["old-chunk"])
+        seed.set_revision("commit-1")
+
+        # Nested paths: the default "**/*.md" globs do not match top-level files on Python < 3.13.
+        repo_dir = tmp_path / "repo"
+        (repo_dir / "docs").mkdir(parents=True)
+        (repo_dir / "docs" / "README.md").write_text("updated", encoding="utf-8")
+        (repo_dir / "docs" / "untouched.md").write_text("same", encoding="utf-8")
+
+        with (
+            patch("certus_ask.services.github.sync_repository") as mock_sync,
+            patch("certus_ask.services.github.diff_repository") as mock_diff,
+            patch("certus_ask.pipelines.preprocessing.create_preprocessing_pipeline") as mock_pipeline_factory,
+        ):
+            checkout = MagicMock(path=repo_dir, head_commit="commit-2")
+            mock_sync.return_value.__enter__.return_value = checkout
+            mock_sync.return_value.__exit__.return_value = None
+            mock_diff.return_value = RepositoryChanges(changed=["docs/README.md"], deleted=["docs/old.md"])
+            mock_pipeline = MagicMock()
+            mock_pipeline_factory.return_value = mock_pipeline
+            mock_pipeline.run.return_value = {"document_writer": {"documents_written": 1, "metadata_preview": []}}
+
+            result = await file_processor_with_services.process_github(
+                repo_url=repo_url,
+                workspace_id="ws-1",
+                ingestion_id="ing-1",
+                branch="main",
+                incremental=True,
+            )
+
+        mock_diff.assert_called_once_with(repo_dir, "commit-1", "commit-2")
+        assert mock_pipeline.run.call_count == 1
+        assert result["file_count"] == 1
+        assert result["deleted_files"] == 1
+        assert result["base_commit"] == "commit-1"
+        mock_document_store.delete_documents.assert_called_once_with(document_ids=["old-chunk"])
+        assert get_ingestion_ledger().get_revision("ws-1", f"{repo_url}@main") == "commit-2"
+        get_ingestion_ledger.cache_clear()
+
 
 class TestProcessWeb:
     """Tests for FileProcessor.process_web()."""
@@ -640,7 +692,11 @@ class TestProcessWeb:
 
             mock_client.get = mock_get
 
-            with patch("haystack.components.converters.html.HTMLToDocument") as mock_converter_class:
+            with (
+                patch("haystack.components.converters.html.HTMLToDocument") as mock_converter_class,
+                patch("certus_ask.pipelines.preprocessing.LoggingDocumentEmbedder") as mock_embedder_class,
+            ):
+                mock_embedder_class.return_value.run.side_effect = lambda documents: {"documents": documents}
                 mock_converter = MagicMock()
                 mock_converter_class.return_value = mock_converter
                 from haystack import Document as HaystackDocument
@@ -692,7 +748,11 @@ class TestProcessWeb:
 
             mock_client.get = mock_get
 
-            with patch("haystack.components.converters.html.HTMLToDocument") as mock_converter_class:
+            with (
+                patch("haystack.components.converters.html.HTMLToDocument") as mock_converter_class,
+                patch("certus_ask.pipelines.preprocessing.LoggingDocumentEmbedder") as mock_embedder_class,
+            ):
+                mock_embedder_class.return_value.run.side_effect = lambda documents: {"documents": documents}
                 mock_converter = MagicMock()
                 mock_converter_class.return_value = mock_converter
                 from haystack import Document as HaystackDocument
@@ -61,3 +61,83 @@ def test_clone_repository_passes_branch_and_depth(monkeypatch, tmp_path: Path):
     assert captured["kwargs"]["depth"] == 1
     assert captured["kwargs"]["branch"] == "main"
     assert repo_ctx.path == repo_dir
+
+
+def test_iter_repository_files_limits_to_given_paths(tmp_path: Path):
+    """Passing changed paths should only consider those files, still applying filters."""
+    repo = tmp_path / "repo"
+    (repo / "docs").mkdir(parents=True)
+    (repo / "docs" / "changed.md").write_text("changed", encoding="utf-8")
+    (repo / "docs" / "other.md").write_text("other", encoding="utf-8")
+    (repo / "image.png").write_bytes(b"png")
+
+    files = github.iter_repository_files(repo, paths=["docs/changed.md", "image.png", "docs/missing.md"])
+
+    assert files == [repo / "docs" / "changed.md"]
+
+
+def test_diff_repository_splits_changed_and_deleted(monkeypatch, tmp_path: Path):
+    """diff_repository should parse NUL-separated name-status output."""
+
+    class DummyGit:
+        def cat_file(self, *args):
+            return ""
+
+        def diff(self, *args):
+            assert "-z" in args
+            return "M\0docs/a.md\0A\0docs/new file.md\0D\0old.md\0"
+
+    monkeypatch.setattr("certus_ask.services.github.Repo", lambda path: SimpleNamespace(git=DummyGit()))
+
+    changes = github.diff_repository(tmp_path, "base", "head")
+
+    assert changes.changed == ["docs/a.md", "docs/new file.md"]
+    assert changes.deleted == ["old.md"]
+
+
+def test_diff_repository_missing_base_requires_full_walk(monkeypatch, tmp_path: Path):
+    """An unknown base commit should return None so callers fall back to a full walk."""
+
+    class DummyGit:
+        def cat_file(self, *args):
+            raise github.GitCommandError("cat-file", 128)
+
+    monkeypatch.setattr("certus_ask.services.github.Repo", lambda path: SimpleNamespace(git=DummyGit()))
+
+    assert github.diff_repository(tmp_path, "gone", "head") is None
+
+
+def test_checkout_keeps_token_out_of_urls_and_logs(monkeypatch, tmp_path: Path):
+    """Cached checkouts should pass the token via the environment and log only git's exit status."""
+    monkeypatch.setattr("certus_ask.services.github.settings", SimpleNamespace(github_token="secret-token"))
+    path = tmp_path / "checkout"
+    (path / ".git").mkdir(parents=True)
+    calls = {}
+
+    class FakeRepo:
+        def __init__(self, repo_path):
+            self.git = SimpleNamespace(fetch=self.fetch)
+
+        @staticmethod
+        def fetch(url, *args, **kwargs):
+            calls["fetch"] = (url, kwargs["env"])
+            raise github.GitCommandError(["git", "fetch", url], 128, stderr="fatal: could not read from remote")
+
+        @staticmethod
+        def clone_from(url, to_path, **kwargs):
+            calls["clone"] = (url, kwargs["env"])
+            return SimpleNamespace(submodules=[], head=SimpleNamespace(commit=SimpleNamespace(hexsha="abc")))
+
+    monkeypatch.setattr("certus_ask.services.github.Repo", FakeRepo)
+    warnings = []
+    monkeypatch.setattr(github.logger, "warning", lambda event, **kwargs: warnings.append((event, kwargs)))
+
+    assert github._update_checkout(path, "https://github.com/example/repo.git", "main") == "abc"
+
+    for url, env in calls.values():
+        assert url == "https://github.com/example/repo.git"
+        assert env["GIT_CONFIG_KEY_0"] == "http.extraHeader"
+        assert "secret-token" not in env["GIT_CONFIG_VALUE_0"]
+    assert warnings == [
+        ("github.checkout_reset", {"repo_url": "https://github.com/example/repo.git", "branch": "main", "status": 128})
+    ]
@@ -0,0 +1,117 @@
+"""Unit tests for the ingestion job manager."""
+
+import asyncio
+import threading
+
+import pytest
+
+from certus_ask.services.ingestion.jobs import (
+    IngestionJobManager,
+    IngestionJobStatus,
+    JobQueueFullError,
+    report_progress,
+)
+
+
+@pytest.fixture
+def manager():
+    manager = IngestionJobManager(max_workers=1, max_queued=1, retention=10)
+    yield manager
+    manager.shutdown(wait=True)
+
+
+def test_job_runs_and_reports_progress(manager):
+    """A job should record progress counters and its result."""
+
+    async def ingest():
+        report_progress(processed_files=1, total_files=2)
+        report_progress(processed_files=2)
+        return {"processed_files": 2}
+
+    job = manager.submit("folder", "ws", ingest)
+    assert job.future.result(timeout=5) == {"processed_files": 2}
+
+    status = manager.get(job.job_id).to_dict()
+    assert status["status"] == "succeeded"
+    assert status["progress"] == {"processed_files": 2, "total_files": 2}
+    assert status["result"] == {"processed_files": 2}
+    assert status["started_at"] is not None
+
+
+def test_failed_job_captures_error_and_reraises_to_waiters(manager):
+    """Failures should be recorded on the job and propagate to synchronous callers."""
+
+    async def ingest():
+        raise ValueError("bad folder")
+
+    job = manager.submit("folder", "ws", ingest)
+
+    with pytest.raises(ValueError, match="bad folder"):
+        asyncio.run(manager.wait(job))
+    assert job.status is IngestionJobStatus.FAILED
+    assert job.error == {"error": "ValueError", "message": "bad folder"}
+
+
+def test_queue_is_bounded(manager):
+    """Submissions beyond workers + max_queued should be rejected."""
+    release = threading.Event()
+    started = threading.Event()
+
+    async def blocking():
+        started.set()
+        await asyncio.to_thread(release.wait, 5)
+
+    running = manager.submit("s3", "ws", blocking)
+    assert started.wait(5)
+    queued = manager.submit("s3", "ws", blocking)
+
+    with pytest.raises(JobQueueFullError):
+        manager.submit("s3", "ws", blocking)
+
+    assert manager.stats()["running"] == 1
+    assert manager.stats()["queued"] == 1
+    release.set()
+    running.future.result(timeout=5)
+    queued.future.result(timeout=5)
+
+
+def test_list_filters_by_workspace_and_report_progress_outside_job_is_noop(manager):
+    async def ingest():
+        return None
+
+    first = manager.submit("web", "ws", ingest)
+    second = manager.submit("web", "other", ingest)
+    first.future.result(timeout=5)
+    second.future.result(timeout=5)
+
+    report_progress(processed_files=1)
+    assert [job.job_id for job in manager.list(workspace_id="ws")] == [first.job_id]
+    assert first.progress == {}
+
+
+def test_shutdown_fails_queued_jobs_and_releases_their_callbacks():
+    """Jobs cancelled by shutdown must not leave waiters hanging or admission slots taken."""
+    manager = IngestionJobManager(max_workers=1, max_queued=1)
+    release = threading.Event()
+    started = threading.Event()
+    released: list[str] = []
+
+    async def blocking():
+        started.set()
+        await asyncio.to_thread(release.wait, 5)
+
+    running = manager.submit("s3", "ws", blocking, on_done=lambda: released.append("running"))
+    assert started.wait(5)
+    queued = manager.submit("s3", "ws", blocking, on_done=lambda: released.append("queued"))
+
+    manager.shutdown(wait=False)
+
+    with pytest.raises(RuntimeError, match="cancelled by shutdown"):
+        queued.future.result(timeout=5)
+    assert queued.status is IngestionJobStatus.FAILED
+    assert released == ["queued"]
+
+    release.set()
+    running.future.result(timeout=5)
+    manager.shutdown(wait=True)
+    assert released == ["queued", "running"]
@@ -0,0 +1,139 @@
+"""Unit tests for the content-hash ingestion ledger."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from certus_ask.services.ingestion.ledger import IncrementalSync, IngestionLedger, compute_file_sha256
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = IngestionLedger(tmp_path / "ledger.db")
+    yield ledger
+    ledger.close()
+
+
+@pytest.fixture
+def document_store():
+    store = MagicMock()
+    store.count_documents.return_value = 10
+    return store
+
+
+def test_unchanged_files_are_skipped(ledger, document_store):
+    """A file recorded with the same hash should be skipped on the next run."""
+    first = IncrementalSync(ledger, document_store, "ws", "/docs")
+    assert first.should_skip("/docs/a.md", content_hash="h1") is False
+    first.commit("/docs/a.md", "h1", ["c1", "c2"])
+
+    second = IncrementalSync(ledger, document_store, "ws", "/docs")
+    assert second.should_skip("/docs/a.md", content_hash="h1") is True
+    assert second.skipped == 1
+    assert second.finalize() == 0
+    document_store.delete_documents.assert_not_called()
+
+
+def test_changed_file_replaces_stale_chunks(ledger, document_store):
+    """Chunks no longer produced by a changed file should be deleted."""
+    IncrementalSync(ledger, document_store, "ws", "/docs").commit("/docs/a.md", "h1", ["c1", "c2"])
+
+    sync = IncrementalSync(ledger, document_store, "ws", "/docs")
+    assert sync.should_skip("/docs/a.md", content_hash="h2") is False
+    sync.commit("/docs/a.md", "h2", ["c2", "c3"])
+
+    document_store.delete_documents.assert_called_once_with(document_ids=["c1"])
+    assert ledger.entries("ws", "/docs")["/docs/a.md"].document_ids == ["c2", "c3"]
+
+
+def test_deleted_files_are_removed(ledger, document_store):
+    """Files missing from a run should have their chunks and ledger entries removed."""
+    sync = IncrementalSync(ledger, document_store, "ws", "/docs")
+    sync.commit("/docs/a.md", "h1", ["a1"])
+    sync.commit("/docs/b.md", "h2", ["b1", "b2"])
+
+    rerun = IncrementalSync(ledger, document_store, "ws", "/docs")
+    rerun.should_skip("/docs/a.md", content_hash="h1")
+
+    assert rerun.finalize() == 1
+    document_store.delete_documents.assert_called_once_with(document_ids=["b1", "b2"])
+    assert list(ledger.entries("ws", "/docs")) == ["/docs/a.md"]
+
+
+def test_scopes_and_workspaces_are_isolated(ledger, document_store):
+    """Entries should only apply to the workspace and source they were recorded for."""
+    IncrementalSync(ledger, document_store, "ws", "/docs").commit("/docs/a.md", "h1", ["c1"])
+
+    other_workspace = IncrementalSync(ledger, document_store, "other", "/docs")
+    other_scope = IncrementalSync(ledger, document_store, "ws", "/other")
+
+    assert other_workspace.should_skip("/docs/a.md", content_hash="h1") is False
+    assert other_scope.should_skip("/docs/a.md", content_hash="h1") is False
+
+
+def test_etag_match_skips_and_new_etag_is_remembered(ledger, document_store):
+    """Matching ETags skip before download; identical bytes under a new ETag update the ledger."""
+    IncrementalSync(ledger, document_store, "ws", "s3://raw/docs").commit("docs/a.md", "h1", ["c1"], etag='"e1"')
+
+    sync = IncrementalSync(ledger, document_store, "ws", "s3://raw/docs")
+    assert sync.should_skip("docs/a.md", etag='"e1"') is True
+
+    sync = IncrementalSync(ledger, document_store, "ws", "s3://raw/docs")
+    assert sync.should_skip("docs/a.md", etag='"e2"') is False
+    assert sync.should_skip("docs/a.md", content_hash="h1", etag='"e2"') is True
+    assert ledger.entries("ws", "s3://raw/docs")["docs/a.md"].etag == '"e2"'
+
+
+def test_empty_index_resets_ledger(ledger, document_store):
+    """If the index was wiped, previously recorded files must be re-ingested."""
+    IncrementalSync(ledger, document_store, "ws", "/docs").commit("/docs/a.md", "h1", ["c1"])
+    document_store.count_documents.return_value = 0
+
+    sync = IncrementalSync(ledger, document_store, "ws", "/docs")
+
+    assert sync.should_skip("/docs/a.md", content_hash="h1") is False
+    assert ledger.entries("ws", "/docs") == {}
+
+
+def test_disabled_sync_never_skips(document_store):
+    """Without a ledger every file is processed and nothing is deleted."""
+    sync = IncrementalSync(None, document_store, "ws", "/docs")
+
+    assert sync.enabled is False
+    assert sync.should_skip("/docs/a.md", content_hash="h1") is False
+    sync.commit("/docs/a.md", "h1", ["c1"])
+    assert sync.finalize() == 0
+
+
+def test_compute_file_sha256(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_bytes(b"hello")
+
+    assert compute_file_sha256(path) == "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"
+
+
+def test_revisions_are_tracked_and_reset_with_empty_index(ledger, document_store):
+    """The last indexed revision should persist and be cleared when the index is wiped."""
+    IncrementalSync(ledger, document_store, "ws", "repo@main").set_revision("abc123")
+    sync = IncrementalSync(ledger, document_store, "ws", "repo@main")
+    sync.commit("README.md", "h1", ["c1"])
+    assert sync.revision == "abc123"
+
+    document_store.count_documents.return_value = 0
+    assert IncrementalSync(ledger, document_store, "ws", "repo@main").revision is None
+
+
+def test_index_emptiness_check_ignores_stale_cached_count(ledger, monkeypatch):
+    """A cached count from before the index was dropped must not make a wiped index look populated."""
+    from certus_ask.services.document_counts import DocumentCountCache
+
+    cache = DocumentCountCache(max_age_seconds=60)
+    monkeypatch.setattr("certus_ask.services.ingestion.ledger.get_document_counts", lambda: cache)
+    store = MagicMock(_index="ask_certus_ws")
+    store.count_documents.return_value = 10
+    IncrementalSync(ledger, store, "ws", "/docs").commit("/docs/a.md", "h1", ["c1"])
+    assert cache.count(store) == 10
+
+    store.count_documents.return_value = 0
+
+    assert IncrementalSync(ledger, store, "ws", "/docs").should_skip("/docs/a.md", content_hash="h1") is False
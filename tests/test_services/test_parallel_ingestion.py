@@ -0,0 +1,145 @@
+"""Unit tests for parallel folder/repository ingestion."""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from certus_ask.services.ingestion.parallel_ingestion import ParallelFileIngestor
+
+
+def _fake_prepare(file_path: str, metadata_context: dict) -> dict:
+    name = Path(file_path).name
+    if name.startswith("broken"):
+        return {"error": "unsupported format"}
+    chunks = [MagicMock(name=f"{name}-{index}") for index in range(2)]
+    return {
+        "documents": chunks,
+        "quarantined": 1 if name.startswith("pii") else 0,
+        "metadata_preview": [{"source_location": metadata_context["source_location"]}],
+    }
+
+
+def _crashing_prepare(file_path: str, metadata_context: dict) -> dict:
+    name = Path(file_path).name
+    if name.startswith("crash"):
+        time.sleep(0.2)  # let the other worker pick up its file first
+        os._exit(1)  # simulate a segfault or OOM kill
+    if name.startswith("hang"):
+        time.sleep(60)
+    time.sleep(0.05)
+    return {"documents": [], "quarantined": 0, "metadata_preview": []}
+
+
+def _fork_ingestor(pools: list, timeout_seconds: float = 30) -> ParallelFileIngestor:
+    def factory(workers: int) -> ProcessPoolExecutor:
+        pools.append(ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")))
+        return pools[-1]
+
+    return ParallelFileIngestor(
+        document_store=MagicMock(),
+        max_workers=2,
+        timeout_seconds=timeout_seconds,
+        executor_factory=factory,
+        prepare=_crashing_prepare,
+        embedder=MagicMock(),
+        writer=MagicMock(),
+    )
+
+
+def _ingestor(batch_size: int = 4, writer: MagicMock | None = None) -> ParallelFileIngestor:
+    embedder = MagicMock()
+    embedder.run.side_effect = lambda documents: {"documents": documents}
+    if writer is None:
+        writer = MagicMock()
+        writer.run.side_effect = lambda documents: {"documents_written": len(documents)}
+    return ParallelFileIngestor(
+        document_store=MagicMock(),
+        max_workers=2,
+        batch_size=batch_size,
+        executor_factory=lambda workers: ThreadPoolExecutor(max_workers=workers),
+        prepare=_fake_prepare,
+        embedder=embedder,
+        writer=writer,
+    )
+
+
+def _files(*names: str):
+    return [(Path(name), {"source_location": name}) for name in names]
+
+
+def test_ingest_batches_embedding_across_files():
+    """Chunks from several files should be embedded and written together."""
+    ingestor = _ingestor(batch_size=4)
+
+    result = ingestor.ingest(_files("a.md", "b.md", "c.md", "pii.md", "e.md"))
+
+    assert result.processed_files == 5
+    assert result.failed_files == 0
+    assert result.quarantined_count == 1
+    assert result.documents_written == 10
+    assert len(result.metadata_preview) == 3
+    # 10 chunks at a batch size of 4 need far fewer writes than one per file.
+    assert ingestor.writer.run.call_count < 5
+    written = sum(len(call.kwargs["documents"]) for call in ingestor.writer.run.call_args_list)
+    assert written == 10
+
+
+def test_ingest_reports_per_file_conversion_failures():
+    """A file that fails conversion should be counted without affecting the others."""
+    ingestor = _ingestor()
+
+    result = ingestor.ingest(_files("a.md", "broken.bin", "c.md"))
+
+    assert result.processed_files == 2
+    assert result.failed_files == 1
+
+
+def test_failed_write_marks_batch_files_failed():
+    """If a batch cannot be written, every file in that batch is reported as failed."""
+    writer = MagicMock()
+    writer.run.side_effect = RuntimeError("cluster unavailable")
+    ingestor = _ingestor(batch_size=100, writer=writer)
+
+    result = ingestor.ingest(_files("a.md", "b.md", "broken.bin"))
+
+    assert result.processed_files == 0
+    assert result.failed_files == 3
+    assert result.documents_written == 0
+
+
+def test_crashed_worker_retries_collateral_files_once():
+    """A worker dying mid-file fails that file; files sharing its pool run again on a fresh one."""
+    pools = []
+    indexed = []
+    ingestor = _fork_ingestor(pools)
+
+    result = ingestor.ingest(
+        _files("crash.pdf", "a.md", "b.md", "c.md"),
+        on_file_indexed=lambda file_path, chunk_ids: indexed.append(file_path.name),
+    )
+
+    assert result.failed_files == 1
+    assert result.processed_files == 3
+    assert sorted(indexed) == ["a.md", "b.md", "c.md"]
+    assert len(pools) >= 3  # the crashing file broke two pools before it was given up
+
+
+def test_hung_file_times_out_without_stalling_the_job():
+    """A file exceeding the per-file limit is failed and its pool recycled; the rest still finish."""
+    pools = []
+    indexed = []
+    ingestor = _fork_ingestor(pools, timeout_seconds=1)
+
+    started = time.monotonic()
+    result = ingestor.ingest(
+        _files("hang.pdf", "a.md", "b.md", "c.md"),
+        on_file_indexed=lambda file_path, chunk_ids: indexed.append(file_path.name),
+    )
+
+    assert time.monotonic() - started < 15
+    assert result.failed_files == 1
+    assert sorted(indexed) == ["a.md", "b.md", "c.md"]
+    assert len(pools) == 2
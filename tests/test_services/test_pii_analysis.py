@@ -0,0 +1,145 @@
+"""Unit tests for batched PII analysis."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from certus_ask.services import pii_analysis
+from certus_ask.services.pii_analysis import PiiAnalysisPool, analyze_in_process, split_windows
+
+
+def _fake_analyzer():
+    analyzer = MagicMock()
+    analyzer.analyze.side_effect = lambda text, **_: [text.upper()] if "@" in text else []
+    return analyzer
+
+
+def test_non_presidio_analyzer_is_called_per_text():
+    analyzer = _fake_analyzer()
+
+    results = analyze_in_process(analyzer, ["clean", "a@b.c"])
+
+    assert results == [[], ["A@B.C"]]
+    assert analyzer.analyze.call_count == 2
+
+
+def test_pool_splits_large_batches_and_preserves_order(monkeypatch):
+    """Large batches go to workers in chunks; results must line up with the inputs."""
+    chunks = []
+
+    def fake_chunk(texts, batch_size):
+        chunks.append(texts)
+        return [[f"{text}:{batch_size}"] for text in texts]
+
+    monkeypatch.setattr(pii_analysis, "_analyze_chunk", fake_chunk)
+    pool = PiiAnalysisPool(max_workers=2, executor_factory=lambda n: ThreadPoolExecutor(n), min_texts=3)
+    texts = [f"t{i}" for i in range(5)]
+
+    results = pool.analyze(_fake_analyzer(), texts, batch_size=16)
+
+    assert results == [[f"t{i}:16"] for i in range(5)]
+    assert chunks == [["t0", "t1", "t2"], ["t3", "t4"]]
+    pool.shutdown()
+
+
+def test_pool_keeps_small_batches_in_process(monkeypatch):
+    monkeypatch.setattr(pii_analysis, "_analyze_chunk", MagicMock(side_effect=AssertionError("no fan-out")))
+    factory = MagicMock()
+    pool = PiiAnalysisPool(max_workers=4, executor_factory=factory, min_texts=10)
+
+    assert pool.analyze(_fake_analyzer(), ["x@y.z"]) == [["X@Y.Z"]]
+    factory.assert_not_called()
+
+
+def test_split_windows_overlap_and_cover_text():
+    text = " ".join(f"word{i:03d}" for i in range(200))
+
+    windows = split_windows(text, window_chars=300, overlap_chars=60)
+
+    assert windows[0][0] == 0
+    assert windows[-1][1] == len(text)
+    assert all(next_start < end for (_, end), (next_start, _) in zip(windows, windows[1:]))
+    assert all(end == len(text) or text[end] == " " for _, end in windows)
+    assert split_windows("short", window_chars=300, overlap_chars=60) == [(0, 5)]
+
+
+def test_windowed_analysis_finds_entities_across_boundaries_once(monkeypatch):
+    """Entities in overlaps or straddling window edges are reported once at document offsets."""
+    from certus_integrity.services.presidio import RegexAnalyzer
+
+    monkeypatch.setattr(pii_analysis.settings, "pii_window_chars", 120)
+    monkeypatch.setattr(pii_analysis.settings, "pii_window_overlap", 40)
+    monkeypatch.setattr(pii_analysis, "get_pii_analysis_pool", lambda: None)
+    filler = "lorem ipsum dolor sit amet " * 3
+    text = f"{filler}alice@example.com {filler}bob@example.org {filler}carol@example.net end"
+
+    (results,) = pii_analysis.analyze_texts(RegexAnalyzer(), [text])
+
+    emails = sorted(text[result.start : result.end] for result in results if result.entity_type == "EMAIL_ADDRESS")
+    assert emails == ["alice@example.com", "bob@example.org", "carol@example.net"]
+    assert len(split_windows(text, 120, 40)) > 2
+
+
+def test_prefilter_detects_candidates_with_checksums():
+    prefilter = pii_analysis.PiiPrefilter()
+
+    assert prefilter.has_candidates("contact ops@example.com")
+    assert prefilter.has_candidates("card 4111 1111 1111 1111")
+    assert prefilter.has_candidates("signed off by Jane Doe")
+    assert prefilter.has_candidates("ssn 123-45-6789")
+    assert not prefilter.has_candidates("card 4111 1111 1111 1112")
+    assert not prefilter.has_candidates("ssn 000-12-3456 and version 999.1.2.3")
+    assert not prefilter.has_candidates("def add(a, b):\n    return a + b  # sum values")
+    assert prefilter.has_candidates("Dear John Smith, thanks")
+    assert prefilter.has_candidates("reviewed with Dr. Patel")
+
+
+def test_prefilter_skips_title_case_prose_without_pii():
+    """Headings and capitalized product or team names are not treated as personal names."""
+    prefilter = pii_analysis.PiiPrefilter()
+    prose = (
+        "Release Notes\n\nThe Security Team reviewed the Access Control Policy for Cloud Storage. "
+        "New York Region deployments follow the Incident Response Plan described in Section Four."
+    )
+
+    assert not prefilter.has_candidates(prose)
+    assert prefilter.select([prose, "signed off by Jane Doe"]) == [1]
+
+
+def test_prefilter_skips_clean_texts_and_records_pass_rate(monkeypatch):
+    prefilter = pii_analysis.PiiPrefilter()
+    monkeypatch.setattr(pii_analysis, "get_pii_prefilter", lambda: prefilter)
+    monkeypatch.setattr(pii_analysis, "get_pii_analysis_pool", lambda: None)
+    analyzer = _fake_analyzer()
+
+    results = pii_analysis.analyze_texts(analyzer, ["x = 1", "mail a@b.io", "return None"])
+
+    assert results == [[], ["MAIL A@B.IO"], []]
+    assert analyzer.analyze.call_count == 1
+    assert prefilter.stats() == {"scanned": 3, "passed": 1, "pass_rate": 0.3333}
+
+
+def test_repeated_texts_are_analyzed_once_via_result_cache(monkeypatch):
+    """Repeated boilerplate is served from the shared cache, within and across batches."""
+    from certus_integrity.services import pii_cache
+    from certus_integrity.services.presidio import RegexAnalyzer
+
+    cache = pii_cache.PiiResultCache(max_entries=10)
+    monkeypatch.setattr(pii_cache, "get_pii_result_cache", lambda: cache)
+    monkeypatch.setattr(pii_analysis, "get_pii_analysis_pool", lambda: None)
+    analyzer = RegexAnalyzer()
+    calls = []
+
+    def counting_analyze(text, **kwargs):
+        calls.append(text)
+        return RegexAnalyzer.analyze(analyzer, text, **kwargs)
+
+    monkeypatch.setattr(analyzer, "analyze", counting_analyze)
+    header = "Copyright maintainers, contact legal@example.com"
+
+    first = pii_analysis.analyze_texts(analyzer, [header, "body one", header])
+    second = pii_analysis.analyze_texts(analyzer, [header])
+
+    assert calls == [header, "body one"]
+    assert [len(results) for results in first] == [1, 0, 1]
+    assert second[0][0].entity_type == "EMAIL_ADDRESS"
+    assert second[0][0] is not first[0][0]
@@ -0,0 +1,45 @@
+"""Unit tests for prefetching S3 downloads."""
+
+import threading
+import time
+
+from certus_ask.services.ingestion.s3_prefetch import prefetch_objects
+
+
+def test_prefetch_yields_in_order_within_buffer_bound_and_cleans_up(tmp_path):
+    lock = threading.Lock()
+    started: list[str] = []
+    consumed: list[str] = []
+    max_ahead = 0
+
+    def download(key: str, local_path) -> None:
+        nonlocal max_ahead
+        with lock:
+            started.append(key)
+            max_ahead = max(max_ahead, len(started) - len(consumed))
+        if key == "docs/bad.txt":
+            raise RuntimeError("AccessDenied")
+        time.sleep(0.01)
+        local_path.write_text(key, encoding="utf-8")
+
+    keys = [f"docs/{index}/same-name.txt" for index in range(8)] + ["docs/bad.txt"]
+    seen = []
+    previous = None
+
+    for prefetched in prefetch_objects(
+        ({"Key": key} for key in keys), download, tmp_path, max_prefetch=3, max_workers=2
+    ):
+        if previous is not None:
+            assert not previous.exists()
+        if prefetched.error is None:
+            assert prefetched.local_path.read_text(encoding="utf-8") == prefetched.key
+            assert prefetched.local_path.name == "same-name.txt"
+            previous = prefetched.local_path
+        seen.append((prefetched.key, prefetched.error))
+        with lock:
+            consumed.append(prefetched.key)
+
+    assert [key for key, _ in seen] == keys
+    assert seen[-1] == ("docs/bad.txt", "AccessDenied")
+    assert max_ahead <= 3
+    assert not previous.exists()
@@ -0,0 +1,191 @@
+"""Unit tests for the OpenSearch bulk-ingest mode."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from certus_ask.services.storage import bulk_indexing
+from certus_ask.services.storage.bulk_indexing import bulk_ingest_mode, bulk_mode_active, bulk_write_documents
+
+
+@pytest.fixture
+def store():
+    client = MagicMock()
+    client.indices.get_settings.return_value = {
+        "ask_certus_ws": {"settings": {"index.number_of_replicas": "1"}},
+    }
+    mapping = {"_meta": {"owner": "certus"}}
+    client.indices.get_mapping.side_effect = lambda index: {index: {"mappings": dict(mapping)}}
+    client.indices.put_mapping.side_effect = lambda index, body: mapping.update(body)
+    return SimpleNamespace(_index="ask_certus_ws", _client=client, _ensure_initialized=lambda: None)
+
+
+def test_bulk_mode_tunes_index_once_and_restores_after_last_job(store):
+    """Nested jobs on one index share the tuning; the original settings come back at the end."""
+    indices = store._client.indices
+
+    with bulk_ingest_mode(store):
+        assert bulk_mode_active(store)
+        with bulk_ingest_mode(store):
+            pass
+        indices.put_settings.assert_called_once_with(
+            index="ask_certus_ws", body={"index.refresh_interval": "-1", "index.number_of_replicas": 0}
+        )
+        indices.refresh.assert_not_called()
+
+    assert not bulk_mode_active(store)
+    indices.put_settings.assert_called_with(
+        index="ask_certus_ws", body={"index.refresh_interval": None, "index.number_of_replicas": "1"}
+    )
+    indices.refresh.assert_called_once_with(index="ask_certus_ws")
+    assert bulk_indexing._active == {}
+
+
+def test_bulk_mode_saves_original_settings_in_the_index_mapping(store):
+    """The settings to restore are persisted while tuned and removed once restored."""
+    indices = store._client.indices
+
+    with bulk_ingest_mode(store):
+        indices.put_mapping.assert_called_once()
+        meta = indices.put_mapping.call_args.kwargs["body"]["_meta"]
+        assert meta["owner"] == "certus"
+        assert meta[bulk_indexing._META_KEY] == {"index.refresh_interval": None, "index.number_of_replicas": "1"}
+        assert list(meta[bulk_indexing._LEASE_KEY]) == [bulk_indexing._owner()]
+
+    indices.put_mapping.assert_called_with(index="ask_certus_ws", body={"_meta": {"owner": "certus"}})
+
+
+def test_restore_interrupted_bulk_mode_restores_indices_left_tuned(store):
+    """At startup, indices a crashed process left tuned get their saved settings back."""
+    indices = store._client.indices
+    original = {"index.refresh_interval": "5s", "index.number_of_replicas": "1"}
+    indices.get_mapping.side_effect = [
+        {
+            "ask_certus": {"mappings": {}},
+            "ask_certus_ws": {"mappings": {"_meta": {bulk_indexing._META_KEY: original}}},
+        },
+        {"ask_certus_ws": {"mappings": {"_meta": {bulk_indexing._META_KEY: original}}}},
+    ]
+    store._index = "ask_certus"
+
+    assert bulk_indexing.restore_interrupted_bulk_mode(store) == ["ask_certus_ws"]
+
+    indices.get_mapping.assert_any_call(index="ask_certus*")
+    indices.put_settings.assert_called_once_with(index="ask_certus_ws", body=original)
+    indices.refresh.assert_called_once_with(index="ask_certus_ws")
+    indices.put_mapping.assert_called_once_with(index="ask_certus_ws", body={"_meta": {}})
+
+
+def test_restore_interrupted_bulk_mode_skips_indices_leased_by_live_processes(store):
+    """Another worker's running job keeps its index tuned; only stale leases are restored."""
+    indices = store._client.indices
+    original = {"index.refresh_interval": "5s"}
+    now = time.time()
+    leases = {
+        "ask_certus_live": {"other-host:7": now},
+        "ask_certus_stale": {"other-host:8": now - 3600},
+    }
+    mappings = {
+        index: {"mappings": {"_meta": {bulk_indexing._META_KEY: original, bulk_indexing._LEASE_KEY: lease}}}
+        for index, lease in leases.items()
+    }
+    indices.get_mapping.side_effect = lambda index: mappings if index.endswith("*") else {index: mappings[index]}
+    store._index = "ask_certus"
+
+    assert bulk_indexing.restore_interrupted_bulk_mode(store) == ["ask_certus_stale"]
+
+    indices.put_settings.assert_called_once_with(index="ask_certus_stale", body=original)
+
+
+def test_bulk_mode_leaves_index_tuned_while_another_process_holds_a_lease(store):
+    """A second process joins the saved originals and the last one out restores them."""
+    indices = store._client.indices
+    original = {"index.refresh_interval": "5s", "index.number_of_replicas": "2"}
+    mapping = {"_meta": {bulk_indexing._META_KEY: original, bulk_indexing._LEASE_KEY: {"other-host:7": time.time()}}}
+    indices.get_mapping.side_effect = lambda index: {index: {"mappings": dict(mapping)}}
+    indices.put_mapping.side_effect = lambda index, body: mapping.update(body)
+
+    with bulk_ingest_mode(store):
+        assert set(mapping["_meta"][bulk_indexing._LEASE_KEY]) == {"other-host:7", bulk_indexing._owner()}
+
+    indices.get_settings.assert_not_called()
+    indices.put_settings.assert_called_once_with(
+        index="ask_certus_ws", body={"index.refresh_interval": "-1", "index.number_of_replicas": 0}
+    )
+    indices.refresh.assert_not_called()
+    assert mapping["_meta"][bulk_indexing._META_KEY] == original
+    assert list(mapping["_meta"][bulk_indexing._LEASE_KEY]) == ["other-host:7"]
+
+
+def test_slow_tuning_does_not_block_jobs_on_other_indices(store):
+    """OpenSearch calls for one index must not hold up jobs on another."""
+    tuning = threading.Event()
+    release = threading.Event()
+
+    def slow_get_settings(index, **kwargs):
+        tuning.set()
+        release.wait(5)
+        return {}
+
+    slow_client = MagicMock()
+    slow_client.indices.get_settings.side_effect = slow_get_settings
+    slow_store = SimpleNamespace(_index="ask_certus_slow", _client=slow_client, _ensure_initialized=lambda: None)
+
+    def slow_job():
+        with bulk_ingest_mode(slow_store):
+            pass
+
+    worker = threading.Thread(target=slow_job)
+    worker.start()
+    try:
+        assert tuning.wait(5)
+        with bulk_ingest_mode(store):
+            assert bulk_mode_active(store)
+    finally:
+        release.set()
+        worker.join()
+
+    assert bulk_indexing._active == {}
+
+
+def test_bulk_mode_proceeds_when_tuning_fails(store):
+    store._client.indices.get_settings.side_effect = RuntimeError("forbidden")
+
+    with bulk_ingest_mode(store):
+        assert bulk_mode_active(store)
+
+    store._client.indices.put_settings.assert_not_called()
+
+
+def test_bulk_write_skips_duplicates_and_raises_on_other_errors(store, monkeypatch):
+    from haystack import Document
+    from haystack.document_stores.errors import DocumentStoreError
+    from haystack.document_stores.types import DuplicatePolicy
+
+    calls = {}
+
+    def fake_parallel_bulk(client, actions, **kwargs):
+        actions = list(actions)
+        calls.update(kwargs, ops={action["_op_type"] for action in actions})
+        yield True, {"create": {"_id": actions[0]["_id"]}}
+        yield False, {"create": {"_id": actions[1]["_id"], "error": {"type": "version_conflict_engine_exception"}}}
+
+    monkeypatch.setattr("opensearchpy.helpers.parallel_bulk", fake_parallel_bulk)
+    documents = [Document(content="a"), Document(content="b")]
+
+    written = bulk_write_documents(store, documents, DuplicatePolicy.SKIP, chunk_size=50, thread_count=3)
+
+    assert written == 1
+    assert calls["ops"] == {"create"}
+    assert (calls["chunk_size"], calls["thread_count"], calls["index"]) == (50, 3, "ask_certus_ws")
+
+    def failing_parallel_bulk(client, actions, **kwargs):
+        for action in actions:
+            yield False, {"index": {"_id": action["_id"], "error": {"type": "mapper_parsing_exception"}}}
+
+    monkeypatch.setattr("opensearchpy.helpers.parallel_bulk", failing_parallel_bulk)
+    with pytest.raises(DocumentStoreError):
+        bulk_write_documents(store, documents, DuplicatePolicy.OVERWRITE)
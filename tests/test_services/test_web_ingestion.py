@@ -0,0 +1,119 @@
+"""Unit tests for concurrent web page ingestion."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from haystack import Document
+
+from certus_ask.services.ingestion.web_ingestion import WebPageIngestor
+
+
+class FakeResponse:
+    def __init__(self, url: str):
+        self.text = f"<html><body>{url}</body></html>"
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class FakeClient:
+    """Async HTTP client recording peak concurrency overall and per host."""
+
+    def __init__(self, fail: set[str]):
+        self.fail = fail
+        self.active: dict[str, int] = {}
+        self.peak_per_host: dict[str, int] = {}
+        self.peak_overall = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def get(self, url: str, follow_redirects: bool = True) -> FakeResponse:
+        host = url.split("/")[2]
+        self.active[host] = self.active.get(host, 0) + 1
+        self.peak_per_host[host] = max(self.peak_per_host.get(host, 0), self.active[host])
+        self.peak_overall = max(self.peak_overall, sum(self.active.values()))
+        try:
+            await asyncio.sleep(0.01)
+            if url in self.fail:
+                raise RuntimeError("503 Service Unavailable")
+            return FakeResponse(url)
+        finally:
+            self.active[host] -= 1
+
+
+def _passthrough(name: str, calls: list):
+    component = MagicMock()
+
+    def run(documents):
+        calls.append((name, len(documents)))
+        return {"documents": documents}
+
+    component.run.side_effect = run
+    return component
+
+
+def test_fetches_concurrently_within_host_limits_and_embeds_in_batches():
+    urls = [f"https://{host}.example/advisory/{index}" for host in ("a", "b", "c") for index in range(4)]
+    client = FakeClient(fail={urls[5]})
+    converter = MagicMock()
+    converter.run.side_effect = lambda sources: {
+        "documents": [Document(content=sources[0].to_string(), meta={"title": "Advisory"})]
+    }
+    calls: list = []
+    writer = MagicMock()
+    writer.run.side_effect = lambda documents, metadata_context: {"documents_written": len(documents)}
+
+    ingestor = WebPageIngestor(
+        document_store=MagicMock(),
+        max_concurrency=4,
+        per_host_limit=2,
+        batch_pages=5,
+        client_factory=lambda: client,
+        converter=converter,
+        cleaner=_passthrough("clean", calls),
+        splitter=_passthrough("split", calls),
+        embedder=_passthrough("embed", calls),
+        writer=writer,
+    )
+    context = {"workspace_id": "ws", "ingestion_id": "ing", "source": "web"}
+
+    result = asyncio.run(ingestor.ingest([*urls, urls[0]], context))
+
+    assert client.peak_overall == 4
+    assert max(client.peak_per_host.values()) == 2
+    assert result.skipped_urls == [urls[5]]
+    assert sorted(result.indexed_urls) == sorted(set(urls) - {urls[5]})
+    assert result.documents_written == 11
+    assert [count for name, count in calls if name == "embed"] == [5, 5, 1]
+    written = [doc for call in writer.run.call_args_list for doc in call.kwargs["documents"]]
+    assert {doc.meta["url"] for doc in written} == set(urls) - {urls[5]}
+    assert all(call.kwargs["metadata_context"] == context for call in writer.run.call_args_list)
+    assert len(result.metadata_preview) == 3
+
+
+def test_batch_failure_skips_every_page_in_the_batch():
+    urls = ["https://a.example/1", "https://a.example/2"]
+    converter = MagicMock()
+    converter.run.side_effect = lambda sources: {"documents": [Document(content="page")]}
+    embedder = MagicMock()
+    embedder.run.side_effect = RuntimeError("model unavailable")
+
+    ingestor = WebPageIngestor(
+        document_store=MagicMock(),
+        client_factory=lambda: FakeClient(fail=set()),
+        converter=converter,
+        cleaner=_passthrough("clean", []),
+        splitter=_passthrough("split", []),
+        embedder=embedder,
+        writer=MagicMock(),
+    )
+
+    result = asyncio.run(ingestor.ingest(urls, {"workspace_id": "ws", "ingestion_id": "ing", "source": "web"}))
+
+    assert result.indexed_urls == []
+    assert sorted(result.skipped_urls) == urls
+    assert result.documents_written == 0